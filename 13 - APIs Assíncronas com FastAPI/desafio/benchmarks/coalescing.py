@@ -0,0 +1,92 @@
+"""Fan-in on one hot statement page: database statements and latency with read coalescing off and on.
+
+Each wave sends ``--fan-in`` identical ``GET /accounts/1/transactions?limit=20`` at once, as clients
+do after a push notification. Statements are read from the ``http_request_db_queries`` histogram, so
+they are the ones the requests actually issued.
+
+Usage (from the ``desafio`` directory):
+
+    DATABASE_URL=sqlite:///./bench.db python -m benchmarks.coalescing --fan-in 1000 --waves 5 --ttl 0.5
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+import httpx
+
+from benchmarks.load import asgi_client, create_account, login
+from src.coalescing import coalescer
+from src.config import settings
+from src.database import engine, metadata
+from src.instrumentation import request_queries
+
+ROUTE = "/accounts/{id}/transactions"
+MODES = {
+    "off": {"read_coalescing_enabled": False},
+    "in-flight": {"read_coalescing_enabled": True},
+    "ttl": {"read_coalescing_enabled": True},
+}
+
+
+async def wave(client: httpx.AsyncClient, url: str, headers: dict[str, str], fan_in: int) -> list[float]:
+    async def get() -> float:
+        started = time.perf_counter()
+        response = await client.get(url, params={"limit": 20}, headers=headers)
+        response.raise_for_status()
+        return time.perf_counter() - started
+
+    return await asyncio.gather(*[get() for _ in range(fan_in)])
+
+
+async def run(fan_in: int, waves: int, ttl: float) -> dict:
+    metadata.drop_all(engine)
+    metadata.create_all(engine)
+    results = {}
+
+    async with asgi_client(fan_in) as client:
+        headers = await login(client)
+        account_id = await create_account(client, headers, balance=1)
+        items = [{"account_id": account_id, "type": "deposit", "amount": 1}] * 100
+        await client.post("/transactions/batch", json=items, headers=headers)
+        url = f"/accounts/{account_id}/transactions"
+
+        for mode, overrides in MODES.items():
+            for name, value in overrides.items():
+                setattr(settings, name, value)
+            coalescer.ttl = ttl if mode == "ttl" else 0.0
+            coalescer.clear()
+
+            statements = request_queries.sum(route=ROUTE)
+            latencies: list[float] = []
+            started = time.perf_counter()
+            for _ in range(waves):
+                latencies += await wave(client, url, headers, fan_in)
+            elapsed = time.perf_counter() - started
+
+            cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+            results[mode] = {
+                "requests": len(latencies),
+                "db_statements": int(request_queries.sum(route=ROUTE) - statements),
+                "throughput_per_second": round(len(latencies) / elapsed, 1),
+                "p50_ms": round(cuts[49] * 1000, 3),
+                "p95_ms": round(cuts[94] * 1000, 3),
+            }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fan-in", type=int, default=1000)
+    parser.add_argument("--waves", type=int, default=5)
+    parser.add_argument("--ttl", type=float, default=0.5, help="result TTL for the ttl mode, in seconds")
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args.fan_in, args.waves, args.ttl))
+    print(json.dumps({"fan_in": args.fan_in, "waves": args.waves, "ttl": args.ttl, "modes": result}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Cost of authenticating one request through JWTBearer, with the verified-token cache on and off.
+
+Usage (from the ``desafio`` directory):
+
+    DATABASE_URL=sqlite:///./bank.db python -m benchmarks.jwt_bearer --calls 100000
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from starlette.requests import Request
+
+from src.security import JWTBearer, sign_jwt, token_cache
+
+
+async def measure(bearer: JWTBearer, request: Request, calls: int) -> float:
+    started = time.perf_counter()
+    for _ in range(calls):
+        await bearer(request)
+    return round((time.perf_counter() - started) / calls * 1_000_000, 3)
+
+
+async def run(calls: int) -> dict:
+    token = sign_jwt(user_id=1)["access_token"]
+    request = Request({"type": "http", "headers": [(b"authorization", f"Bearer {token}".encode())]})
+    bearer = JWTBearer()
+    maxsize = token_cache.maxsize
+
+    token_cache.maxsize = 0
+    uncached = await measure(bearer, request, calls)
+    token_cache.maxsize = maxsize or 1
+    cached = await measure(bearer, request, calls)
+    token_cache.maxsize = maxsize
+
+    return {
+        "calls": calls,
+        "uncached_us_per_call": uncached,
+        "cached_us_per_call": cached,
+        "speedup": round(uncached / cached, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=20_000)
+    args = parser.parse_args()
+
+    print(json.dumps(asyncio.run(run(args.calls)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
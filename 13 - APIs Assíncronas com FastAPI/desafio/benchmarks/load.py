@@ -0,0 +1,261 @@
+"""Load scenarios against the transactions API, reported as throughput and latency percentiles.
+
+Requests go through ``httpx.ASGITransport`` by default, or through a real socket with ``--uvicorn``.
+Every scenario is seeded, so two runs against the same build issue the same requests.
+
+Usage (from the ``desafio`` directory):
+
+    DATABASE_URL=sqlite:///./bench.db python -m benchmarks.load --save-baseline benchmarks/baseline.json
+    DATABASE_URL=sqlite:///./bench.db python -m benchmarks.load --baseline benchmarks/baseline.json
+
+With ``--baseline`` the exit status is 1 when any scenario's p95 latency grew, or its throughput
+dropped, by more than ``--tolerance``.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import socket
+import statistics
+import sys
+import time
+from collections import Counter
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import httpx
+
+from src.database import database, engine, metadata
+from src.main import app
+
+Send = Callable[[httpx.AsyncClient, int], Awaitable[httpx.Response]]
+
+BATCH_SIZE = 1000
+PAGE_SIZE = 50
+
+
+async def login(client: httpx.AsyncClient, user_id: int = 1) -> dict[str, str]:
+    response = await client.post("/auth/login", json={"user_id": user_id})
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+async def create_account(client: httpx.AsyncClient, headers: dict[str, str], balance: float) -> int:
+    response = await client.post("/accounts/", json={"user_id": 1, "balance": balance}, headers=headers)
+    response.raise_for_status()
+    return response.json()["id"]
+
+
+async def login_storm(client: httpx.AsyncClient, rng: random.Random, requests: int) -> Send:
+    user_ids = [rng.randint(1, 1000) for _ in range(requests)]
+
+    async def send(client: httpx.AsyncClient, index: int) -> httpx.Response:
+        return await client.post("/auth/login", json={"user_id": user_ids[index]})
+
+    return send
+
+
+async def hot_account(client: httpx.AsyncClient, rng: random.Random, requests: int) -> Send:
+    headers = await login(client)
+    # Enough balance for half of the withdrawals, so the run covers accepted and rejected writes.
+    account_id = await create_account(client, headers, balance=requests / 2)
+    data = {"account_id": account_id, "type": "withdrawal", "amount": 1}
+
+    async def send(client: httpx.AsyncClient, index: int) -> httpx.Response:
+        return await client.post("/transactions/", json=data, headers=headers)
+
+    return send
+
+
+async def mixed(client: httpx.AsyncClient, rng: random.Random, requests: int) -> Send:
+    headers = await login(client)
+    account_ids = [await create_account(client, headers, balance=1000) for _ in range(20)]
+    at = (datetime.now(timezone.utc) + timedelta(hours=1)).isoformat()
+    operations = []
+    for _ in range(requests):
+        account_id, roll = rng.choice(account_ids), rng.random()
+        if roll < 0.5:
+            operations.append(("GET", f"/accounts/{account_id}/transactions", {"limit": PAGE_SIZE}, None))
+        elif roll < 0.8:
+            operations.append(("GET", f"/accounts/{account_id}/balance", {"at": at}, None))
+        else:
+            data = {
+                "account_id": account_id,
+                "type": rng.choice(["deposit", "withdrawal"]),
+                "amount": rng.randint(1, 20),
+            }
+            operations.append(("POST", "/transactions/", None, data))
+
+    async def send(client: httpx.AsyncClient, index: int) -> httpx.Response:
+        method, url, params, data = operations[index]
+        return await client.request(method, url, params=params, json=data, headers=headers)
+
+    return send
+
+
+async def deep_pagination(client: httpx.AsyncClient, rng: random.Random, requests: int, rows: int) -> Send:
+    headers = await login(client)
+    account_id = await create_account(client, headers, balance=1)
+    for start in range(0, rows, BATCH_SIZE):
+        items = [{"account_id": account_id, "type": "deposit", "amount": 1}] * min(BATCH_SIZE, rows - start)
+        await client.post("/transactions/batch", json=items, headers=headers)
+
+    # Walk the history once to collect the cursors, then request pages from the back half of it.
+    url = f"/accounts/{account_id}/transactions"
+    cursors = []
+    response = await client.get(url, params={"limit": PAGE_SIZE}, headers=headers)
+    while "X-Next-Cursor" in response.headers:
+        cursors.append(response.headers["X-Next-Cursor"])
+        response = await client.get(url, params={"limit": PAGE_SIZE, "cursor": cursors[-1]}, headers=headers)
+    deep = cursors[len(cursors) // 2 :] or [None]
+    picks = [rng.choice(deep) for _ in range(requests)]
+
+    async def send(client: httpx.AsyncClient, index: int) -> httpx.Response:
+        params = {"limit": PAGE_SIZE, **({"cursor": picks[index]} if picks[index] else {})}
+        return await client.get(url, params=params, headers=headers)
+
+    return send
+
+
+SCENARIOS = {
+    "login-storm": login_storm,
+    "hot-account": hot_account,
+    "mixed": mixed,
+    "deep-pagination": deep_pagination,
+}
+
+
+def percentile(cuts: list[float], value: int) -> float:
+    return round(cuts[value - 1] * 1000, 3)
+
+
+async def drive(client: httpx.AsyncClient, send: Send, requests: int, concurrency: int) -> dict:
+    latencies: list[float] = []
+    statuses: Counter[str] = Counter()
+    indexes = iter(range(requests))
+
+    async def worker() -> None:
+        # Workers share one iterator, so each request index is sent exactly once.
+        for index in indexes:
+            started = time.perf_counter()
+            try:
+                response = await send(client, index)
+                statuses[str(response.status_code)] += 1
+            except httpx.HTTPError:
+                statuses["error"] += 1
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    elapsed = time.perf_counter() - started
+
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "elapsed_seconds": round(elapsed, 3),
+        "throughput_per_second": round(requests / elapsed, 1),
+        "p50_ms": percentile(cuts, 50),
+        "p95_ms": percentile(cuts, 95),
+        "p99_ms": percentile(cuts, 99),
+        "statuses": dict(sorted(statuses.items())),
+    }
+
+
+@asynccontextmanager
+async def asgi_client(concurrency: int) -> AsyncIterator[httpx.AsyncClient]:
+    # ASGITransport does not run the lifespan, so the connection is managed here.
+    await database.connect()
+    try:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            yield client
+    finally:
+        await database.disconnect()
+
+
+@asynccontextmanager
+async def uvicorn_client(concurrency: int) -> AsyncIterator[httpx.AsyncClient]:
+    import uvicorn
+
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        if task.done():
+            task.result()
+        await asyncio.sleep(0.01)
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    try:
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", limits=limits) as client:
+            yield client
+    finally:
+        server.should_exit = True
+        await task
+
+
+async def run(scenarios: list[str], requests: int, concurrency: int, rows: int, seed: int, use_uvicorn: bool) -> dict:
+    metadata.create_all(engine)
+    client_factory = uvicorn_client if use_uvicorn else asgi_client
+    results = {}
+
+    async with client_factory(concurrency) as client:
+        for name in scenarios:
+            rng = random.Random(seed)
+            if name == "deep-pagination":
+                send = await deep_pagination(client, rng, requests, rows)
+            else:
+                send = await SCENARIOS[name](client, rng, requests)
+            results[name] = await drive(client, send, requests, concurrency)
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        before = baseline[name]
+        if result["p95_ms"] > before["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {before['p95_ms']}ms -> {result['p95_ms']}ms")
+        if result["throughput_per_second"] < before["throughput_per_second"] * (1 - tolerance):
+            regressions.append(
+                f"{name}: throughput {before['throughput_per_second']}/s -> {result['throughput_per_second']}/s"
+            )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenario", choices=[*SCENARIOS, "all"], default="all")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--rows", type=int, default=20_000, help="history length for deep-pagination")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--uvicorn", action="store_true", help="serve the app on a local socket")
+    parser.add_argument("--baseline", type=Path, help="compare against results saved with --save-baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--save-baseline", type=Path)
+    args = parser.parse_args()
+
+    scenarios = list(SCENARIOS) if args.scenario == "all" else [args.scenario]
+    results = asyncio.run(run(scenarios, args.requests, args.concurrency, args.rows, args.seed, args.uvicorn))
+    report = {"transport": "uvicorn" if args.uvicorn else "asgi", "scenarios": results}
+
+    if args.baseline:
+        report["regressions"] = compare(results, json.loads(args.baseline.read_text())["scenarios"], args.tolerance)
+    if args.save_baseline:
+        args.save_baseline.write_text(json.dumps(report, indent=2) + "\n")
+
+    print(json.dumps(report, indent=2))
+    if report.get("regressions"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
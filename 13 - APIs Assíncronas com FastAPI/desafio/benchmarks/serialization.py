@@ -0,0 +1,95 @@
+"""Cost of serializing one page of account transactions: FastAPI's response_model path vs ListEncoder.
+
+Usage (from the ``desafio`` directory):
+
+    DATABASE_URL=sqlite:///./bench.db python -m benchmarks.serialization --rows 1000 --repeat 200
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+
+from src.controllers.account import read_account_transactions
+from src.database import database, engine, metadata
+from src.main import app
+from src.models.account import accounts
+from src.models.transaction import transactions
+from src.services.transaction import TransactionService
+from src.views.account import transaction_list_encoder
+
+
+def seed(rows: int) -> None:
+    metadata.drop_all(engine)
+    metadata.create_all(engine)
+    started_at = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+    with engine.begin() as connection:
+        connection.execute(accounts.insert(), [{"user_id": 1, "balance": 0}])
+        connection.execute(
+            transactions.insert(),
+            [
+                {
+                    "account_id": 1,
+                    "type": "deposit",
+                    "amount": position + 0.5,
+                    "timestamp": started_at + timedelta(seconds=position),
+                }
+                for position in range(rows)
+            ],
+        )
+
+
+async def standard(field, rows) -> bytes:
+    content = await serialize_response(field=field, response_content=rows)
+    return JSONResponse(content).body
+
+
+async def fast(field, rows) -> bytes:
+    return transaction_list_encoder.encode(rows)
+
+
+async def measure(encode, field, rows, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await encode(field, rows)
+        timings.append(time.perf_counter() - started)
+    return round(statistics.median(timings) * 1000, 3)
+
+
+async def run(rows: int, repeat: int) -> dict:
+    seed(rows)
+    await database.connect()
+    page = await TransactionService().read_all(account_id=1, limit=rows)
+    await database.disconnect()
+
+    route = next(route for route in app.routes if getattr(route, "endpoint", None) is read_account_transactions)
+    field = route.response_field
+
+    return {
+        "rows": len(page),
+        "standard_ms": await measure(standard, field, page, repeat),
+        "fast_ms": await measure(fast, field, page, repeat),
+        "identical": json.loads(await standard(field, page)) == json.loads(await fast(field, page)),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args.rows, args.repeat))
+    result["speedup"] = round(result["standard_ms"] / result["fast_ms"], 1)
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
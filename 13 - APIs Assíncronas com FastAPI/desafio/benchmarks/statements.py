@@ -0,0 +1,93 @@
+"""CPU spent turning a list query into SQL: building and compiling it per call vs the precompiled statements.
+
+Only the work done before the query reaches the driver is timed (``databases`` compiles every query it
+is given), so no rows are needed and the figures do not depend on the database size.
+
+Usage (from the ``desafio`` directory):
+
+    DATABASE_URL=sqlite:///./bench.db python -m benchmarks.statements --repeat 5000
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+
+import sqlalchemy as sa
+
+from src.database import database
+from src.models.account import accounts
+from src.models.transaction_archive import ledger
+from src.services.account import accounts_page
+from src.services.transaction import _after, transactions_page
+
+AFTER = (datetime(2024, 1, 1, tzinfo=timezone.utc), 500)
+
+
+def built_accounts_page() -> sa.Select:
+    return accounts.select().where(accounts.c.id > 100).order_by(accounts.c.id).where(accounts.c.user_id == 1).limit(50)
+
+
+def built_transactions_page(after: tuple[datetime, int] | None = None) -> sa.Select:
+    query = sa.select(ledger).where(ledger.c.account_id == 1).order_by(ledger.c.timestamp, ledger.c.id).limit(50)
+    if after:
+        return query.where(_after(sa.literal(after[0], ledger.c.timestamp.type), sa.literal(after[1])))
+    return query.offset(100)
+
+
+CASES: dict[str, tuple[Callable[[], sa.ClauseElement], Callable[[], sa.ClauseElement]]] = {
+    "accounts-page": (built_accounts_page, lambda: accounts_page(True, limit=50, after=100, user_id=1)),
+    "transactions-page": (
+        built_transactions_page,
+        lambda: transactions_page(False, False, False, account_id=1, limit=50, skip=100),
+    ),
+    "transactions-keyset-page": (
+        lambda: built_transactions_page(AFTER),
+        lambda: transactions_page(
+            False, False, True, account_id=1, limit=50, after_timestamp=AFTER[0], after_id=AFTER[1]
+        ),
+    ),
+}
+
+
+def measure(query: Callable[[], sa.ClauseElement], compile: Callable, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        compile(query())
+        timings.append(time.perf_counter() - started)
+    return round(statistics.median(timings) * 1_000_000, 1)
+
+
+async def run(repeat: int) -> dict:
+    await database.connect()
+    try:
+        async with database.connection() as connection:
+            compile = connection._connection._compile
+            results = {}
+            for name, (built, precompiled) in CASES.items():
+                built_us, precompiled_us = measure(built, compile, repeat), measure(precompiled, compile, repeat)
+                results[name] = {
+                    "built_us": built_us,
+                    "precompiled_us": precompiled_us,
+                    "speedup": round(built_us / precompiled_us, 1),
+                    "same_sql": compile(built())[0] == compile(precompiled())[0],
+                }
+    finally:
+        await database.disconnect()
+    return {"dialect": database.url.dialect, "repeat": repeat, "queries": results}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(json.dumps(asyncio.run(run(args.repeat)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -17,6 +17,10 @@ if config.config_file_name is not None:
 from src.database import engine, metadata  # noqa
 from src.models.transaction import transactions  # noqa
 from src.models.account import accounts  # noqa
+from src.models.balance_checkpoint import balance_checkpoints  # noqa
+from src.models.account_stats import account_stats  # noqa
+from src.models.transaction_archive import transactions_archive  # noqa
+from src.models.ledger_reconciliation import ledger_reconciliation  # noqa
 
 target_metadata = metadata
 
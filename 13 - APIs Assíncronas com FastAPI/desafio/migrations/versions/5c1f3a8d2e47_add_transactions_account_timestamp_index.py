@@ -0,0 +1,32 @@
+"""Add transactions account timestamp index
+
+Revision ID: 5c1f3a8d2e47
+Revises: 09f7da264602
+Create Date: 2024-05-02 10:12:31.118240
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5c1f3a8d2e47"
+down_revision: Union[str, None] = "09f7da264602"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_transactions_account_id_timestamp_id",
+        "transactions",
+        ["account_id", "timestamp", "id"],
+        unique=False,
+        postgresql_include=["type", "amount"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_transactions_account_id_timestamp_id", table_name="transactions")
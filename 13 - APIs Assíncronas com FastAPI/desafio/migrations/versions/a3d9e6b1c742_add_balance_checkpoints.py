@@ -0,0 +1,100 @@
+"""Add balance checkpoints
+
+Revision ID: a3d9e6b1c742
+Revises: 5c1f3a8d2e47
+Create Date: 2024-05-06 14:41:08.530912
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a3d9e6b1c742"
+down_revision: Union[str, None] = "5c1f3a8d2e47"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Matches the default of Settings.balance_checkpoint_interval at the time of this revision.
+CHECKPOINT_INTERVAL = 100
+
+
+def upgrade() -> None:
+    op.add_column("accounts", sa.Column("transaction_count", sa.Integer(), server_default="0", nullable=False))
+    op.create_table(
+        "balance_checkpoints",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("account_id", sa.Integer(), nullable=False),
+        sa.Column("transaction_id", sa.Integer(), nullable=False),
+        sa.Column("timestamp", sa.TIMESTAMP(timezone=True), nullable=False),
+        sa.Column("balance", sa.Numeric(precision=10, scale=2), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["account_id"],
+            ["accounts.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_balance_checkpoints_account_id_timestamp",
+        "balance_checkpoints",
+        ["account_id", "timestamp", "transaction_id"],
+        unique=False,
+    )
+
+    op.execute(
+        """
+        UPDATE accounts
+        SET transaction_count = (SELECT count(*) FROM transactions WHERE transactions.account_id = accounts.id)
+        """
+    )
+    # Opening balance = current balance minus the whole ledger.
+    op.execute(
+        """
+        INSERT INTO balance_checkpoints (account_id, transaction_id, timestamp, balance)
+        SELECT
+            accounts.id,
+            0,
+            COALESCE(
+                accounts.created_at,
+                (SELECT min(timestamp) FROM transactions WHERE transactions.account_id = accounts.id),
+                CURRENT_TIMESTAMP
+            ),
+            accounts.balance - COALESCE(
+                (
+                    SELECT sum(CASE WHEN type = 'WITHDRAWAL' THEN -amount ELSE amount END)
+                    FROM transactions
+                    WHERE transactions.account_id = accounts.id
+                ),
+                0
+            )
+        FROM accounts
+        """
+    )
+    op.execute(
+        f"""
+        INSERT INTO balance_checkpoints (account_id, transaction_id, timestamp, balance)
+        SELECT ledger.account_id, ledger.id, ledger.timestamp, opening.balance + ledger.running_total
+        FROM (
+            SELECT
+                account_id,
+                id,
+                timestamp,
+                row_number() OVER (PARTITION BY account_id ORDER BY timestamp, id) AS position,
+                sum(CASE WHEN type = 'WITHDRAWAL' THEN -amount ELSE amount END)
+                    OVER (PARTITION BY account_id ORDER BY timestamp, id) AS running_total
+            FROM transactions
+        ) AS ledger
+        JOIN balance_checkpoints AS opening
+            ON opening.account_id = ledger.account_id AND opening.transaction_id = 0
+        WHERE ledger.position % {CHECKPOINT_INTERVAL} = 0
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_balance_checkpoints_account_id_timestamp", table_name="balance_checkpoints")
+    op.drop_table("balance_checkpoints")
+    op.drop_column("accounts", "transaction_count")
@@ -0,0 +1,51 @@
+"""Add ledger reconciliation
+
+Revision ID: b6d1f8e3a057
+Revises: f2c8d6a4b1e9
+Create Date: 2024-06-10 11:18:54.370629
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b6d1f8e3a057"
+down_revision: Union[str, None] = "f2c8d6a4b1e9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ledger_reconciliation",
+        sa.Column("account_id", sa.Integer(), nullable=False),
+        sa.Column("transaction_id", sa.Integer(), nullable=False),
+        sa.Column("timestamp", sa.TIMESTAMP(timezone=True), nullable=False),
+        sa.Column("transaction_count", sa.Integer(), nullable=False),
+        sa.Column("balance", sa.Numeric(precision=14, scale=2), nullable=False),
+        sa.Column("drift", sa.Numeric(precision=14, scale=2), server_default="0", nullable=False),
+        sa.Column("count_drift", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("checked_at", sa.TIMESTAMP(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["account_id"],
+            ["accounts.id"],
+        ),
+        sa.PrimaryKeyConstraint("account_id"),
+    )
+    op.create_index(
+        "ix_ledger_reconciliation_drifted",
+        "ledger_reconciliation",
+        ["account_id"],
+        unique=False,
+        postgresql_where=sa.text("drift != 0 OR count_drift != 0"),
+        sqlite_where=sa.text("drift != 0 OR count_drift != 0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_ledger_reconciliation_drifted", table_name="ledger_reconciliation")
+    op.drop_table("ledger_reconciliation")
@@ -0,0 +1,56 @@
+"""Add account stats
+
+Revision ID: c8e2f4a6b913
+Revises: a3d9e6b1c742
+Create Date: 2024-05-13 10:22:47.184305
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c8e2f4a6b913"
+down_revision: Union[str, None] = "a3d9e6b1c742"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "account_stats",
+        sa.Column("account_id", sa.Integer(), nullable=False),
+        sa.Column("deposit_total", sa.Numeric(precision=14, scale=2), server_default="0", nullable=False),
+        sa.Column("withdrawal_total", sa.Numeric(precision=14, scale=2), server_default="0", nullable=False),
+        sa.Column("deposit_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("withdrawal_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("last_activity_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["account_id"],
+            ["accounts.id"],
+        ),
+        sa.PrimaryKeyConstraint("account_id"),
+    )
+
+    op.execute(
+        """
+        INSERT INTO account_stats
+            (account_id, deposit_total, withdrawal_total, deposit_count, withdrawal_count, last_activity_at)
+        SELECT
+            account_id,
+            COALESCE(SUM(CASE WHEN type = 'DEPOSIT' THEN amount END), 0),
+            COALESCE(SUM(CASE WHEN type = 'WITHDRAWAL' THEN amount END), 0),
+            COUNT(CASE WHEN type = 'DEPOSIT' THEN 1 END),
+            COUNT(CASE WHEN type = 'WITHDRAWAL' THEN 1 END),
+            MAX(timestamp)
+        FROM transactions
+        GROUP BY account_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("account_stats")
@@ -0,0 +1,51 @@
+"""Add transactions archive
+
+Revision ID: e1a5c3f7b284
+Revises: c8e2f4a6b913
+Create Date: 2024-05-27 16:05:43.902117
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e1a5c3f7b284"
+down_revision: Union[str, None] = "c8e2f4a6b913"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "transactions_archive",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("account_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "type",
+            postgresql.ENUM("DEPOSIT", "WITHDRAWAL", name="transaction_types", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("amount", sa.Numeric(precision=10, scale=2), nullable=False),
+        sa.Column("timestamp", sa.TIMESTAMP(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["account_id"],
+            ["accounts.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_transactions_archive_account_id_timestamp_id",
+        "transactions_archive",
+        ["account_id", "timestamp", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_transactions_archive_account_id_timestamp_id", table_name="transactions_archive")
+    op.drop_table("transactions_archive")
@@ -0,0 +1,40 @@
+"""Add daily withdrawal limits
+
+Revision ID: f2c8d6a4b1e9
+Revises: e1a5c3f7b284
+Create Date: 2024-06-03 09:41:12.508214
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f2c8d6a4b1e9"
+down_revision: Union[str, None] = "e1a5c3f7b284"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("accounts", sa.Column("daily_withdrawal_count_limit", sa.Integer(), nullable=True))
+    op.add_column(
+        "accounts", sa.Column("daily_withdrawal_amount_limit", sa.Numeric(precision=10, scale=2), nullable=True)
+    )
+    op.add_column("accounts", sa.Column("withdrawal_day", sa.Date(), nullable=True))
+    op.add_column("accounts", sa.Column("withdrawal_day_count", sa.Integer(), server_default="0", nullable=False))
+    op.add_column(
+        "accounts",
+        sa.Column("withdrawal_day_total", sa.Numeric(precision=10, scale=2), server_default="0", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("accounts", "withdrawal_day_total")
+    op.drop_column("accounts", "withdrawal_day_count")
+    op.drop_column("accounts", "withdrawal_day")
+    op.drop_column("accounts", "daily_withdrawal_amount_limit")
+    op.drop_column("accounts", "daily_withdrawal_count_limit")
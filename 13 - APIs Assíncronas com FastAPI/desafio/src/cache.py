@@ -0,0 +1,191 @@
+import json
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any
+
+from src.config import settings
+from src.metrics import Counter, Gauge, Histogram
+
+# (stored_at, value)
+Entry = tuple[float, Any]
+
+# Longest a read may take between reading a counter and storing what it loaded under it.
+COUNTER_GRACE_SECONDS = 60.0
+
+hit_age = Histogram(
+    "account_cache_hit_age_seconds",
+    "Age of account cache entries when served, i.e. how stale a hit can be.",
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+
+
+class Cache(ABC):
+    """Async key/value cache with a per-entry TTL, used for read paths that tolerate a short delay.
+
+    Values must be JSON serializable, so any backend can hold them. Counters version the keys of
+    other entries: they live outside the LRU, and expire only once unused for longer than any entry
+    stored under one of their values can live, so starting over from 0 cannot revive a stale entry.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self.counter_ttl = ttl + COUNTER_GRACE_SECONDS
+        self.hits = 0
+        self.misses = 0
+
+    @abstractmethod
+    async def get_many(self, keys: list[str]) -> dict[str, Entry]: ...
+
+    @abstractmethod
+    async def set_many(self, values: dict[str, Any]) -> None: ...
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None: ...
+
+    @abstractmethod
+    async def counters(self, keys: list[str]) -> list[int]:
+        """Current values, 0 for counters never incremented; reading one keeps it from expiring."""
+
+    @abstractmethod
+    async def incr(self, *keys: str) -> None: ...
+
+    def _record(self, found: dict[str, Entry], requested: int) -> None:
+        now = time.time()
+        for stored_at, _ in found.values():
+            hit_age.observe(now - stored_at)
+        self.hits += len(found)
+        self.misses += requested - len(found)
+
+
+class MemoryCache(Cache):
+    """In-process LRU. Each worker holds its own copy, so writes seen by one worker reach the others
+    only through the TTL; ``maxsize=0`` disables it."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        super().__init__(ttl)
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, tuple[float, float, Any]] = OrderedDict()
+        # key -> (value, expires_at), the next to expire first
+        self._counters: OrderedDict[str, tuple[int, float]] = OrderedDict()
+
+    async def get_many(self, keys: list[str]) -> dict[str, Entry]:
+        now = time.monotonic()
+        found = {}
+        for key in keys:
+            entry = self._entries.get(key)
+            if entry is None:
+                continue
+            expires_at, stored_at, value = entry
+            if expires_at < now:
+                del self._entries[key]
+                continue
+            self._entries.move_to_end(key)
+            found[key] = (stored_at, value)
+        self._record(found, len(keys))
+        return found
+
+    async def set_many(self, values: dict[str, Any]) -> None:
+        if not self.maxsize:
+            return
+
+        expires_at, stored_at = time.monotonic() + self.ttl, time.time()
+        for key, value in values.items():
+            self._entries[key] = (expires_at, stored_at, value)
+            self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+    async def counters(self, keys: list[str]) -> list[int]:
+        return [self.__touch_counter(key, 0) for key in keys]
+
+    async def incr(self, *keys: str) -> None:
+        for key in keys:
+            self.__touch_counter(key, 1)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._counters.clear()
+
+    def __touch_counter(self, key: str, amount: int) -> int:
+        now = time.monotonic()
+        while self._counters and next(iter(self._counters.values()))[1] < now:
+            self._counters.popitem(last=False)
+        value = self._counters.get(key, (0, now))[0] + amount
+        if value:
+            self._counters[key] = (value, now + self.counter_ttl)
+            self._counters.move_to_end(key)
+        return value
+
+
+class RedisCache(Cache):
+    """Shared cache for deployments with several workers. Needs the optional ``redis`` package."""
+
+    def __init__(self, url: str, ttl: float) -> None:
+        from redis.asyncio import Redis
+
+        super().__init__(ttl)
+        self._client = Redis.from_url(url)
+
+    async def get_many(self, keys: list[str]) -> dict[str, Entry]:
+        found = {}
+        for key, raw in zip(keys, await self._client.mget(keys)):
+            if raw is not None:
+                stored_at, value = json.loads(raw)
+                found[key] = (stored_at, value)
+        self._record(found, len(keys))
+        return found
+
+    async def set_many(self, values: dict[str, Any]) -> None:
+        stored_at = time.time()
+        async with self._client.pipeline(transaction=False) as pipeline:
+            for key, value in values.items():
+                pipeline.set(key, json.dumps([stored_at, value]), px=int(self.ttl * 1000))
+            await pipeline.execute()
+
+    async def delete(self, *keys: str) -> None:
+        await self._client.delete(*keys)
+
+    async def counters(self, keys: list[str]) -> list[int]:
+        async with self._client.pipeline(transaction=False) as pipeline:
+            for key in keys:
+                pipeline.getex(key, px=int(self.counter_ttl * 1000))
+            return [int(value or 0) for value in await pipeline.execute()]
+
+    async def incr(self, *keys: str) -> None:
+        async with self._client.pipeline(transaction=False) as pipeline:
+            for key in keys:
+                pipeline.incr(key)
+                pipeline.pexpire(key, int(self.counter_ttl * 1000))
+            await pipeline.execute()
+
+
+def create_cache(backend: str, url: str | None, maxsize: int, ttl: float) -> Cache:
+    if backend == "redis":
+        return RedisCache(url, ttl)
+    return MemoryCache(maxsize=0 if backend == "none" else maxsize, ttl=ttl)
+
+
+account_cache = create_cache(
+    settings.account_cache_backend, settings.account_cache_url, settings.account_cache_size, settings.account_cache_ttl
+)
+
+Counter(
+    "account_cache_hits_total",
+    "Account lookups served from the cache.",
+    collect=lambda: {(): account_cache.hits},
+)
+Counter(
+    "account_cache_misses_total",
+    "Account lookups that went to the database.",
+    collect=lambda: {(): account_cache.misses},
+)
+Gauge(
+    "account_cache_hit_ratio",
+    "Share of account lookups served from the cache since start.",
+    collect=lambda: {(): account_cache.hits / ((account_cache.hits + account_cache.misses) or 1)},
+)
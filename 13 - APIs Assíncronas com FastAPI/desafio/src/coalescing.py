@@ -0,0 +1,84 @@
+import asyncio
+import functools
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+from src.config import settings
+from src.metrics import Counter
+
+T = TypeVar("T")
+
+
+class Coalescer:
+    """Single-flight for reads: concurrent calls with the same key share one in-flight call and its result.
+
+    The call runs in its own task, so a caller that goes away does not cancel it for the others. With a
+    ``ttl`` the result is also served to later calls for that long; failures are never kept. Callers get
+    the same object, so results must not be mutated.
+    """
+
+    def __init__(self, ttl: float, maxsize: int) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.calls = {"leader": 0, "joined": 0, "cached": 0}
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+        self._results: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    async def run(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        entry = self._results.get(key)
+        if entry is not None:
+            expires_at, result = entry
+            if expires_at >= time.monotonic():
+                self.calls["cached"] += 1
+                return result
+            del self._results[key]
+
+        task = self._inflight.get(key)
+        if task is None:
+            self.calls["leader"] += 1
+            task = self._inflight[key] = asyncio.ensure_future(call())
+            task.add_done_callback(functools.partial(self.__done, key))
+        else:
+            self.calls["joined"] += 1
+        return await asyncio.shield(task)
+
+    def clear(self) -> None:
+        self._results.clear()
+
+    def __done(self, key: Hashable, task: asyncio.Task) -> None:
+        del self._inflight[key]
+        if not self.ttl or not self.maxsize or task.cancelled() or task.exception() is not None:
+            return
+        self._results[key] = (time.monotonic() + self.ttl, task.result())
+        while len(self._results) > self.maxsize:
+            self._results.popitem(last=False)
+
+
+coalescer = Coalescer(ttl=settings.read_coalescing_ttl, maxsize=settings.read_coalescing_size)
+
+
+def coalesced(method: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    """Routes a read service method through ``coalescer`` when read coalescing is enabled.
+
+    The key is the method and its arguments, without ``self``: services are stateless, so any instance
+    returns the same result. Arguments must be hashable.
+    """
+
+    @functools.wraps(method)
+    async def wrapper(self, *args: Any, **kwargs: Any) -> T:
+        if not settings.read_coalescing_enabled:
+            return await method(self, *args, **kwargs)
+        key = (method.__qualname__, args, tuple(sorted(kwargs.items())))
+        return await coalescer.run(key, lambda: method(self, *args, **kwargs))
+
+    return wrapper
+
+
+Counter(
+    "read_coalescing_calls_total",
+    "Coalesced reads by outcome: leader ran the query, joined shared one in flight, cached reused a result.",
+    labels=["outcome"],
+    collect=lambda: {(outcome,): count for outcome, count in coalescer.calls.items()},
+)
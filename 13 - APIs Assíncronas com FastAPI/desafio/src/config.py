@@ -1,3 +1,4 @@
+from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -6,6 +7,63 @@ class Settings(BaseSettings):
 
     database_url: str
     environment: str = "production"
+    db_pool_min_size: int = 5
+    db_pool_max_size: int = 20
+    db_pool_acquire_timeout: float = 10.0
+    db_pool_max_lifetime: float = 1800.0
+    # Prepared statements kept per connection; 0 disables them, as transaction-mode PgBouncer requires.
+    db_statement_cache_size: int = 100
+    warmup_enabled: bool = False
+    # Connections opened and used once while warming up; defaults to db_pool_min_size.
+    warmup_pool_size: int | None = None
+    jwt_cache_size: int = 10_000
+    rate_limit_enabled: bool = False
+    # Requests per second each user gets on every route, and how many can come in a burst.
+    rate_limit_rate: float = Field(10.0, gt=0)
+    rate_limit_burst: int = Field(20, ge=1)
+    # (rate, burst) by route, e.g. RATE_LIMIT_ROUTES='{"POST /transactions/": [5, 10]}'.
+    rate_limit_routes: dict[str, tuple[float, int]] = {}
+    rate_limit_backend: str = "memory"
+    rate_limit_url: str | None = None
+    rate_limit_size: int = 100_000
+    # Users allowed on the admin endpoints, e.g. ADMIN_USER_IDS='[1, 2]'.
+    admin_user_ids: list[int] = []
+    transaction_batch_max_size: int = 5000
+    balance_checkpoint_interval: int = 100
+    write_sequencing_enabled: bool = False
+    write_sequencing_shards: int = 64
+    write_sequencing_max_pending: int = 100
+    group_commit_enabled: bool = False
+    group_commit_window_ms: float = 2.0
+    group_commit_max_items: int = 100
+    account_cache_backend: str = "memory"
+    account_cache_url: str | None = None
+    account_cache_size: int = 10_000
+    account_cache_ttl: float = 5.0
+    fast_serialization_enabled: bool = False
+    # Set once python -m src.commands.partition_transactions has converted the table, so the model matches it.
+    transaction_partitioning_enabled: bool = False
+    transaction_partitions_ahead: int = 3
+    transaction_archive_horizon_days: int = 90
+    transaction_archive_batch_size: int = 1000
+    # Defaults for accounts without their own limits; None leaves withdrawals uncapped.
+    daily_withdrawal_count_limit: int | None = None
+    daily_withdrawal_amount_limit: float | None = None
+    read_coalescing_enabled: bool = False
+    # Seconds a coalesced result keeps being served after its query finished; 0 only shares calls in flight.
+    read_coalescing_ttl: float = 0.0
+    read_coalescing_size: int = 10_000
+    ledger_reconcile_batch_size: int = 1000
+    # Rows younger than this are compared but do not move the watermarks yet; must exceed the longest write.
+    ledger_reconcile_settle_seconds: float = 5.0
+
+    @field_validator("rate_limit_routes")
+    @classmethod
+    def check_rate_limit_routes(cls, routes: dict[str, tuple[float, int]]) -> dict[str, tuple[float, int]]:
+        for route, (rate, burst) in routes.items():
+            if rate <= 0 or burst < 1:
+                raise ValueError(f"{route}: the rate must be greater than 0 and the burst at least 1")
+        return routes
 
 
 settings = Settings()
@@ -1,20 +1,73 @@
-from fastapi import APIRouter, Depends, status
+from types import SimpleNamespace
+from typing import Annotated
 
-from src.schemas.account import AccountIn
-from src.security import login_required
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import AwareDatetime
+
+from src.config import settings
+from src.export import ACCOUNT_EXPORT_FIELDS, MEDIA_TYPES, SERIALIZERS, ExportFormat, account_values
+from src.pagination import decode_cursor, decode_id_cursor, encode_cursor, encode_id_cursor
+from src.ratelimit import rate_limited
+from src.schemas.account import AccountIn, WithdrawalLimitsIn
+from src.security import admin_required, get_current_user, is_admin, login_required
 from src.services.account import AccountService
+from src.services.account_stats import AccountStatsService
 from src.services.transaction import TransactionService
-from src.views.account import AccountOut, TransactionOut
+from src.views.account import (
+    AccountOut,
+    AccountSummaryOut,
+    BalanceOut,
+    StatementOut,
+    TransactionOut,
+    account_list_encoder,
+    transaction_list_encoder,
+)
 
-router = APIRouter(prefix="/accounts", dependencies=[Depends(login_required)])
+router = APIRouter(prefix="/accounts", dependencies=[Depends(login_required), Depends(rate_limited)])
 
 account_service = AccountService()
 tx_service = TransactionService()
+stats_service = AccountStatsService()
+
+
+async def account_access(
+    id: int, current_user: Annotated[dict[str, int], Depends(get_current_user)]
+) -> SimpleNamespace:
+    """Route dependency returning account ``id`` to its owner and to admins, and refusing anyone else."""
+    account = await account_service.read(id)
+    if account.user_id != current_user["user_id"] and not is_admin(current_user):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
+    return account
 
 
 @router.get("/", response_model=list[AccountOut])
-async def read_accounts(limit: int, skip: int = 0):
-    return await account_service.read_all(limit=limit, skip=skip)
+async def read_accounts(
+    limit: Annotated[int, Query(gt=0, le=1000)],
+    response: Response,
+    current_user: Annotated[dict[str, int], Depends(get_current_user)],
+    cursor: str | None = None,
+    skip: Annotated[int | None, Query(deprecated=True)] = None,
+):
+    # Offset paging was replaced by the cursor; refuse it rather than serve the first page again.
+    if skip is not None:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="'skip' is no longer supported, use 'cursor'."
+        )
+    try:
+        after = decode_id_cursor(cursor) if cursor else 0
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Invalid cursor.")
+
+    rows = await account_service.read_all(limit=limit, after=after, user_id=current_user["user_id"])
+    headers = {}
+    if rows and len(rows) == limit:
+        headers["X-Next-Cursor"] = encode_id_cursor(rows[-1].id)
+
+    if settings.fast_serialization_enabled:
+        return account_list_encoder.response(rows, headers=headers)
+    response.headers.update(headers)
+    return rows
 
 
 @router.post("/", status_code=status.HTTP_201_CREATED, response_model=AccountOut)
@@ -22,6 +75,83 @@ async def create_account(account: AccountIn):
     return await account_service.create(account)
 
 
-@router.get("/{id}/transactions", response_model=list[TransactionOut])
-async def read_account_transactions(id: int, limit: int, skip: int = 0):
-    return await tx_service.read_all(account_id=id, limit=limit, skip=skip)
+@router.get("/summaries", response_model=list[AccountSummaryOut])
+async def read_account_summaries(
+    ids: Annotated[list[int], Query(min_length=1, max_length=1000)],
+    current_user: Annotated[dict[str, int], Depends(get_current_user)],
+):
+    return await stats_service.read_many(ids, user_id=None if is_admin(current_user) else current_user["user_id"])
+
+
+@router.get("/all", response_class=StreamingResponse, dependencies=[Depends(admin_required)])
+async def export_accounts(format: ExportFormat = ExportFormat.NDJSON):
+    return StreamingResponse(
+        SERIALIZERS[format](account_service.iterate_all(), ACCOUNT_EXPORT_FIELDS, account_values),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="accounts.{format.value}"'},
+    )
+
+
+@router.get("/{id}", response_model=AccountOut)
+async def read_account(account: Annotated[SimpleNamespace, Depends(account_access)]):
+    return account
+
+
+@router.patch("/{id}/limits", response_model=AccountOut, dependencies=[Depends(account_access)])
+async def update_account_limits(id: int, limits: WithdrawalLimitsIn):
+    return await account_service.update_limits(id, limits)
+
+
+@router.get("/{id}/summary", response_model=AccountSummaryOut, dependencies=[Depends(account_access)])
+async def read_account_summary(id: int):
+    return await stats_service.read(id)
+
+
+@router.get("/{id}/transactions", response_model=list[TransactionOut], dependencies=[Depends(account_access)])
+async def read_account_transactions(
+    id: int,
+    limit: int,
+    response: Response,
+    skip: int = 0,
+    cursor: str | None = None,
+    start: Annotated[AwareDatetime | None, Query(alias="from")] = None,
+    end: Annotated[AwareDatetime | None, Query(alias="to")] = None,
+):
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Invalid cursor.")
+
+    rows = await tx_service.read_all(account_id=id, limit=limit, skip=skip, after=after, start=start, end=end)
+    headers = {}
+    if rows and len(rows) == limit:
+        headers["X-Next-Cursor"] = encode_cursor(rows[-1].timestamp, rows[-1].id)
+
+    if settings.fast_serialization_enabled:
+        return transaction_list_encoder.response(rows, headers=headers)
+    response.headers.update(headers)
+    return rows
+
+
+@router.get("/{id}/transactions/export", response_class=StreamingResponse, dependencies=[Depends(account_access)])
+async def export_account_transactions(id: int, format: ExportFormat = ExportFormat.NDJSON):
+    rows = await tx_service.iterate_all(account_id=id)
+    return StreamingResponse(
+        SERIALIZERS[format](rows),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="account-{id}-transactions.{format.value}"'},
+    )
+
+
+@router.get("/{id}/balance", response_model=BalanceOut, dependencies=[Depends(account_access)])
+async def read_account_balance(id: int, at: AwareDatetime):
+    return {"account_id": id, "at": at, "balance": await tx_service.read_balance(account_id=id, at=at)}
+
+
+@router.get("/{id}/statement", response_model=StatementOut, dependencies=[Depends(account_access)])
+async def read_account_statement(
+    id: int, start: Annotated[AwareDatetime, Query(alias="from")], end: Annotated[AwareDatetime, Query(alias="to")]
+):
+    if start > end:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="'from' must not be after 'to'.")
+    return await tx_service.read_statement(account_id=id, start=start, end=end)
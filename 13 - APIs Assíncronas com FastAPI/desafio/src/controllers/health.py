@@ -0,0 +1,14 @@
+from fastapi import APIRouter, HTTPException, status
+
+from src.warmup import warmup
+
+router = APIRouter()
+
+
+@router.get("/ready", include_in_schema=False)
+async def read_readiness():
+    if not warmup.ready:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Warming up.", headers={"Retry-After": "1"}
+        )
+    return {"status": "ready", "warmup_seconds": round(warmup.seconds, 3)}
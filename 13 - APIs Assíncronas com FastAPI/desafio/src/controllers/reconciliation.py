@@ -0,0 +1,16 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+
+from src.security import admin_required
+from src.services.ledger_reconciliation import LedgerReconciliationService
+from src.views.reconciliation import ReconciliationOut
+
+router = APIRouter(prefix="/reconciliation", dependencies=[Depends(admin_required)])
+
+service = LedgerReconciliationService()
+
+
+@router.get("/", response_model=ReconciliationOut)
+async def read_reconciliation(limit: Annotated[int, Query(gt=0, le=1000)] = 100):
+    return await service.read_drift(limit)
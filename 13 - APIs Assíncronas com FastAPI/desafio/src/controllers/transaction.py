@@ -1,15 +1,99 @@
-from fastapi import APIRouter, Depends, status
+import json
 
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from pydantic import ValidationError
+
+from src.config import settings
+from src.exceptions import AccountNotFoundError, BusinessError
+from src.ratelimit import rate_limited
 from src.schemas.transaction import TransactionIn
 from src.security import login_required
 from src.services.transaction import TransactionService
-from src.views.transaction import TransactionOut
+from src.views.transaction import TransactionBatchItemOut, TransactionOut
 
-router = APIRouter(prefix="/transactions", dependencies=[Depends(login_required)])
+router = APIRouter(prefix="/transactions", dependencies=[Depends(login_required), Depends(rate_limited)])
 
 service = TransactionService()
 
+NDJSON_MEDIA_TYPES = ("application/x-ndjson", "application/ndjson")
+
 
 @router.post("/", status_code=status.HTTP_201_CREATED, response_model=TransactionOut)
 async def create_transaction(transaction: TransactionIn):
     return await service.create(transaction)
+
+
+@router.post(
+    "/batch",
+    response_model=list[TransactionBatchItemOut],
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {"type": "array", "items": {"$ref": "#/components/schemas/TransactionIn"}},
+                },
+                "application/x-ndjson": {"schema": {"type": "string"}},
+            },
+        },
+    },
+)
+async def create_transactions_batch(request: Request):
+    payloads = await _read_batch_payloads(request)
+    if len(payloads) > settings.transaction_batch_max_size:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Batch exceeds {settings.transaction_batch_max_size} transactions.",
+        )
+
+    results: dict[int, TransactionBatchItemOut] = {}
+    valid: list[tuple[int, TransactionIn]] = []
+    for index, payload in enumerate(payloads):
+        try:
+            if isinstance(payload, bytes):
+                valid.append((index, TransactionIn.model_validate_json(payload)))
+            else:
+                valid.append((index, TransactionIn.model_validate(payload)))
+        except ValidationError as exc:
+            results[index] = TransactionBatchItemOut(
+                index=index,
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=exc.errors(include_url=False),
+            )
+
+    if valid:
+        created = await service.create_many([item for _, item in valid])
+        for (index, _), result in zip(valid, created):
+            results[index] = _batch_item_result(index, result)
+
+    return [results[index] for index in range(len(payloads))]
+
+
+async def _read_batch_payloads(request: Request) -> list:
+    body = await request.body()
+    media_type = request.headers.get("Content-Type", "").split(";")[0].strip()
+    if media_type in NDJSON_MEDIA_TYPES:
+        return [line for line in body.splitlines() if line.strip()]
+
+    try:
+        payloads = json.loads(body)
+    except ValueError:
+        payloads = None
+    if not isinstance(payloads, list):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Request body must be a JSON array or NDJSON.",
+        )
+    return payloads
+
+
+def _batch_item_result(index: int, result) -> TransactionBatchItemOut:
+    if isinstance(result, AccountNotFoundError):
+        return TransactionBatchItemOut(index=index, status_code=status.HTTP_404_NOT_FOUND, detail="Account not found.")
+    if isinstance(result, BusinessError):
+        return TransactionBatchItemOut(index=index, status_code=status.HTTP_409_CONFLICT, detail=str(result))
+    return TransactionBatchItemOut(
+        index=index,
+        status_code=status.HTTP_201_CREATED,
+        transaction=TransactionOut.model_validate(result, from_attributes=True),
+    )
@@ -0,0 +1,16 @@
+from fastapi import APIRouter, Depends, status
+
+from src.ratelimit import rate_limited
+from src.schemas.transfer import TransferIn
+from src.security import login_required
+from src.services.transfer import TransferService
+from src.views.transfer import TransferOut
+
+router = APIRouter(prefix="/transfers", dependencies=[Depends(login_required), Depends(rate_limited)])
+
+service = TransferService()
+
+
+@router.post("/", status_code=status.HTTP_201_CREATED, response_model=TransferOut)
+async def create_transfer(transfer: TransferIn):
+    return await service.create(transfer)
@@ -1,12 +1,49 @@
-import databases
+import sqlite3
+
 import sqlalchemy as sa
+from databases import DatabaseURL
 
 from src.config import settings
+from src.instrumentation import InstrumentedDatabase
+from src.metrics import Gauge
+
+if DatabaseURL(settings.database_url).dialect == "postgresql":
+    options = {
+        "min_size": settings.db_pool_min_size,
+        "max_size": settings.db_pool_max_size,
+        "statement_cache_size": settings.db_statement_cache_size,
+    }
+else:
+    # SQLite opens a connection per acquire: the timeout bounds the wait for the database lock instead,
+    # and the statement cache lives as long as the connection.
+    options = {"timeout": settings.db_pool_acquire_timeout, "cached_statements": settings.db_statement_cache_size}
 
-database = databases.Database(settings.database_url)
+database = InstrumentedDatabase(
+    settings.database_url,
+    acquire_timeout=settings.db_pool_acquire_timeout,
+    max_lifetime=settings.db_pool_max_lifetime,
+    **options,
+)
+pool_connections = Gauge(
+    "db_pool_connections", "Database pool connections by state.", labels=("state",), collect=database.pool_usage
+)
 metadata = sa.MetaData()
 
+# INSERT/UPDATE ... RETURNING is available on PostgreSQL and on SQLite 3.35+; older SQLite needs a follow-up SELECT.
+supports_returning = database.url.dialect == "postgresql" or (
+    database.url.dialect == "sqlite" and sqlite3.sqlite_version_info >= (3, 35)
+)
+
+engine_url = sa.engine.make_url(settings.database_url)
+engine_options = {"pool_recycle": settings.db_pool_max_lifetime}
+# SQLite in-memory databases get a SingletonThreadPool, which takes no size, overflow or timeout.
+if issubclass(engine_url.get_dialect().get_pool_class(engine_url), sa.pool.QueuePool):
+    engine_options.update(
+        pool_size=settings.db_pool_min_size,
+        max_overflow=settings.db_pool_max_size - settings.db_pool_min_size,
+        pool_timeout=settings.db_pool_acquire_timeout,
+    )
 if settings.environment == "production":
-    engine = sa.create_engine(settings.database_url)
+    engine = sa.create_engine(settings.database_url, **engine_options)
 else:
-    engine = sa.create_engine(settings.database_url, connect_args={"check_same_thread": False})
+    engine = sa.create_engine(settings.database_url, connect_args={"check_same_thread": False}, **engine_options)
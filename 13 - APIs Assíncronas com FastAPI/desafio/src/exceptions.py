@@ -4,3 +4,11 @@ class AccountNotFoundError(Exception):
 
 class BusinessError(Exception):
     pass
+
+
+class WriteQueueFullError(Exception):
+    pass
+
+
+class PoolTimeoutError(Exception):
+    pass
@@ -0,0 +1,62 @@
+import csv
+import io
+import json
+from collections.abc import AsyncIterator, Callable, Mapping
+from enum import Enum
+
+EXPORT_FIELDS = ("id", "account_id", "type", "amount", "timestamp")
+ACCOUNT_EXPORT_FIELDS = ("id", "user_id", "balance", "created_at")
+
+# Rows are sent in chunks rather than one by one, so a long history doesn't turn into millions of tiny writes.
+CHUNK_ROWS = 500
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+MEDIA_TYPES = {ExportFormat.NDJSON: "application/x-ndjson", ExportFormat.CSV: "text/csv"}
+
+
+def _values(row: Mapping) -> tuple:
+    return (row["id"], row["account_id"], row["type"].value, float(row["amount"]), row["timestamp"].isoformat())
+
+
+def account_values(row: Mapping) -> tuple:
+    created_at = row["created_at"] and row["created_at"].isoformat()
+    return (row["id"], row["user_id"], float(row["balance"]), created_at)
+
+
+async def to_ndjson(
+    rows: AsyncIterator[Mapping], fields: tuple[str, ...] = EXPORT_FIELDS, values: Callable[[Mapping], tuple] = _values
+) -> AsyncIterator[str]:
+    lines = []
+    async for row in rows:
+        lines.append(json.dumps(dict(zip(fields, values(row))), separators=(",", ":")) + "\n")
+        if len(lines) == CHUNK_ROWS:
+            yield "".join(lines)
+            lines = []
+    if lines:
+        yield "".join(lines)
+
+
+async def to_csv(
+    rows: AsyncIterator[Mapping], fields: tuple[str, ...] = EXPORT_FIELDS, values: Callable[[Mapping], tuple] = _values
+) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(fields)
+    count = 0
+    async for row in rows:
+        writer.writerow(values(row))
+        count += 1
+        if count == CHUNK_ROWS:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            count = 0
+    yield buffer.getvalue()
+
+
+SERIALIZERS = {ExportFormat.NDJSON: to_ndjson, ExportFormat.CSV: to_csv}
@@ -0,0 +1,75 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from src.metrics import Histogram
+
+flush_duration = Histogram("transaction_group_commit_flush_seconds", "Time spent committing one group of transactions.")
+flush_size = Histogram(
+    "transaction_group_commit_batch_size",
+    "Transactions committed together per group.",
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500, 1000),
+)
+
+
+class GroupCommitter:
+    """Collects concurrent submissions for up to ``window`` seconds or ``max_items`` items and hands
+    them to ``handler`` as one group.
+
+    ``handler`` receives the items in submission order and returns one result per item; results that
+    are exceptions are raised to their own caller only.
+    """
+
+    def __init__(self, handler: Callable[[list[Any]], Awaitable[list[Any]]], window: float, max_items: int) -> None:
+        self.window = window
+        self.max_items = max_items
+        self._handler = handler
+        self._pending: list[tuple[Any, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._flushes: set[asyncio.Task] = set()
+
+    async def submit(self, item: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.max_items:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        group, self._pending = self._pending, []
+        if group:
+            # Each flush runs in its own task, so it gets its own connection and DB transaction.
+            task = asyncio.create_task(self._commit(group))
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+
+    async def _commit(self, group: list[tuple[Any, asyncio.Future]]) -> None:
+        started = time.perf_counter()
+        try:
+            results = await self._handler([item for item, _ in group])
+        except asyncio.CancelledError:
+            for _, future in group:
+                future.cancel()
+            raise
+        except Exception as exc:
+            results = [exc] * len(group)
+        finally:
+            flush_duration.observe(time.perf_counter() - started)
+            flush_size.observe(len(group))
+
+        for (_, future), result in zip(group, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
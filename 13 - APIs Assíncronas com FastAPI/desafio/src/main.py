@@ -1,18 +1,24 @@
+import time
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
-from src.controllers import account, auth, transaction
+from src.controllers import account, auth, health, metrics, reconciliation, transaction, transfer
 from src.database import database
-from src.exceptions import AccountNotFoundError, BusinessError
+from src.exceptions import AccountNotFoundError, BusinessError, PoolTimeoutError, WriteQueueFullError
+from src.instrumentation import MetricsMiddleware
+from src.warmup import warmup
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    started = time.perf_counter()
     await database.connect()
+    await warmup.run(app, started)
     yield
+    warmup.ready = False
     await database.disconnect()
 
 
@@ -29,6 +35,14 @@ tags_metadata = [
         "name": "transaction",
         "description": "Operations to maintain transactions.",
     },
+    {
+        "name": "transfer",
+        "description": "Operations to move money between accounts.",
+    },
+    {
+        "name": "reconciliation",
+        "description": "Results of the ledger reconciliation job.",
+    },
 ]
 
 
@@ -42,12 +56,27 @@ Transactions API is the microservice for recording current account transactions.
 ## Account
 
 * **Create accounts**.
-* **List accounts**.
+* **List your accounts**.
+* **Stream all accounts, for admins**.
+* **Read accounts by ID**.
+* **Read account summaries, one or many at a time**.
 * **List account transactions by ID**.
+* **Export account transactions as NDJSON or CSV**.
+* **Read account balance at a point in time**.
+* **Read account statement for a period**.
 
 ## Transaction
 
 * **Create transactions**.
+* **Create transactions in batch**.
+
+## Transfer
+
+* **Transfer between accounts**.
+
+## Reconciliation
+
+* **Read accounts whose balance drifted from their ledger, for admins**.
 """,
     openapi_tags=tags_metadata,
     redoc_url=None,
@@ -61,10 +90,15 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(MetricsMiddleware)
 
 app.include_router(auth.router, tags=["auth"])
 app.include_router(account.router, tags=["account"])
 app.include_router(transaction.router, tags=["transaction"])
+app.include_router(transfer.router, tags=["transfer"])
+app.include_router(reconciliation.router, tags=["reconciliation"])
+app.include_router(metrics.router)
+app.include_router(health.router)
 
 
 @app.exception_handler(AccountNotFoundError)
@@ -75,3 +109,21 @@ async def account_not_found_error_handler(request: Request, exc: AccountNotFound
 @app.exception_handler(BusinessError)
 async def business_error_handler(request: Request, exc: BusinessError):
     return JSONResponse(status_code=status.HTTP_409_CONFLICT, content={"detail": str(exc)})
+
+
+@app.exception_handler(WriteQueueFullError)
+async def write_queue_full_error_handler(request: Request, exc: WriteQueueFullError):
+    return JSONResponse(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        content={"detail": "Too many pending operations for this account, try again later."},
+        headers={"Retry-After": "1"},
+    )
+
+
+@app.exception_handler(PoolTimeoutError)
+async def pool_timeout_error_handler(request: Request, exc: PoolTimeoutError):
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "No database connection available, try again later."},
+        headers={"Retry-After": "1"},
+    )
@@ -0,0 +1,151 @@
+import bisect
+import math
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
+
+LabelValues = tuple[str, ...]
+
+
+class Metric(ABC):
+    type: str = "untyped"
+
+    def __init__(self, name: str, help: str, labels: Iterable[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        registry.register(self)
+
+    def _key(self, labels: dict[str, object]) -> LabelValues:
+        return tuple(str(labels[label]) for label in self.labels)
+
+    def _format(self, key: LabelValues, extra: dict[str, str] | None = None) -> str:
+        pairs = list(zip(self.labels, key)) + list((extra or {}).items())
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{label}="{value}"' for label, value in pairs) + "}"
+
+    @abstractmethod
+    def samples(self) -> Iterable[str]:
+        """The exposition lines for this metric, without its HELP and TYPE lines."""
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type}", *self.samples()]
+        return "\n".join(lines)
+
+
+class Counter(Metric):
+    """A counter either incremented directly or read at scrape time from ``collect``."""
+
+    type = "counter"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: Iterable[str] = (),
+        collect: Callable[[], dict[LabelValues, float]] | None = None,
+    ) -> None:
+        super().__init__(name, help, labels)
+        self._values: dict[LabelValues, float] = {}
+        self._collect = collect
+
+    def inc(self, amount: float = 1, **labels: object) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: object) -> float:
+        values = self._collect() if self._collect else self._values
+        return values.get(self._key(labels), 0)
+
+    def samples(self) -> Iterable[str]:
+        values = self._collect() if self._collect else self._values
+        for key, value in values.items():
+            yield f"{self.name}{self._format(key)} {value}"
+
+
+class Gauge(Metric):
+    """A gauge either set directly or computed at scrape time by ``collect``."""
+
+    type = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: Iterable[str] = (),
+        collect: Callable[[], dict[LabelValues, float]] | None = None,
+    ) -> None:
+        super().__init__(name, help, labels)
+        self._values: dict[LabelValues, float] = {}
+        self._collect = collect
+
+    def set(self, value: float, **labels: object) -> None:
+        self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1, **labels: object) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels: object) -> None:
+        self.inc(-amount, **labels)
+
+    def value(self, **labels: object) -> float:
+        values = self._collect() if self._collect else self._values
+        return values.get(self._key(labels), 0)
+
+    def samples(self) -> Iterable[str]:
+        values = self._collect() if self._collect else self._values
+        for key, value in values.items():
+            yield f"{self.name}{self._format(key)} {value}"
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(
+        self, name: str, help: str, labels: Iterable[str] = (), buckets: Iterable[float] = DEFAULT_BUCKETS
+    ) -> None:
+        super().__init__(name, help, labels)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._counts: dict[LabelValues, list[int]] = {}
+        self._sums: dict[LabelValues, float] = {}
+
+    def observe(self, value: float, **labels: object) -> None:
+        key = self._key(labels)
+        counts = self._counts.setdefault(key, [0] * len(self.buckets))
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        self._sums[key] = self._sums.get(key, 0) + value
+
+    def count(self, **labels: object) -> int:
+        return sum(self._counts.get(self._key(labels), ()))
+
+    def sum(self, **labels: object) -> float:
+        return self._sums.get(self._key(labels), 0)
+
+    def samples(self) -> Iterable[str]:
+        for key, counts in self._counts.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                le = "+Inf" if bound == math.inf else repr(bound)
+                yield f"{self.name}_bucket{self._format(key, {'le': le})} {cumulative}"
+            yield f"{self.name}_sum{self._format(key)} {self._sums[key]}"
+            yield f"{self.name}_count{self._format(key)} {cumulative}"
+
+
+class Registry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+
+    def render(self) -> str:
+        return "\n".join(metric.render() for metric in self._metrics.values()) + "\n"
+
+
+registry = Registry()
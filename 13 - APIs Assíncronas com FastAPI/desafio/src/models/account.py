@@ -8,5 +8,13 @@ accounts = sa.Table(
     sa.Column("id", sa.Integer, primary_key=True),
     sa.Column("user_id", sa.Integer, nullable=False, index=True),
     sa.Column("balance", sa.Numeric(10, 2), nullable=False, default=0),
+    sa.Column("transaction_count", sa.Integer, nullable=False, server_default="0"),
     sa.Column("created_at", sa.TIMESTAMP(timezone=True), default=sa.func.now()),
+    # NULL falls back to the daily_withdrawal_* settings.
+    sa.Column("daily_withdrawal_count_limit", sa.Integer, nullable=True),
+    sa.Column("daily_withdrawal_amount_limit", sa.Numeric(10, 2), nullable=True),
+    # Withdrawals made on withdrawal_day (UTC), checked and bumped by the balance update itself.
+    sa.Column("withdrawal_day", sa.Date, nullable=True),
+    sa.Column("withdrawal_day_count", sa.Integer, nullable=False, server_default="0"),
+    sa.Column("withdrawal_day_total", sa.Numeric(10, 2), nullable=False, server_default="0"),
 )
@@ -0,0 +1,21 @@
+import sqlalchemy as sa
+from sqlalchemy.dialects import sqlite
+
+from src.database import metadata
+
+# Running totals per account, kept in step with the ledger by every write, so summaries never scan it.
+# Accounts without transactions have no row yet.
+account_stats = sa.Table(
+    "account_stats",
+    metadata,
+    sa.Column("account_id", sa.Integer, sa.ForeignKey("accounts.id"), primary_key=True),
+    sa.Column("deposit_total", sa.Numeric(14, 2), nullable=False, server_default="0"),
+    sa.Column("withdrawal_total", sa.Numeric(14, 2), nullable=False, server_default="0"),
+    sa.Column("deposit_count", sa.Integer, nullable=False, server_default="0"),
+    sa.Column("withdrawal_count", sa.Integer, nullable=False, server_default="0"),
+    sa.Column(
+        "last_activity_at",
+        sa.TIMESTAMP(timezone=True).with_variant(sqlite.DATETIME(truncate_microseconds=True), "sqlite"),
+        nullable=True,
+    ),
+)
@@ -0,0 +1,20 @@
+import sqlalchemy as sa
+from sqlalchemy.dialects import sqlite
+
+from src.database import metadata
+
+balance_checkpoints = sa.Table(
+    "balance_checkpoints",
+    metadata,
+    sa.Column("id", sa.Integer, primary_key=True),
+    sa.Column("account_id", sa.Integer, sa.ForeignKey("accounts.id"), nullable=False),
+    # Last transaction included in the balance; 0 for the opening checkpoint written with the account.
+    sa.Column("transaction_id", sa.Integer, nullable=False),
+    sa.Column(
+        "timestamp",
+        sa.TIMESTAMP(timezone=True).with_variant(sqlite.DATETIME(truncate_microseconds=True), "sqlite"),
+        nullable=False,
+    ),
+    sa.Column("balance", sa.Numeric(10, 2), nullable=False),
+    sa.Index("ix_balance_checkpoints_account_id_timestamp", "account_id", "timestamp", "transaction_id"),
+)
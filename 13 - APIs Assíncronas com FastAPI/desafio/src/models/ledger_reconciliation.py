@@ -0,0 +1,31 @@
+import sqlalchemy as sa
+from sqlalchemy.dialects import sqlite
+
+from src.database import metadata
+
+# Where the reconciler stopped for each account: the ledger up to (timestamp, transaction_id) has been
+# verified and adds up to balance. Written only by the reconciler; accounts never checked have no row.
+ledger_reconciliation = sa.Table(
+    "ledger_reconciliation",
+    metadata,
+    sa.Column("account_id", sa.Integer, sa.ForeignKey("accounts.id"), primary_key=True),
+    sa.Column("transaction_id", sa.Integer, nullable=False),
+    sa.Column(
+        "timestamp",
+        sa.TIMESTAMP(timezone=True).with_variant(sqlite.DATETIME(truncate_microseconds=True), "sqlite"),
+        nullable=False,
+    ),
+    sa.Column("transaction_count", sa.Integer, nullable=False),
+    sa.Column("balance", sa.Numeric(14, 2), nullable=False),
+    # accounts.balance and accounts.transaction_count minus what the ledger adds up to, at the last check.
+    sa.Column("drift", sa.Numeric(14, 2), nullable=False, server_default="0"),
+    sa.Column("count_drift", sa.Integer, nullable=False, server_default="0"),
+    sa.Column("checked_at", sa.TIMESTAMP(timezone=True), nullable=False),
+    # Partial, so listing the drifted accounts never walks the healthy ones.
+    sa.Index(
+        "ix_ledger_reconciliation_drifted",
+        "account_id",
+        postgresql_where=sa.text("drift != 0 OR count_drift != 0"),
+        sqlite_where=sa.text("drift != 0 OR count_drift != 0"),
+    ),
+)
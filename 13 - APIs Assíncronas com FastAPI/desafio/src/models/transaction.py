@@ -1,8 +1,11 @@
 from enum import Enum
 
 import sqlalchemy as sa
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.ext.compiler import compiles
 
-from src.database import metadata
+from src.config import settings
+from src.database import database, metadata
 
 
 class TransactionType(str, Enum):
@@ -10,12 +13,51 @@ class TransactionType(str, Enum):
     WITHDRAWAL = "withdrawal"
 
 
+class write_timestamp(sa.sql.expression.FunctionElement):
+    """The time the statement writes the row. On PostgreSQL, now() is when the transaction began instead,
+    which can precede rows of the same account committed in the meantime."""
+
+    type = sa.TIMESTAMP(timezone=True)
+    inherit_cache = True
+
+
+@compiles(write_timestamp)
+def _compile_write_timestamp(element: write_timestamp, compiler: sa.sql.compiler.SQLCompiler, **kw) -> str:
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(write_timestamp, "postgresql")
+def _compile_write_timestamp_postgresql(element: write_timestamp, compiler: sa.sql.compiler.SQLCompiler, **kw) -> str:
+    return "clock_timestamp()"
+
+
+# PostgreSQL only: monthly range partitions on timestamp, see src/services/transaction_partition.py.
+# A partitioned table needs the partition key in its primary key.
+partitioned = settings.transaction_partitioning_enabled and database.url.dialect == "postgresql"
+
 transactions = sa.Table(
     "transactions",
     metadata,
-    sa.Column("id", sa.Integer, primary_key=True),
+    sa.Column("id", sa.Integer, primary_key=True, autoincrement=True),
     sa.Column("account_id", sa.Integer, sa.ForeignKey("accounts.id"), nullable=False),
     sa.Column("type", sa.Enum(TransactionType, name="transaction_types"), nullable=False),
     sa.Column("amount", sa.Numeric(10, 2), nullable=False),
-    sa.Column("timestamp", sa.TIMESTAMP(timezone=True), default=sa.func.now()),
+    # SQLite's CURRENT_TIMESTAMP has second precision, so binds are rendered the same way to keep
+    # comparisons against stored timestamps exact.
+    sa.Column(
+        "timestamp",
+        sa.TIMESTAMP(timezone=True).with_variant(sqlite.DATETIME(truncate_microseconds=True), "sqlite"),
+        # Rows are written after the account's lock is taken, so per account the (timestamp, id) order is
+        # the commit order, which balance checkpoints and reconciliation watermarks rely on.
+        default=write_timestamp(),
+        primary_key=partitioned,
+    ),
+    sa.Index(
+        "ix_transactions_account_id_timestamp_id",
+        "account_id",
+        "timestamp",
+        "id",
+        postgresql_include=["type", "amount"],
+    ),
+    **({"postgresql_partition_by": "RANGE (timestamp)"} if partitioned else {}),
 )
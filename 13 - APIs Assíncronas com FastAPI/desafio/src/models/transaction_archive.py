@@ -0,0 +1,26 @@
+import sqlalchemy as sa
+from sqlalchemy.dialects import sqlite
+
+from src.database import metadata
+from src.models.transaction import TransactionType, transactions
+
+# Transactions older than the archive horizon, moved out of the hot table by the archive job with
+# their original ids. Rows are only ever inserted and read back.
+transactions_archive = sa.Table(
+    "transactions_archive",
+    metadata,
+    sa.Column("id", sa.Integer, primary_key=True, autoincrement=False),
+    sa.Column("account_id", sa.Integer, sa.ForeignKey("accounts.id"), nullable=False),
+    sa.Column("type", sa.Enum(TransactionType, name="transaction_types"), nullable=False),
+    sa.Column("amount", sa.Numeric(10, 2), nullable=False),
+    sa.Column(
+        "timestamp",
+        sa.TIMESTAMP(timezone=True).with_variant(sqlite.DATETIME(truncate_microseconds=True), "sqlite"),
+        nullable=False,
+    ),
+    sa.Index("ix_transactions_archive_account_id_timestamp_id", "account_id", "timestamp", "id"),
+)
+
+# Hot and archived rows together, for the reads that must see the whole history. Filters on its
+# columns are pushed down into both tables, so each side still uses its own index.
+ledger = sa.union_all(sa.select(transactions), sa.select(transactions_archive)).subquery("ledger")
@@ -0,0 +1,27 @@
+import base64
+import json
+from datetime import datetime
+
+
+def encode_cursor(timestamp: datetime, id: int) -> str:
+    payload = json.dumps([timestamp.isoformat(), id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def encode_id_cursor(id: int) -> str:
+    return base64.urlsafe_b64encode(str(id).encode()).decode().rstrip("=")
+
+
+def decode_id_cursor(cursor: str) -> int:
+    try:
+        return int(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        timestamp, id = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        return datetime.fromisoformat(timestamp), int(id)
+    except (TypeError, ValueError) as exc:
+        raise ValueError("Invalid cursor") from exc
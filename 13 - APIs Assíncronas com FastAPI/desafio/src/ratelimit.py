@@ -0,0 +1,107 @@
+import math
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Annotated
+
+from fastapi import Depends, HTTPException, Request, status
+
+from src.config import settings
+from src.metrics import Counter
+from src.security import get_current_user
+
+rejections = Counter(
+    "rate_limit_rejections_total", "Requests refused by the per-user rate limit.", labels=("method", "route")
+)
+
+
+class RateLimitStore(ABC):
+    """Token buckets by key: ``rate`` tokens per second, up to ``burst``, one token per request."""
+
+    @abstractmethod
+    async def take(self, key: str, rate: float, burst: int) -> float:
+        """Takes a token and returns 0, or returns the seconds until one is available."""
+
+
+class MemoryRateLimitStore(RateLimitStore):
+    """In-process buckets, one dict lookup per request. Each worker counts on its own, so the effective
+    limit is multiplied by the number of workers. The least recently used buckets are dropped beyond
+    ``maxsize``; a dropped bucket comes back full."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        # key -> (tokens, updated_at)
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    async def take(self, key: str, rate: float, burst: int) -> float:
+        now = time.monotonic()
+        tokens, updated_at = self._buckets.get(key, (burst, now))
+        tokens = min(burst, tokens + (now - updated_at) * rate)
+        wait = 0.0 if tokens >= 1 else (1 - tokens) / rate
+        self._buckets[key] = (tokens - 1 if tokens >= 1 else tokens, now)
+        self._buckets.move_to_end(key)
+        while len(self._buckets) > self.maxsize:
+            self._buckets.popitem(last=False)
+        return wait
+
+    def clear(self) -> None:
+        self._buckets.clear()
+
+
+class RedisRateLimitStore(RateLimitStore):
+    """Buckets shared by every worker, updated atomically by a script on the Redis server clock. Needs the
+    optional ``redis`` package."""
+
+    SCRIPT = """
+    local rate, burst = tonumber(ARGV[1]), tonumber(ARGV[2])
+    local clock = redis.call('TIME')
+    local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+    local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+    local elapsed = math.max(0, now - (tonumber(bucket[2]) or now))
+    local tokens = math.min(burst, (tonumber(bucket[1]) or burst) + elapsed * rate)
+    local wait = 0
+    if tokens >= 1 then tokens = tokens - 1 else wait = (1 - tokens) / rate end
+    redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated_at', now)
+    redis.call('PEXPIRE', KEYS[1], math.ceil(burst / rate * 1000))
+    return tostring(wait)
+    """
+
+    def __init__(self, url: str) -> None:
+        from redis.asyncio import Redis
+
+        self._client = Redis.from_url(url)
+        self._script = self._client.register_script(self.SCRIPT)
+
+    async def take(self, key: str, rate: float, burst: int) -> float:
+        return float(await self._script(keys=[f"ratelimit:{key}"], args=[rate, burst]))
+
+
+def create_store(backend: str, url: str | None, maxsize: int) -> RateLimitStore:
+    if backend == "redis":
+        return RedisRateLimitStore(url)
+    return MemoryRateLimitStore(maxsize)
+
+
+rate_limit_store = create_store(settings.rate_limit_backend, settings.rate_limit_url, settings.rate_limit_size)
+
+
+async def rate_limited(request: Request, current_user: Annotated[dict[str, int], Depends(get_current_user)]) -> None:
+    """Router dependency limiting each user, by JWT ``sub``, per route.
+
+    Limits come from ``settings.rate_limit_routes`` by "METHOD /path", as the route is declared, or from
+    the global rate and burst. Runs with the other dependencies, before the endpoint touches the database.
+    """
+    if not settings.rate_limit_enabled:
+        return
+
+    path = request.scope["route"].path
+    route = f"{request.method} {path}"
+    rate, burst = settings.rate_limit_routes.get(route, (settings.rate_limit_rate, settings.rate_limit_burst))
+    wait = await rate_limit_store.take(f"{current_user['user_id']}:{route}", rate, burst)
+    if wait:
+        rejections.inc(method=request.method, route=path)
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Rate limit exceeded, try again later.",
+            headers={"Retry-After": str(math.ceil(wait))},
+        )
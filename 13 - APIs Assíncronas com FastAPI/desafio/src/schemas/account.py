@@ -1,6 +1,12 @@
-from pydantic import BaseModel, PositiveFloat
+from pydantic import BaseModel, PositiveFloat, PositiveInt
 
 
-class AccountIn(BaseModel):
+class WithdrawalLimitsIn(BaseModel):
+    # Fields left out are kept as they are on updates; an explicit null clears the account's own limit.
+    daily_withdrawal_count_limit: PositiveInt | None = None
+    daily_withdrawal_amount_limit: PositiveFloat | None = None
+
+
+class AccountIn(WithdrawalLimitsIn):
     user_id: int
     balance: PositiveFloat
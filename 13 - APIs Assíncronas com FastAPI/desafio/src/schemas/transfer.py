@@ -0,0 +1,13 @@
+from pydantic import BaseModel, PositiveFloat, model_validator
+
+
+class TransferIn(BaseModel):
+    from_account_id: int
+    to_account_id: int
+    amount: PositiveFloat
+
+    @model_validator(mode="after")
+    def check_accounts(self) -> "TransferIn":
+        if self.from_account_id == self.to_account_id:
+            raise ValueError("Source and destination accounts must differ")
+        return self
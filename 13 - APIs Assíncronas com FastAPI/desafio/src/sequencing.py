@@ -0,0 +1,75 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from src.config import settings
+from src.exceptions import WriteQueueFullError
+from src.metrics import Counter, Gauge
+
+
+class WriteSequencer:
+    """Serializes work per key through a fixed set of FIFO lock shards.
+
+    Writes for the same account always map to the same shard, so at most one of them reaches the
+    database at a time and the others wait in process instead of holding a pool connection.
+    """
+
+    def __init__(self, shards: int, max_pending: int) -> None:
+        self.max_pending = max_pending
+        self._locks = [asyncio.Lock() for _ in range(shards)]
+        self._pending = [0] * shards
+        self._waiting = [0] * shards
+
+    def shard(self, key: int) -> int:
+        return key % len(self._locks)
+
+    @asynccontextmanager
+    async def sequence(self, *keys: int) -> AsyncIterator[None]:
+        # Shards are always taken in ascending order, so multi-key callers cannot deadlock each other.
+        shards = sorted({self.shard(key) for key in keys})
+        if any(self._pending[shard] >= self.max_pending for shard in shards):
+            write_queue_rejections.inc()
+            raise WriteQueueFullError
+
+        for shard in shards:
+            self._pending[shard] += 1
+        acquired: list[int] = []
+        try:
+            for shard in shards:
+                self._waiting[shard] += 1
+                try:
+                    await self._locks[shard].acquire()
+                finally:
+                    self._waiting[shard] -= 1
+                acquired.append(shard)
+            yield
+        finally:
+            for shard in reversed(acquired):
+                self._locks[shard].release()
+            for shard in shards:
+                self._pending[shard] -= 1
+
+    def waiting(self) -> dict[tuple[str, ...], float]:
+        return {(str(shard),): count for shard, count in enumerate(self._waiting)}
+
+    def pending(self) -> dict[tuple[str, ...], float]:
+        return {(str(shard),): count for shard, count in enumerate(self._pending)}
+
+
+sequencer = WriteSequencer(shards=settings.write_sequencing_shards, max_pending=settings.write_sequencing_max_pending)
+
+write_queue_rejections = Counter(
+    "transaction_write_queue_rejections_total", "Writes rejected because their shard queue was full."
+)
+Gauge(
+    "transaction_write_queue_waiting",
+    "Writes waiting for their shard, excluding the one running.",
+    labels=["shard"],
+    collect=sequencer.waiting,
+)
+Gauge(
+    "transaction_write_queue_pending",
+    "Writes queued or running per shard.",
+    labels=["shard"],
+    collect=sequencer.pending,
+)
@@ -1,18 +1,152 @@
+from collections.abc import AsyncIterator
+from datetime import datetime
+from types import SimpleNamespace
+
+import sqlalchemy as sa
 from databases.interfaces import Record
 
-from src.database import database
+from src.cache import account_cache
+from src.database import database, supports_returning
+from src.exceptions import AccountNotFoundError
 from src.models.account import accounts
-from src.schemas.account import AccountIn
+from src.models.balance_checkpoint import balance_checkpoints
+from src.schemas.account import AccountIn, WithdrawalLimitsIn
+from src.statements import precompiled
+
+# Bumped on every new account, so cached pages of the listing are never reused once it changed.
+PAGES_GENERATION_KEY = "accounts:generation"
+
+
+@precompiled("accounts.page", variants=[(False,), (True,)])
+def accounts_page(scoped: bool) -> sa.Select:
+    # Keyset on id: with the user_id filter, ix_accounts_user_id serves the page without touching other users' rows.
+    query = accounts.select().where(accounts.c.id > sa.bindparam("after")).order_by(accounts.c.id)
+    if scoped:
+        query = query.where(accounts.c.user_id == sa.bindparam("user_id"))
+    return query.limit(sa.bindparam("limit"))
 
 
 class AccountService:
-    async def read_all(self, limit: int, skip: int = 0) -> list[Record]:
-        query = accounts.select().limit(limit).offset(skip)
-        return await database.fetch_all(query)
+    """Account reads go through ``account_cache``: pages of the listing are cached as id lists and
+    each account separately, so a transaction only has to move its own account's version."""
+
+    async def read_all(self, limit: int, after: int = 0, user_id: int | None = None) -> list[SimpleNamespace]:
+        """Returns the accounts after the ``after`` id, in id order; only ``user_id``'s when it is given."""
+        (generation,) = await account_cache.counters([PAGES_GENERATION_KEY])
+        page_key = f"accounts:page:{generation}:{user_id}:{limit}:{after}"
+        page = await account_cache.get_many([page_key])
+        if page_key in page:
+            _, ids = page[page_key]
+            found = await self.__read_many(ids)
+            return [found[id] for id in ids if id in found]
+
+        values = {"limit": limit, "after": after}
+        if user_id is not None:
+            values["user_id"] = user_id
+        query = accounts_page(user_id is not None, **values)
+        entries = [self.__to_entry(row) for row in await database.fetch_all(query)]
+        # Only the ids: an account is cached under the version read before loading it, see __read_many.
+        await account_cache.set_many({page_key: [entry["id"] for entry in entries]})
+        return [self.__from_entry(entry) for entry in entries]
+
+    def iterate_all(self) -> AsyncIterator[Record]:
+        """Returns every account as a cursor, in id order; rows are not cached."""
+        return database.iterate(accounts.select().order_by(accounts.c.id))
+
+    async def read(self, id: int) -> SimpleNamespace:
+        found = await self.__read_many([id])
+        if id not in found:
+            raise AccountNotFoundError
+        return found[id]
 
     async def create(self, account: AccountIn) -> Record:
-        command = accounts.insert().values(user_id=account.user_id, balance=account.balance)
-        account_id = await database.execute(command)
+        if database.url.dialect == "postgresql":
+            result = await self.__create_in_one_statement(account)
+        else:
+            result = await self.__create_step_by_step(account)
+
+        await account_cache.incr(PAGES_GENERATION_KEY)
+        return result
+
+    async def update_limits(self, id: int, limits: WithdrawalLimitsIn) -> SimpleNamespace:
+        """Changes the daily withdrawal limits given in ``limits``; a null one falls back to the settings."""
+        values = limits.model_dump(exclude_unset=True)
+        if values:
+            await database.execute(accounts.update().where(accounts.c.id == id).values(**values))
+            await self.invalidate(id)
+        return await self.read(id)
+
+    async def invalidate(self, *ids: int) -> None:
+        """Moves cached accounts to a new version; called once a write that changed them has been committed."""
+        await account_cache.incr(*(self.__version_key(id) for id in ids))
+
+    async def __read_many(self, ids: list[int]) -> dict[int, SimpleNamespace]:
+        # Versions are read before the accounts: a read racing a write stores what it loaded under the
+        # version that write moves past once committed, so the row it loaded is never served afterwards.
+        versions = await account_cache.counters([self.__version_key(id) for id in ids])
+        keys = {id: f"account:{id}:{version}" for id, version in zip(ids, versions)}
+        cached = await account_cache.get_many(list(keys.values()))
+        entries = {value["id"]: value for _, value in cached.values()}
+
+        missing = [id for id in ids if id not in entries]
+        if missing:
+            query = accounts.select().where(accounts.c.id.in_(missing))
+            loaded = {row.id: self.__to_entry(row) for row in await database.fetch_all(query)}
+            await account_cache.set_many({keys[id]: entry for id, entry in loaded.items()})
+            entries.update(loaded)
+        return {id: self.__from_entry(entry) for id, entry in entries.items()}
+
+    def __version_key(self, id: int) -> str:
+        return f"account:{id}:version"
+
+    def __to_entry(self, row: Record) -> dict:
+        # Cache values must be JSON serializable for shared backends.
+        return {
+            "id": row.id,
+            "user_id": row.user_id,
+            "balance": float(row.balance),
+            "transaction_count": row.transaction_count,
+            "created_at": row.created_at.isoformat() if row.created_at else None,
+            "daily_withdrawal_count_limit": row.daily_withdrawal_count_limit,
+            "daily_withdrawal_amount_limit": (
+                None if row.daily_withdrawal_amount_limit is None else float(row.daily_withdrawal_amount_limit)
+            ),
+        }
+
+    def __from_entry(self, entry: dict) -> SimpleNamespace:
+        created_at = entry["created_at"] and datetime.fromisoformat(entry["created_at"])
+        return SimpleNamespace(**{**entry, "created_at": created_at})
+
+    async def __create_in_one_statement(self, account: AccountIn) -> Record:
+        # The account and its opening checkpoint are chained data-modifying CTEs, in one round trip.
+        inserted_account = accounts.insert().values(**account.model_dump()).returning(accounts).cte("inserted_account")
+        checkpoint = (
+            balance_checkpoints.insert()
+            .from_select(
+                ["account_id", "transaction_id", "timestamp", "balance"],
+                sa.select(
+                    inserted_account.c.id,
+                    sa.literal(0, sa.Integer),
+                    inserted_account.c.created_at,
+                    inserted_account.c.balance,
+                ),
+            )
+            .cte("checkpoint")
+        )
+        return await database.fetch_one(sa.select(inserted_account).add_cte(checkpoint))
+
+    @database.transaction()
+    async def __create_step_by_step(self, account: AccountIn) -> Record:
+        command = accounts.insert().values(**account.model_dump())
+        if supports_returning:
+            result = await database.fetch_one(command.returning(accounts))
+        else:
+            account_id = await database.execute(command)
+            result = await database.fetch_one(accounts.select().where(accounts.c.id == account_id))
 
-        query = accounts.select().where(accounts.c.id == account_id)
-        return await database.fetch_one(query)
+        # Opening checkpoint, so historical balances never need to scan back to the first transaction.
+        command = balance_checkpoints.insert().values(
+            account_id=result.id, transaction_id=0, timestamp=result.created_at, balance=result.balance
+        )
+        await database.execute(command)
+        return result
@@ -0,0 +1,90 @@
+import sqlalchemy as sa
+from databases.interfaces import Record
+
+from src.database import database
+from src.exceptions import AccountNotFoundError
+from src.models.account import accounts
+from src.models.account_stats import account_stats
+from src.models.transaction import TransactionType
+from src.models.transaction_archive import ledger
+
+
+class AccountStatsService:
+    async def read(self, account_id: int) -> Record:
+        summaries = await self.read_many([account_id])
+        if not summaries:
+            raise AccountNotFoundError
+        return summaries[0]
+
+    async def read_many(self, account_ids: list[int], user_id: int | None = None) -> list[Record]:
+        """Summaries of the existing accounts among ``account_ids``, in id order; only ``user_id``'s when
+        it is given."""
+        query = (
+            sa.select(
+                accounts.c.id.label("account_id"),
+                *(
+                    sa.func.coalesce(account_stats.c[column], 0).label(column)
+                    for column in ("deposit_total", "withdrawal_total", "deposit_count", "withdrawal_count")
+                ),
+                account_stats.c.last_activity_at,
+            )
+            .select_from(accounts.outerjoin(account_stats))
+            .where(accounts.c.id.in_(account_ids))
+            .order_by(accounts.c.id)
+        )
+        if user_id is not None:
+            query = query.where(accounts.c.user_id == user_id)
+        return await database.fetch_all(query)
+
+    async def rebuild(self, batch_size: int) -> int:
+        """Recomputes every account's stats from the ledger, archived rows included, ``batch_size``
+        accounts per transaction."""
+        after, rebuilt = 0, 0
+        while ids := await self.__rebuild_batch(after, batch_size):
+            after, rebuilt = ids[-1], rebuilt + len(ids)
+        return rebuilt
+
+    @database.transaction()
+    async def __rebuild_batch(self, after: int, batch_size: int) -> list[int]:
+        # Writers update the account row before its stats, so holding these rows keeps new
+        # transactions for the batch out until its totals are replaced.
+        query = (
+            sa.select(accounts.c.id)
+            .where(accounts.c.id > after)
+            .order_by(accounts.c.id)
+            .limit(batch_size)
+            .with_for_update()
+        )
+        ids = [row.id for row in await database.fetch_all(query)]
+        if not ids:
+            return ids
+
+        await database.execute(account_stats.delete().where(account_stats.c.account_id.in_(ids)))
+
+        deposit = ledger.c.type == TransactionType.DEPOSIT
+        withdrawal = ledger.c.type == TransactionType.WITHDRAWAL
+        totals = (
+            sa.select(
+                ledger.c.account_id,
+                sa.func.coalesce(sa.func.sum(sa.case((deposit, ledger.c.amount))), 0),
+                sa.func.coalesce(sa.func.sum(sa.case((withdrawal, ledger.c.amount))), 0),
+                sa.func.count(sa.case((deposit, 1))),
+                sa.func.count(sa.case((withdrawal, 1))),
+                sa.func.max(ledger.c.timestamp),
+            )
+            .where(ledger.c.account_id.in_(ids))
+            .group_by(ledger.c.account_id)
+        )
+        command = account_stats.insert().from_select(
+            [
+                "account_id",
+                "deposit_total",
+                "withdrawal_total",
+                "deposit_count",
+                "withdrawal_count",
+                "last_activity_at",
+            ],
+            totals,
+        )
+        await database.execute(command)
+        return ids
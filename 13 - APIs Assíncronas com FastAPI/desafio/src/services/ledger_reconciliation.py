@@ -0,0 +1,153 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import sqlalchemy as sa
+from databases.interfaces import Record
+from sqlalchemy.dialects import postgresql, sqlite
+
+from src.database import database
+from src.models.account import accounts
+from src.models.balance_checkpoint import balance_checkpoints
+from src.models.ledger_reconciliation import ledger_reconciliation
+from src.models.transaction import TransactionType
+from src.models.transaction_archive import ledger
+from src.services.transaction import _after
+
+drifted = sa.or_(ledger_reconciliation.c.drift != 0, ledger_reconciliation.c.count_drift != 0)
+
+
+class LedgerReconciliationService:
+    """Checks that every account's balance and transaction count match its ledger, archived rows included.
+
+    Each account keeps a watermark in ``ledger_reconciliation``, so a pass only reads the ledger rows
+    added since the previous one, and a restarted job picks up from there. Accounts without ledger rows
+    past their watermark are compared without summing the ledger; that is decided from the ledger itself,
+    so rows written without moving ``transaction_count`` still show up as drift.
+    """
+
+    async def reconcile(self, batch_size: int, settle: float, pause: float = 0.0) -> dict:
+        """Runs one pass over every account, ``batch_size`` accounts per statement.
+
+        Only rows older than ``settle`` seconds move the watermarks: a row gets its timestamp before its
+        transaction commits, and must still be ahead of the watermark when it becomes visible. Newer rows
+        are still counted when comparing.
+        """
+        after, report = 0, {"accounts": 0, "rows": 0, "drifted": 0}
+        while checks := await self.__reconcile_batch(after, batch_size, settle):
+            after = checks[-1]["account_id"]
+            report["accounts"] += len(checks)
+            report["rows"] += sum(check["rows"] for check in checks)
+            report["drifted"] += sum(1 for check in checks if check["drift"] or check["count_drift"])
+            await asyncio.sleep(pause)
+        return report
+
+    async def read_drift(self, limit: int) -> dict:
+        """Totals of the last checks and the first ``limit`` drifted accounts, in id order."""
+        query = sa.select(
+            sa.func.count(),
+            sa.func.count(sa.case((drifted, 1))),
+            sa.func.max(ledger_reconciliation.c.checked_at),
+        )
+        checked, drifted_count, last_checked_at = (await database.fetch_one(query))._mapping.values()
+        query = (
+            sa.select(ledger_reconciliation).where(drifted).order_by(ledger_reconciliation.c.account_id).limit(limit)
+        )
+        return {
+            "checked_accounts": checked,
+            "drifted_accounts": drifted_count,
+            "last_checked_at": last_checked_at,
+            "accounts": await database.fetch_all(query),
+        }
+
+    async def __reconcile_batch(self, after: int, batch_size: int, settle: float) -> list[dict]:
+        # A single statement reads the balances and the ledger from the same snapshot, so a write landing
+        # in between cannot show up as drift.
+        horizon = datetime.now(timezone.utc) - timedelta(seconds=settle)
+        rows = await database.fetch_all(self.__batch(after, batch_size, horizon))
+        checks = [self.__check(row) for row in rows]
+
+        # Accounts already checked, without new settled rows and whose drift did not change, keep their row.
+        checked_at = datetime.now(timezone.utc)
+        values = [
+            {**{key: value for key, value in check.items() if key != "rows"}, "checked_at": checked_at}
+            for row, check in zip(rows, checks)
+            if row.checked is None
+            or row.settled_count
+            or (check["drift"], check["count_drift"]) != (float(row.stored_drift), row.stored_count_drift)
+        ]
+        if values:
+            insert = postgresql.insert if database.url.dialect == "postgresql" else sqlite.insert
+            command = insert(ledger_reconciliation).values(values)
+            command = command.on_conflict_do_update(
+                index_elements=[ledger_reconciliation.c.account_id],
+                set_={column: command.excluded[column] for column in values[0] if column != "account_id"},
+            )
+            await database.execute(command)
+        return checks
+
+    def __check(self, row: Record) -> dict:
+        balance = round(float(row.balance_at_watermark) + float(row.settled_total), 2)
+        count = row.transaction_count + row.settled_count
+        return {
+            "account_id": row.id,
+            "transaction_id": row.last_id if row.settled_count else row.transaction_id,
+            "timestamp": row.last_timestamp if row.settled_count else row.timestamp,
+            "transaction_count": count,
+            "balance": balance,
+            "drift": round(float(row.balance) - balance - float(row.recent_total), 2),
+            "count_drift": row.account_count - count - row.recent_count,
+            "rows": row.settled_count,
+        }
+
+    def __batch(self, after: int, batch_size: int, horizon: datetime) -> sa.Select:
+        state, opening = ledger_reconciliation, balance_checkpoints
+        # Accounts never checked start from their opening checkpoint.
+        timestamp = sa.func.coalesce(state.c.timestamp, opening.c.timestamp)
+        transaction_id = sa.func.coalesce(state.c.transaction_id, opening.c.transaction_id)
+        count = sa.func.coalesce(state.c.transaction_count, 0)
+
+        horizon = sa.literal(horizon, ledger.c.timestamp.type)
+        new = (ledger.c.account_id == accounts.c.id, _after(timestamp, transaction_id))
+        # An index seek on (account_id, timestamp, id) per account, not the counter being audited.
+        changed = sa.exists().where(*new)
+        signed_amount = sa.case((ledger.c.type == TransactionType.WITHDRAWAL, -ledger.c.amount), else_=ledger.c.amount)
+
+        def aggregate(function: sa.ColumnElement, settled: bool) -> sa.ColumnElement:
+            window = ledger.c.timestamp <= horizon if settled else ledger.c.timestamp > horizon
+            # CASE keeps the subquery from running at all for accounts without new rows.
+            return sa.case((changed, sa.select(function).where(*new, window).scalar_subquery()), else_=0)
+
+        def last(column: sa.ColumnElement) -> sa.ColumnElement:
+            # The newest settled row, which becomes the watermark.
+            query = sa.select(column).where(*new, ledger.c.timestamp <= horizon)
+            query = query.order_by(ledger.c.timestamp.desc(), ledger.c.id.desc()).limit(1)
+            return sa.case((changed, query.scalar_subquery()))
+
+        return (
+            sa.select(
+                accounts.c.id,
+                accounts.c.balance,
+                accounts.c.transaction_count.label("account_count"),
+                state.c.account_id.label("checked"),
+                sa.func.coalesce(state.c.drift, 0).label("stored_drift"),
+                sa.func.coalesce(state.c.count_drift, 0).label("stored_count_drift"),
+                timestamp.label("timestamp"),
+                transaction_id.label("transaction_id"),
+                count.label("transaction_count"),
+                sa.func.coalesce(state.c.balance, opening.c.balance).label("balance_at_watermark"),
+                aggregate(sa.func.coalesce(sa.func.sum(signed_amount), 0), settled=True).label("settled_total"),
+                aggregate(sa.func.count(), settled=True).label("settled_count"),
+                aggregate(sa.func.coalesce(sa.func.sum(signed_amount), 0), settled=False).label("recent_total"),
+                aggregate(sa.func.count(), settled=False).label("recent_count"),
+                last(ledger.c.timestamp).label("last_timestamp"),
+                last(ledger.c.id).label("last_id"),
+            )
+            .select_from(
+                accounts.join(
+                    opening, sa.and_(opening.c.account_id == accounts.c.id, opening.c.transaction_id == 0)
+                ).outerjoin(state, state.c.account_id == accounts.c.id)
+            )
+            .where(accounts.c.id > after)
+            .order_by(accounts.c.id)
+            .limit(batch_size)
+        )
@@ -1,47 +1,488 @@
+import itertools
+from collections.abc import AsyncIterator
+from datetime import date, datetime, timezone
+
+import sqlalchemy as sa
 from databases.interfaces import Record
+from sqlalchemy.dialects import postgresql, sqlite
 
-from src.database import database
+from src.coalescing import coalesced
+from src.config import settings
+from src.database import database, supports_returning
 from src.exceptions import AccountNotFoundError, BusinessError
+from src.group_commit import GroupCommitter
 from src.models.account import accounts
+from src.models.account_stats import account_stats
+from src.models.balance_checkpoint import balance_checkpoints
 from src.models.transaction import TransactionType, transactions
+from src.models.transaction_archive import ledger
 from src.schemas.transaction import TransactionIn
+from src.sequencing import sequencer
+from src.services.account import AccountService
+from src.statements import precompiled
+
+
+def _after(timestamp: sa.ColumnElement, id: sa.ColumnElement) -> sa.ColumnElement[bool]:
+    # The plain bound on timestamp is redundant with the row comparison, but it is the form the
+    # planner can use to prune partitions.
+    return sa.and_(
+        ledger.c.timestamp >= timestamp, sa.tuple_(ledger.c.timestamp, ledger.c.id) > sa.tuple_(timestamp, id)
+    )
+
+
+@precompiled("transactions.page", variants=itertools.product((False, True), repeat=3))
+def transactions_page(start: bool, end: bool, keyset: bool) -> sa.Select:
+    query = (
+        sa.select(ledger)
+        .where(ledger.c.account_id == sa.bindparam("account_id"))
+        .order_by(ledger.c.timestamp, ledger.c.id)
+        .limit(sa.bindparam("limit"))
+    )
+    if start:
+        query = query.where(ledger.c.timestamp >= sa.bindparam("start", type_=ledger.c.timestamp.type))
+    if end:
+        query = query.where(ledger.c.timestamp <= sa.bindparam("end", type_=ledger.c.timestamp.type))
+    if keyset:
+        return query.where(
+            _after(
+                sa.bindparam("after_timestamp", type_=ledger.c.timestamp.type),
+                sa.bindparam("after_id", type_=sa.Integer),
+            )
+        )
+    return query.offset(sa.bindparam("skip"))
 
 
 class TransactionService:
-    async def read_all(self, account_id: int, limit: int, skip: int = 0) -> list[Record]:
-        query = transactions.select().where(transactions.c.account_id == account_id).limit(limit).offset(skip)
+    @coalesced
+    async def read_all(
+        self,
+        account_id: int,
+        limit: int,
+        skip: int = 0,
+        after: tuple[datetime, int] | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> list[Record]:
+        """Returns a page of the account's history, oldest first.
+
+        Archived rows are included. ``start`` and ``end`` bound the timestamps (both inclusive); with a
+        partitioned ``transactions`` table, they and the cursor let the planner skip the months outside
+        the range.
+        """
+        values = {"account_id": account_id, "limit": limit}
+        if start:
+            values["start"] = self.__utc(start)
+        if end:
+            values["end"] = self.__utc(end)
+        if after:
+            values["after_timestamp"], values["after_id"] = after
+        else:
+            values["skip"] = skip
+        query = transactions_page("start" in values, "end" in values, "after_id" in values, **values)
         return await database.fetch_all(query)
 
-    @database.transaction()
+    async def iterate_all(self, account_id: int) -> AsyncIterator[Record]:
+        """Returns the account's whole history, archived rows included, as a cursor, oldest first.
+
+        The account is checked up front, so a missing one fails before anything is streamed.
+        """
+        query = sa.select(accounts.c.id).where(accounts.c.id == account_id)
+        if await database.fetch_val(query) is None:
+            raise AccountNotFoundError
+
+        query = sa.select(ledger).where(ledger.c.account_id == account_id).order_by(ledger.c.timestamp, ledger.c.id)
+        return database.iterate(query)
+
+    @coalesced
+    async def read_balance(self, account_id: int, at: datetime, inclusive: bool = True) -> float:
+        at = self.__utc(at)
+
+        query = (
+            balance_checkpoints.select()
+            .where(
+                balance_checkpoints.c.account_id == account_id,
+                balance_checkpoints.c.timestamp <= at if inclusive else balance_checkpoints.c.timestamp < at,
+            )
+            .order_by(balance_checkpoints.c.timestamp.desc(), balance_checkpoints.c.transaction_id.desc())
+            .limit(1)
+        )
+        checkpoint = await database.fetch_one(query)
+        if not checkpoint:
+            query = sa.select(accounts.c.id).where(accounts.c.id == account_id)
+            if await database.fetch_val(query) is None:
+                raise AccountNotFoundError
+            # The account did not exist yet.
+            return 0.0
+
+        # At most balance_checkpoint_interval rows lie between the checkpoint and the next one.
+        signed_amount = sa.case(
+            (ledger.c.type == TransactionType.WITHDRAWAL, -ledger.c.amount),
+            else_=ledger.c.amount,
+        )
+        query = sa.select(sa.func.coalesce(sa.func.sum(signed_amount), 0)).where(
+            ledger.c.account_id == account_id,
+            self.__after(checkpoint.timestamp, checkpoint.transaction_id),
+            ledger.c.timestamp <= at if inclusive else ledger.c.timestamp < at,
+        )
+        return round(float(checkpoint.balance) + float(await database.fetch_val(query)), 2)
+
+    async def read_statement(self, account_id: int, start: datetime, end: datetime) -> dict:
+        return {
+            "account_id": account_id,
+            "from": start,
+            "to": end,
+            "opening_balance": await self.read_balance(account_id, start, inclusive=False),
+            "closing_balance": await self.read_balance(account_id, end),
+        }
+
     async def create(self, transaction: TransactionIn) -> Record:
-        query = accounts.select().where(accounts.c.id == transaction.account_id)
-        account = await database.fetch_one(query)
+        if settings.group_commit_enabled:
+            return await group_committer.submit(transaction)
+        if settings.write_sequencing_enabled:
+            async with sequencer.sequence(transaction.account_id):
+                return await self.__create(transaction)
+        return await self.__create(transaction)
+
+    async def create_many(self, items: list[TransactionIn], atomic: bool = False) -> list[Record | Exception]:
+        """Applies ``items`` in order within one DB transaction, locking their accounts in id order.
+
+        Rejected items are returned as exceptions in their place; with ``atomic`` the first rejection is
+        raised instead and nothing is applied.
+        """
+        if settings.write_sequencing_enabled:
+            async with sequencer.sequence(*{item.account_id for item in items}):
+                results = await self.__create_many(items, atomic)
+        else:
+            results = await self.__create_many(items, atomic)
+
+        await AccountService().invalidate(
+            *{item.account_id for item, result in zip(items, results) if not isinstance(result, Exception)}
+        )
+        return results
+
+    async def __create(self, transaction: TransactionIn) -> Record:
+        if database.url.dialect == "postgresql":
+            result = await self.__apply_in_one_statement(transaction)
+        else:
+            result = await self.__apply_step_by_step(transaction)
+
+        if not result:
+            await self.__raise_rejection(transaction)
+
+        await AccountService().invalidate(transaction.account_id)
+        return result
+
+    @database.transaction()
+    async def __create_many(self, items: list[TransactionIn], atomic: bool) -> list[Record | Exception]:
+        locked = await self.__lock_accounts({item.account_id for item in items})
+        balances = {id: float(account.balance) for id, account in locked.items()}
+        counts = {id: account.transaction_count for id, account in locked.items()}
+        today = self.__today()
+        withdrawn = {id: self.__withdrawn_on(account, today) for id, account in locked.items()}
+
+        results: list[Record | Exception | None] = [None] * len(items)
+        accepted: list[int] = []
+        checkpoints: dict[int, float] = {}
+        for index, item in enumerate(items):
+            if item.account_id not in balances:
+                results[index] = AccountNotFoundError()
+                continue
+
+            amount = -item.amount if item.type == TransactionType.WITHDRAWAL else item.amount
+            if round(balances[item.account_id] + amount, 2) < 0:
+                results[index] = BusinessError("Operation not carried out due to lack of balance")
+                continue
+            if item.type == TransactionType.WITHDRAWAL:
+                if self.__exceeds_daily_limits(locked[item.account_id], *withdrawn[item.account_id], item.amount):
+                    results[index] = BusinessError("Operation not carried out due to daily withdrawal limit")
+                    continue
+                count, total = withdrawn[item.account_id]
+                withdrawn[item.account_id] = (count + 1, round(total + item.amount, 2))
+
+            balances[item.account_id] = round(balances[item.account_id] + amount, 2)
+            counts[item.account_id] += 1
+            if counts[item.account_id] % settings.balance_checkpoint_interval == 0:
+                checkpoints[index] = balances[item.account_id]
+            accepted.append(index)
+
+        if atomic and len(accepted) < len(items):
+            raise next(result for result in results if isinstance(result, Exception))
+        if not accepted:
+            return results
+
+        for account_id in sorted({items[index].account_id for index in accepted}):
+            command = (
+                accounts.update()
+                .where(
+                    accounts.c.id == account_id, accounts.c.transaction_count == locked[account_id].transaction_count
+                )
+                .values(
+                    balance=balances[account_id],
+                    transaction_count=counts[account_id],
+                    withdrawal_day=today,
+                    withdrawal_day_count=withdrawn[account_id][0],
+                    withdrawal_day_total=withdrawn[account_id][1],
+                )
+            )
+            # Only reachable on backends without row locks, when a concurrent write landed after the read.
+            if await self.__update_account(command, account_id) is None:
+                raise BusinessError("Account balance changed concurrently, batch not carried out")
+
+        rows = await self.__insert_transactions(
+            [
+                {"account_id": items[index].account_id, "type": items[index].type, "amount": items[index].amount}
+                for index in accepted
+            ]
+        )
+        stats: dict[int, dict] = {}
+        for index, row in zip(accepted, rows):
+            results[index] = row
+            delta = self.__stats_delta(items[index])
+            totals = stats.setdefault(row.account_id, dict.fromkeys(delta, 0))
+            for column, value in delta.items():
+                totals[column] = round(totals[column] + value, 2)
+            totals["last_activity_at"] = row.timestamp
+        command = self.__upsert_stats(
+            self.__stats_insert().values([{"account_id": id, **totals} for id, totals in sorted(stats.items())])
+        )
+        await database.execute(command)
+
+        if checkpoints:
+            command = balance_checkpoints.insert().values(
+                [
+                    {
+                        "account_id": results[index].account_id,
+                        "transaction_id": results[index].id,
+                        "timestamp": results[index].timestamp,
+                        "balance": balance,
+                    }
+                    for index, balance in checkpoints.items()
+                ]
+            )
+            await database.execute(command)
+        return results
+
+    async def __lock_accounts(self, account_ids: set[int]) -> dict[int, Record]:
+        if database.url.dialect == "sqlite":
+            # SQLite ignores FOR UPDATE; a no-op write takes the database write lock before the read, so
+            # concurrent batches queue up instead of deadlocking when both try to upgrade a read lock.
+            await database.execute(accounts.update().where(accounts.c.id.in_(account_ids)).values(id=accounts.c.id))
+        query = (
+            sa.select(accounts.c.id, accounts.c.balance, accounts.c.transaction_count, *self.__withdrawal_columns())
+            .where(accounts.c.id.in_(account_ids))
+            .order_by(accounts.c.id)
+            .with_for_update()
+        )
+        return {row.id: row for row in await database.fetch_all(query)}
+
+    async def __apply_in_one_statement(self, transaction: TransactionIn) -> Record | None:
+        # The balance update, the ledger insert, the periodic checkpoint and the stats are chained
+        # data-modifying CTEs, so the ledger row only exists when the conditional update matched, in one
+        # round trip.
+        updated_account = (
+            self.__update_account_balance(transaction)
+            .returning(accounts.c.id, accounts.c.balance, accounts.c.transaction_count)
+            .cte("updated_account")
+        )
+        inserted_transaction = (
+            transactions.insert()
+            .from_select(
+                ["account_id", "type", "amount"],
+                sa.select(
+                    updated_account.c.id,
+                    sa.literal(transaction.type, transactions.c.type.type),
+                    sa.literal(transaction.amount, transactions.c.amount.type),
+                ),
+            )
+            .returning(transactions)
+            .cte("inserted_transaction")
+        )
+        checkpoint = (
+            balance_checkpoints.insert()
+            .from_select(
+                ["account_id", "transaction_id", "timestamp", "balance"],
+                sa.select(
+                    inserted_transaction.c.account_id,
+                    inserted_transaction.c.id,
+                    inserted_transaction.c.timestamp,
+                    updated_account.c.balance,
+                ).where(updated_account.c.transaction_count % settings.balance_checkpoint_interval == 0),
+            )
+            .cte("checkpoint")
+        )
+        delta = self.__stats_delta(transaction)
+        stats = self.__upsert_stats(
+            self.__stats_insert().from_select(
+                ["account_id", *delta, "last_activity_at"],
+                sa.select(
+                    inserted_transaction.c.account_id,
+                    *(sa.literal(value, account_stats.c[column].type) for column, value in delta.items()),
+                    inserted_transaction.c.timestamp,
+                ),
+            )
+        ).cte("stats")
+        return await database.fetch_one(sa.select(inserted_transaction).add_cte(checkpoint).add_cte(stats))
+
+    @database.transaction()
+    async def __apply_step_by_step(self, transaction: TransactionIn) -> Record | None:
+        account = await self.__update_account(self.__update_account_balance(transaction), transaction.account_id)
         if not account:
-            raise AccountNotFoundError
+            return None
+
+        [result] = await self.__insert_transactions(
+            [{"account_id": transaction.account_id, "type": transaction.type, "amount": transaction.amount}]
+        )
+        command = self.__upsert_stats(
+            self.__stats_insert().values(
+                account_id=result.account_id, **self.__stats_delta(transaction), last_activity_at=result.timestamp
+            )
+        )
+        await database.execute(command)
+
+        if account.transaction_count % settings.balance_checkpoint_interval == 0:
+            command = balance_checkpoints.insert().values(
+                account_id=result.account_id,
+                transaction_id=result.id,
+                timestamp=result.timestamp,
+                balance=account.balance,
+            )
+            await database.execute(command)
+        return result
+
+    async def __update_account(self, command: sa.Update, account_id: int) -> Record | None:
+        """Runs ``command`` against one account and returns the balance and count it left, or None when
+        no row matched. Must run inside a transaction."""
+        columns = (accounts.c.id, accounts.c.balance, accounts.c.transaction_count)
+        if supports_returning:
+            return await database.fetch_one(command.returning(*columns))
+
+        await database.execute(command)
+        # changes() reports the rows touched by the previous statement on this connection.
+        if not await database.fetch_val(sa.select(sa.func.changes())):
+            return None
+        return await database.fetch_one(sa.select(*columns).where(accounts.c.id == account_id))
+
+    async def __insert_transactions(self, values: list[dict]) -> list[Record]:
+        """Inserts ledger rows and returns them in ``values`` order. Must run inside a transaction."""
+        if supports_returning:
+            command = transactions.insert().values(values).returning(transactions)
+            # RETURNING order is not guaranteed, but ids are assigned in VALUES order.
+            return sorted(await database.fetch_all(command), key=lambda row: row.id)
+
+        ids = [await database.execute(transactions.insert().values(**row)) for row in values]
+        query = transactions.select().where(transactions.c.id.in_(ids)).order_by(transactions.c.id)
+        return await database.fetch_all(query)
+
+    def __stats_insert(self) -> postgresql.Insert | sqlite.Insert:
+        insert = postgresql.insert if database.url.dialect == "postgresql" else sqlite.insert
+        return insert(account_stats)
 
+    def __upsert_stats(self, command: postgresql.Insert | sqlite.Insert) -> postgresql.Insert | sqlite.Insert:
+        """Adds the inserted totals to the account's row, creating it on the first transaction."""
+        return command.on_conflict_do_update(
+            index_elements=[account_stats.c.account_id],
+            set_={
+                "deposit_total": account_stats.c.deposit_total + command.excluded.deposit_total,
+                "withdrawal_total": account_stats.c.withdrawal_total + command.excluded.withdrawal_total,
+                "deposit_count": account_stats.c.deposit_count + command.excluded.deposit_count,
+                "withdrawal_count": account_stats.c.withdrawal_count + command.excluded.withdrawal_count,
+                "last_activity_at": command.excluded.last_activity_at,
+            },
+        )
+
+    def __stats_delta(self, transaction: TransactionIn) -> dict[str, float]:
+        deposit = transaction.type == TransactionType.DEPOSIT
+        return {
+            "deposit_total": transaction.amount if deposit else 0,
+            "withdrawal_total": 0 if deposit else transaction.amount,
+            "deposit_count": int(deposit),
+            "withdrawal_count": int(not deposit),
+        }
+
+    def __update_account_balance(self, transaction: TransactionIn) -> sa.Update:
+        command = accounts.update().where(accounts.c.id == transaction.account_id)
         if transaction.type == TransactionType.WITHDRAWAL:
-            balance = float(account.balance) - transaction.amount
-            if balance < 0:
-                raise BusinessError("Operation not carried out due to lack of balance")
+            # The day's counters live on the account row, so the conditional update that takes its lock also
+            # checks and bumps them: no scan of the ledger, and concurrent workers queue on the same row.
+            today = self.__today()
+            same_day = accounts.c.withdrawal_day == today
+            count = sa.case((same_day, accounts.c.withdrawal_day_count), else_=0)
+            total = sa.case((same_day, accounts.c.withdrawal_day_total), else_=0)
+            count_limit, amount_limit = self.__daily_limits(accounts.c)
+            command = command.where(
+                accounts.c.balance >= transaction.amount,
+                sa.or_(count_limit.is_(None), count < count_limit),
+                sa.or_(amount_limit.is_(None), total + transaction.amount <= amount_limit),
+            ).values(
+                balance=accounts.c.balance - transaction.amount,
+                withdrawal_day=today,
+                withdrawal_day_count=count + 1,
+                withdrawal_day_total=total + transaction.amount,
+            )
         else:
-            balance = float(account.balance) + transaction.amount
+            command = command.values(balance=accounts.c.balance + transaction.amount)
+        return command.values(transaction_count=accounts.c.transaction_count + 1)
 
-        # Create transaction entry
-        transaction_id = await self.__register_transaction(transaction)
-        # Update account balance
-        await self.__update_account_balance(transaction.account_id, balance)
+    def __withdrawal_columns(self) -> tuple[sa.Column, ...]:
+        return (
+            accounts.c.daily_withdrawal_count_limit,
+            accounts.c.daily_withdrawal_amount_limit,
+            accounts.c.withdrawal_day,
+            accounts.c.withdrawal_day_count,
+            accounts.c.withdrawal_day_total,
+        )
 
-        query = transactions.select().where(transactions.c.id == transaction_id)
-        return await database.fetch_one(query)
+    def __daily_limits(self, account: Record | sa.ColumnCollection) -> tuple:
+        """The account's own limits, or the settings' where it has none; works on rows and on columns."""
+        limits = []
+        for own, default in (
+            (account.daily_withdrawal_count_limit, settings.daily_withdrawal_count_limit),
+            (account.daily_withdrawal_amount_limit, settings.daily_withdrawal_amount_limit),
+        ):
+            if default is None:
+                limits.append(own)
+            elif isinstance(own, sa.ColumnElement):
+                limits.append(sa.func.coalesce(own, default))
+            else:
+                limits.append(default if own is None else own)
+        return tuple(limits)
 
-    async def __update_account_balance(self, account_id: int, balance: float) -> None:
-        command = accounts.update().where(accounts.c.id == account_id).values(balance=balance)
-        await database.execute(command)
+    def __withdrawn_on(self, account: Record, day: date) -> tuple[int, float]:
+        if account.withdrawal_day != day:
+            return 0, 0.0
+        return account.withdrawal_day_count, float(account.withdrawal_day_total)
 
-    async def __register_transaction(self, transaction: TransactionIn) -> int:
-        command = transactions.insert().values(
-            account_id=transaction.account_id,
-            type=transaction.type,
-            amount=transaction.amount,
+    def __exceeds_daily_limits(self, account: Record, count: int, total: float, amount: float) -> bool:
+        count_limit, amount_limit = self.__daily_limits(account)
+        return (count_limit is not None and count >= count_limit) or (
+            amount_limit is not None and round(total + amount, 2) > float(amount_limit)
         )
-        return await database.execute(command)
+
+    def __today(self) -> date:
+        return datetime.now(timezone.utc).date()
+
+    def __utc(self, at: datetime) -> datetime:
+        return at.astimezone(timezone.utc) if at.tzinfo else at.replace(tzinfo=timezone.utc)
+
+    def __after(self, timestamp: datetime, id: int) -> sa.ColumnElement[bool]:
+        return _after(sa.literal(timestamp, ledger.c.timestamp.type), sa.literal(id, sa.Integer))
+
+    async def __raise_rejection(self, transaction: TransactionIn) -> None:
+        query = sa.select(accounts.c.balance, *self.__withdrawal_columns()).where(
+            accounts.c.id == transaction.account_id
+        )
+        account = await database.fetch_one(query)
+        if account is None:
+            raise AccountNotFoundError
+        if float(account.balance) >= transaction.amount and self.__exceeds_daily_limits(
+            account, *self.__withdrawn_on(account, self.__today()), transaction.amount
+        ):
+            raise BusinessError("Operation not carried out due to daily withdrawal limit")
+        raise BusinessError("Operation not carried out due to lack of balance")
+
+
+group_committer = GroupCommitter(
+    handler=TransactionService().create_many,
+    window=settings.group_commit_window_ms / 1000,
+    max_items=settings.group_commit_max_items,
+)
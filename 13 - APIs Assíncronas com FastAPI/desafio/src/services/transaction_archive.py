@@ -0,0 +1,67 @@
+import asyncio
+from datetime import datetime, timezone
+
+import sqlalchemy as sa
+
+from src.database import database
+from src.models.transaction import transactions
+from src.models.transaction_archive import transactions_archive
+
+
+class TransactionArchiveService:
+    async def archive(self, before: datetime, batch_size: int, pause: float = 0.0) -> int:
+        """Moves the transactions older than ``before`` to ``transactions_archive`` and returns how many
+        were moved.
+
+        Each batch of ``batch_size`` rows is its own DB transaction, so locks are only held briefly, and
+        ``pause`` seconds between batches leave room for regular writes.
+        """
+        before = before.astimezone(timezone.utc) if before.tzinfo else before.replace(tzinfo=timezone.utc)
+        moved = 0
+        while True:
+            if database.url.dialect == "postgresql":
+                count = await self.__archive_in_one_statement(before, batch_size)
+            else:
+                count = await self.__archive_step_by_step(before, batch_size)
+            moved += count
+            if count < batch_size:
+                return moved
+            await asyncio.sleep(pause)
+
+    def __batch(self, before: datetime, batch_size: int) -> sa.Select:
+        # Ids follow insertion order, so the oldest rows sit at the start of the primary key index.
+        return (
+            sa.select(transactions.c.id)
+            .where(transactions.c.timestamp < before)
+            .order_by(transactions.c.id)
+            .limit(batch_size)
+        )
+
+    async def __archive_in_one_statement(self, before: datetime, batch_size: int) -> int:
+        # Rows locked by a concurrent statement are left for the next run instead of waited on.
+        batch = self.__batch(before, batch_size).with_for_update(skip_locked=True).cte("batch")
+        deleted = (
+            transactions.delete()
+            .where(transactions.c.timestamp < before, transactions.c.id.in_(sa.select(batch.c.id)))
+            .returning(*transactions.c)
+            .cte("deleted")
+        )
+        archived = (
+            transactions_archive.insert()
+            .from_select([column.name for column in transactions.c], sa.select(deleted))
+            .returning(transactions_archive.c.id)
+            .cte("archived")
+        )
+        return await database.fetch_val(sa.select(sa.func.count()).select_from(archived))
+
+    @database.transaction()
+    async def __archive_step_by_step(self, before: datetime, batch_size: int) -> int:
+        # The insert comes first so the write lock is taken before anything is read.
+        batch = self.__batch(before, batch_size)
+        command = transactions_archive.insert().from_select(
+            [column.name for column in transactions.c], transactions.select().where(transactions.c.id.in_(batch))
+        )
+        await database.execute(command)
+        await database.execute(transactions.delete().where(transactions.c.id.in_(batch)))
+        # changes() reports the rows touched by the previous statement on this connection.
+        return await database.fetch_val(sa.select(sa.func.changes()))
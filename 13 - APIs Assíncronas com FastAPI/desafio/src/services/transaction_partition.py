@@ -0,0 +1,116 @@
+from datetime import date, datetime, timezone
+
+from src.database import database
+
+
+def add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"transactions_{month.year}_{month.month:02d}"
+
+
+class TransactionPartitionService:
+    """Monthly range partitions of ``transactions`` on PostgreSQL.
+
+    Partitions are named ``transactions_YYYY_MM`` and cover ``[first day, first day of next month)`` in
+    UTC. Rows outside every partition land in ``transactions_default``, which must stay empty for a
+    month to be created later, so partitions are created ahead of time.
+    """
+
+    async def partition(self, months: int) -> dict:
+        """Converts an unpartitioned ``transactions`` table, moving its rows, and creates the partitions
+        from its first month to ``months`` ahead. Forward-only: does nothing when the table is already
+        partitioned, or off PostgreSQL.
+
+        Runs in one transaction holding ``transactions`` exclusively, so writes wait until it is done.
+        """
+        if database.url.dialect != "postgresql":
+            return {"partitioned": False, "moved": 0, "created": []}
+
+        async with database.transaction():
+            # Checked under the lock, so two runs at once cannot both convert the table.
+            await database.execute("LOCK TABLE transactions IN ACCESS EXCLUSIVE MODE")
+            if await self.__is_partitioned():
+                return {"partitioned": False, "moved": 0, "created": []}
+
+            await database.execute("ALTER TABLE transactions RENAME TO transactions_unpartitioned")
+            await database.execute(
+                "ALTER TABLE transactions_unpartitioned RENAME CONSTRAINT transactions_pkey "
+                "TO transactions_unpartitioned_pkey"
+            )
+            await database.execute(
+                "ALTER INDEX ix_transactions_account_id_timestamp_id "
+                "RENAME TO ix_transactions_unpartitioned_account_id_timestamp_id"
+            )
+            # Unique constraints on a partitioned table must include the partition key.
+            await database.execute(
+                """
+                CREATE TABLE transactions (
+                    id INTEGER NOT NULL DEFAULT nextval('transactions_id_seq'),
+                    account_id INTEGER NOT NULL REFERENCES accounts (id),
+                    type transaction_types NOT NULL,
+                    amount NUMERIC(10, 2) NOT NULL,
+                    timestamp TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT clock_timestamp(),
+                    PRIMARY KEY (id, timestamp)
+                ) PARTITION BY RANGE (timestamp)
+                """
+            )
+            await database.execute(
+                "CREATE INDEX ix_transactions_account_id_timestamp_id ON transactions "
+                "(account_id, timestamp, id) INCLUDE (type, amount)"
+            )
+            # Catches rows outside the monthly partitions instead of failing the insert; it must be empty
+            # for the months it would overlap to be created, hence the partitions created ahead.
+            await database.execute("CREATE TABLE transactions_default PARTITION OF transactions DEFAULT")
+
+            first = await database.fetch_val("SELECT min(timestamp) FROM transactions_unpartitioned")
+            current = datetime.now(timezone.utc).date().replace(day=1)
+            month = min(first.astimezone(timezone.utc).date().replace(day=1), current) if first else current
+            created = []
+            while month <= add_months(current, months):
+                await self.__create_partition(month)
+                created.append(partition_name(month))
+                month = add_months(month, 1)
+
+            # Rows without a timestamp sorted last before, and now() keeps them there.
+            moved = await database.fetch_val("SELECT count(*) FROM transactions_unpartitioned")
+            await database.execute(
+                """
+                INSERT INTO transactions (id, account_id, type, amount, timestamp)
+                SELECT id, account_id, type, amount, COALESCE(timestamp, now()) FROM transactions_unpartitioned
+                """
+            )
+            # The id sequence belongs to the old table's column and would be dropped with it.
+            await database.execute("ALTER SEQUENCE transactions_id_seq OWNED BY transactions.id")
+            await database.execute("DROP TABLE transactions_unpartitioned")
+        return {"partitioned": True, "moved": moved, "created": created}
+
+    async def create_ahead(self, months: int, today: date | None = None) -> list[str]:
+        """Creates the missing partitions from the current month to ``months`` ahead and returns their
+        names. Does nothing unless ``transactions`` is partitioned."""
+        if database.url.dialect != "postgresql" or not await self.__is_partitioned():
+            return []
+
+        current = (today or datetime.now(timezone.utc).date()).replace(day=1)
+        created = []
+        for offset in range(months + 1):
+            month = add_months(current, offset)
+            name = partition_name(month)
+            if await database.fetch_val(f"SELECT to_regclass('{name}') IS NOT NULL"):
+                continue
+            await self.__create_partition(month)
+            created.append(name)
+        return created
+
+    async def __create_partition(self, month: date) -> None:
+        await database.execute(
+            f"CREATE TABLE IF NOT EXISTS {partition_name(month)} PARTITION OF transactions "
+            f"FOR VALUES FROM ('{month.isoformat()} 00:00+00') TO ('{add_months(month, 1).isoformat()} 00:00+00')"
+        )
+
+    async def __is_partitioned(self) -> bool:
+        query = "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass('transactions'))"
+        return await database.fetch_val(query)
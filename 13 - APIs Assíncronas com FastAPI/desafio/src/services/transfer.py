@@ -0,0 +1,22 @@
+from databases.interfaces import Record
+
+from src.models.transaction import TransactionType
+from src.schemas.transaction import TransactionIn
+from src.schemas.transfer import TransferIn
+from src.services.transaction import TransactionService
+
+
+class TransferService:
+    async def create(self, transfer: TransferIn) -> dict[str, Record]:
+        # Both ledger rows go through one atomic batch: the accounts are locked in id order whatever
+        # the direction, so opposite transfers between the same accounts cannot deadlock.
+        withdrawal, deposit = await TransactionService().create_many(
+            [
+                TransactionIn(
+                    account_id=transfer.from_account_id, type=TransactionType.WITHDRAWAL, amount=transfer.amount
+                ),
+                TransactionIn(account_id=transfer.to_account_id, type=TransactionType.DEPOSIT, amount=transfer.amount),
+            ],
+            atomic=True,
+        )
+        return {"withdrawal": withdrawal, "deposit": deposit}
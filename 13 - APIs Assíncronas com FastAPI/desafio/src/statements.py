@@ -0,0 +1,61 @@
+from collections.abc import Callable, Hashable, Iterable
+from typing import Any
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import registry
+
+from src.database import database
+
+
+class Precompiled:
+    """A SELECT compiled to SQL once per dialect and variant, then run with new bind values.
+
+    ``build`` returns the statement with ``sa.bindparam`` placeholders; positional arguments pick a
+    variant of it (for example, whether an optional filter applies) and are passed on to ``build``.
+    Calls return a textual statement, so ``databases`` only substitutes the parameters instead of
+    compiling the expression tree on every request. Bind and result types are carried over, so
+    values are converted exactly as with the original statement. ``variants`` lists every combination
+    ``build`` accepts, so ``warm`` can compile them all before the first request needs one.
+    """
+
+    def __init__(self, build: Callable[..., sa.Select], variants: Iterable[tuple] = ((),)) -> None:
+        self.build = build
+        self.variants = list(variants)
+        self._statements: dict[tuple, sa.TextualSelect] = {}
+
+    def __call__(self, *variant: Hashable, **values: Any) -> sa.TextualSelect:
+        return self.compile(*variant).bindparams(**values)
+
+    def compile(self, *variant: Hashable) -> sa.TextualSelect:
+        key = (database.url.dialect, *variant)
+        statement = self._statements.get(key)
+        if statement is None:
+            statement = self._statements[key] = self.__compile(*variant)
+        return statement
+
+    def warm(self) -> int:
+        for variant in self.variants:
+            self.compile(*variant)
+        return len(self.variants)
+
+    def clear(self) -> None:
+        self._statements.clear()
+
+    def __compile(self, *variant: Hashable) -> sa.TextualSelect:
+        select = self.build(*variant)
+        # text() parses named parameters back; the backend then renders its own paramstyle.
+        compiled = select.compile(dialect=registry.load(database.url.dialect)(paramstyle="named"))
+        binds = [sa.bindparam(name, bind.value, type_=bind.type) for bind, name in compiled.bind_names.items()]
+        return sa.text(compiled.string).bindparams(*binds).columns(*select.selected_columns)
+
+
+# Every precompiled statement by name, e.g. to compile them all ahead of the first request.
+statements: dict[str, Precompiled] = {}
+
+
+def precompiled(name: str, variants: Iterable[tuple] = ((),)) -> Callable[[Callable[..., sa.Select]], Precompiled]:
+    def register(build: Callable[..., sa.Select]) -> Precompiled:
+        statements[name] = Precompiled(build, variants)
+        return statements[name]
+
+    return register
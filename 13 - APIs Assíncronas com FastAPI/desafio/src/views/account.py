@@ -1,4 +1,6 @@
-from pydantic import AwareDatetime, BaseModel, NaiveDatetime, PositiveFloat
+from pydantic import AwareDatetime, BaseModel, Field, NaiveDatetime, PositiveFloat
+
+from src.serialization import ListEncoder
 
 
 class AccountOut(BaseModel):
@@ -6,6 +8,8 @@ class AccountOut(BaseModel):
     user_id: int
     balance: float
     created_at: AwareDatetime | NaiveDatetime
+    daily_withdrawal_count_limit: int | None = None
+    daily_withdrawal_amount_limit: float | None = None
 
 
 class TransactionOut(BaseModel):
@@ -14,3 +18,33 @@ class TransactionOut(BaseModel):
     type: str
     amount: PositiveFloat
     timestamp: AwareDatetime | NaiveDatetime
+
+
+class BalanceOut(BaseModel):
+    account_id: int
+    at: AwareDatetime | NaiveDatetime
+    balance: float
+
+
+class StatementOut(BaseModel):
+    account_id: int
+    from_: AwareDatetime | NaiveDatetime = Field(alias="from")
+    to: AwareDatetime | NaiveDatetime
+    opening_balance: float
+    closing_balance: float
+
+
+class AccountSummaryOut(BaseModel):
+    account_id: int
+    deposit_total: float
+    withdrawal_total: float
+    deposit_count: int
+    withdrawal_count: int
+    last_activity_at: AwareDatetime | NaiveDatetime | None
+
+
+account_list_encoder = ListEncoder(
+    AccountOut,
+    {"balance": float, "daily_withdrawal_amount_limit": lambda value: None if value is None else float(value)},
+)
+transaction_list_encoder = ListEncoder(TransactionOut, {"amount": float})
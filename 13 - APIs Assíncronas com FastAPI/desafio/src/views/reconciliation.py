@@ -0,0 +1,17 @@
+from pydantic import AwareDatetime, BaseModel, NaiveDatetime
+
+
+class AccountDriftOut(BaseModel):
+    account_id: int
+    transaction_id: int
+    balance: float
+    drift: float
+    count_drift: int
+    checked_at: AwareDatetime | NaiveDatetime
+
+
+class ReconciliationOut(BaseModel):
+    checked_accounts: int
+    drifted_accounts: int
+    last_checked_at: AwareDatetime | NaiveDatetime | None
+    accounts: list[AccountDriftOut]
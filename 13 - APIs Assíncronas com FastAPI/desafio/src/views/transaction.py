@@ -1,3 +1,5 @@
+from typing import Any
+
 from pydantic import AwareDatetime, BaseModel, NaiveDatetime, PositiveFloat
 
 
@@ -7,3 +9,10 @@ class TransactionOut(BaseModel):
     type: str
     amount: PositiveFloat
     timestamp: AwareDatetime | NaiveDatetime
+
+
+class TransactionBatchItemOut(BaseModel):
+    index: int
+    status_code: int
+    transaction: TransactionOut | None = None
+    detail: Any = None
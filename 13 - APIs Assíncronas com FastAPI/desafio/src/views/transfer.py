@@ -0,0 +1,8 @@
+from pydantic import BaseModel
+
+from src.views.transaction import TransactionOut
+
+
+class TransferOut(BaseModel):
+    withdrawal: TransactionOut
+    deposit: TransactionOut
@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+
+from src.config import settings
+
+settings.database_url = "sqlite:///tests.db"
+
+
+@pytest_asyncio.fixture
+async def db(request):
+    from src.database import database, engine, metadata  # noqa
+    from src.models.account import accounts  # noqa
+    from src.models.account_stats import account_stats  # noqa
+    from src.models.balance_checkpoint import balance_checkpoints  # noqa
+    from src.models.ledger_reconciliation import ledger_reconciliation  # noqa
+    from src.models.transaction import transactions  # noqa
+    from src.models.transaction_archive import transactions_archive  # noqa
+
+    await database.connect()
+    metadata.create_all(engine)
+
+    def teardown():
+        async def _teardown():
+            from src.cache import account_cache
+            from src.coalescing import coalescer
+            from src.ratelimit import rate_limit_store
+
+            await database.disconnect()
+            metadata.drop_all(engine)
+            account_cache.clear()
+            coalescer.clear()
+            rate_limit_store.clear()
+
+        asyncio.run(_teardown())
+
+    request.addfinalizer(teardown)
+
+
+@pytest_asyncio.fixture
+async def client(db):
+    from src.main import app
+
+    transport = ASGITransport(app=app)
+    headers = {
+        "Accept": "application/json",
+        "Content-Type": "application/json",
+    }
+    async with AsyncClient(base_url="http://test", transport=transport, headers=headers) as client:
+        yield client
+
+
+@pytest_asyncio.fixture
+async def access_token(client: AsyncClient):
+    response = await client.post("/auth/login", json={"user_id": 1})
+    return response.json()["access_token"]
+
+
+@pytest.fixture
+def round_trips(mocker):
+    """Counts the statements sent to the database from the moment the fixture is requested."""
+    from src.database import database
+
+    spies = [
+        mocker.spy(database, name)
+        for name in ("execute", "execute_many", "fetch_all", "fetch_one", "fetch_val", "iterate")
+    ]
+    return lambda: sum(spy.call_count for spy in spies)
@@ -0,0 +1,60 @@
+from fastapi import status
+from httpx import AsyncClient
+
+
+async def test_create_account_success(client: AsyncClient, access_token: str):
+    # Given
+    headers = {"Authorization": f"Bearer {access_token}"}
+    data = {"user_id": 1, "balance": 100}
+
+    # When
+    response = await client.post("/accounts/", json=data, headers=headers)
+
+    # Then
+    content = response.json()
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert content["id"] is not None
+    assert content["balance"] == 100
+    assert content["created_at"] is not None
+
+
+async def test_create_account_round_trips(client: AsyncClient, access_token: str, round_trips):
+    # Given
+    from src.database import database
+
+    headers = {"Authorization": f"Bearer {access_token}"}
+    data = {"user_id": 1, "balance": 100}
+
+    # When
+    response = await client.post("/accounts/", json=data, headers=headers)
+
+    # Then
+    assert response.status_code == status.HTTP_201_CREATED
+    # PostgreSQL chains the opening checkpoint into the insert; elsewhere it is a second statement.
+    assert round_trips() == (1 if database.url.dialect == "postgresql" else 2)
+
+
+async def test_create_account_without_returning_success(client: AsyncClient, access_token: str, mocker):
+    # Given
+    mocker.patch("src.services.account.supports_returning", False)
+    headers = {"Authorization": f"Bearer {access_token}"}
+    data = {"user_id": 1, "balance": 100}
+
+    # When
+    response = await client.post("/accounts/", json=data, headers=headers)
+
+    # Then
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.json()["balance"] == 100
+
+
+async def test_create_account_not_authenticated_fail(client: AsyncClient):
+    # Given
+    data = {"user_id": 1, "balance": 100}
+
+    # When
+    response = await client.post("/accounts/", json=data, headers={})
+
+    # Then
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,105 @@
+import csv
+import io
+import json
+
+import pytest_asyncio
+from fastapi import status
+from httpx import AsyncClient
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def populate_transactions(db):
+    from src.schemas.account import AccountIn
+    from src.schemas.transaction import TransactionIn
+    from src.services.account import AccountService
+    from src.services.transaction import TransactionService
+
+    await AccountService().create(AccountIn(user_id=1, balance=100))
+    service = TransactionService()
+    for amount in range(1, 4):
+        await service.create(TransactionIn(account_id=1, type="deposit", amount=amount))
+    await service.create(TransactionIn(account_id=1, type="withdrawal", amount=0.5))
+
+
+async def test_export_account_transactions_ndjson_success(client: AsyncClient, access_token: str):
+    # Given
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    # When
+    response = await client.get("/accounts/1/transactions/export", headers=headers)
+
+    # Then
+    rows = [json.loads(line) for line in response.text.splitlines()]
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["Content-Type"] == "application/x-ndjson"
+    assert [(row["type"], row["amount"]) for row in rows] == [
+        ("deposit", 1),
+        ("deposit", 2),
+        ("deposit", 3),
+        ("withdrawal", 0.5),
+    ]
+
+
+async def test_export_account_transactions_archived_success(client: AsyncClient, access_token: str):
+    # Given
+    from datetime import datetime, timedelta, timezone
+
+    from src.services.transaction_archive import TransactionArchiveService
+
+    headers = {"Authorization": f"Bearer {access_token}"}
+    archived = await TransactionArchiveService().archive(
+        before=datetime.now(timezone.utc) + timedelta(days=1), batch_size=3
+    )
+
+    # When
+    response = await client.get("/accounts/1/transactions/export", headers=headers)
+
+    # Then
+    rows = [json.loads(line) for line in response.text.splitlines()]
+
+    assert archived == 4
+    assert response.status_code == status.HTTP_200_OK
+    assert [row["id"] for row in rows] == [1, 2, 3, 4]
+    assert [row["amount"] for row in rows] == [1, 2, 3, 0.5]
+
+
+async def test_export_account_transactions_csv_success(client: AsyncClient, access_token: str, mocker):
+    # Given
+    mocker.patch("src.export.CHUNK_ROWS", 3)
+    params = {"format": "csv"}
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    # When
+    response = await client.get("/accounts/1/transactions/export", params=params, headers=headers)
+
+    # Then
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["Content-Type"].startswith("text/csv")
+    assert 'filename="account-1-transactions.csv"' in response.headers["Content-Disposition"]
+    assert [row["amount"] for row in rows] == ["1.0", "2.0", "3.0", "0.5"]
+
+
+async def test_export_account_transactions_invalid_format_fail(client: AsyncClient, access_token: str):
+    # Given
+    params = {"format": "xml"}
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    # When
+    response = await client.get("/accounts/1/transactions/export", params=params, headers=headers)
+
+    # Then
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_export_account_transactions_account_not_found_fail(client: AsyncClient, access_token: str):
+    # Given
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    # When
+    response = await client.get("/accounts/2/transactions/export", headers=headers)
+
+    # Then
+    assert response.status_code == status.HTTP_404_NOT_FOUND
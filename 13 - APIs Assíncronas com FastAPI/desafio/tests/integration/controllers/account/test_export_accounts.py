@@ -0,0 +1,62 @@
+import json
+
+import pytest_asyncio
+from fastapi import status
+from httpx import AsyncClient
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def populate_accounts(db):
+    from src.schemas.account import AccountIn
+    from src.services.account import AccountService
+
+    service = AccountService()
+    await service.create(AccountIn(user_id=1, balance=100))
+    await service.create(AccountIn(user_id=2, balance=10.5))
+
+
+async def test_export_accounts_ndjson_success(client: AsyncClient, access_token: str, mocker):
+    # Given
+    from src.config import settings
+
+    mocker.patch.object(settings, "admin_user_ids", [1])
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    # When
+    response = await client.get("/accounts/all", headers=headers)
+
+    # Then
+    rows = [json.loads(line) for line in response.text.splitlines()]
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["Content-Type"] == "application/x-ndjson"
+    assert [(row["id"], row["user_id"], row["balance"]) for row in rows] == [(1, 1, 100), (2, 2, 10.5)]
+
+
+async def test_export_accounts_csv_success(client: AsyncClient, access_token: str, mocker):
+    # Given
+    from src.config import settings
+
+    mocker.patch.object(settings, "admin_user_ids", [1])
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    # When
+    response = await client.get("/accounts/all", params={"format": "csv"}, headers=headers)
+
+    # Then
+    lines = response.text.splitlines()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert lines[0] == "id,user_id,balance,created_at"
+    assert len(lines) == 3
+
+
+async def test_export_accounts_not_admin_fail(client: AsyncClient, access_token: str):
+    # Given
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    # When
+    response = await client.get("/accounts/all", headers=headers)
+
+    # Then
+    assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -0,0 +1,225 @@
+import pytest_asyncio
+from fastapi import status
+from httpx import AsyncClient
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def populate_accounts(db):
+    from src.schemas.account import AccountIn
+    from src.services.account import AccountService
+
+    await AccountService().create(AccountIn(user_id=1, balance=100))
+
+
+async def test_read_account_success(client: AsyncClient, access_token: str):
+    # Given
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    # When
+    response = await client.get("/accounts/1", headers=headers)
+
+    # Then
+    content = response.json()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert content["id"] == 1
+    assert content["balance"] == 100
+
+
+async def test_read_account_not_found_fail(client: AsyncClient, access_token: str):
+    # Given
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    # When
+    response = await client.get("/accounts/2", headers=headers)
+
+    # Then
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+async def test_read_account_not_owner_fail(client: AsyncClient, access_token: str):
+    # Given
+    from src.schemas.account import AccountIn
+    from src.services.account import AccountService
+
+    await AccountService().create(AccountIn(user_id=2, balance=100))
+    headers = {"Authorization": f"Bearer {access_token}"}
+    period = {"from": "2024-01-01T00:00:00Z", "to": "2024-01-02T00:00:00Z"}
+    requests = [
+        ("/accounts/2", {}),
+        ("/accounts/2/summary", {}),
+        ("/accounts/2/transactions", {"limit": 10}),
+        ("/accounts/2/transactions/export", {}),
+        ("/accounts/2/balance", {"at": "2024-01-01T00:00:00Z"}),
+        ("/accounts/2/statement", period),
+    ]
+
+    # When
+    responses = [await client.get(url, params=params, headers=headers) for url, params in requests]
+
+    # Then
+    assert [response.status_code for response in responses] == [status.HTTP_403_FORBIDDEN] * len(requests)
+    assert {response.json()["detail"] for response in responses} == {"Access denied"}
+
+
+async def test_read_account_admin_success(client: AsyncClient, access_token: str, mocker):
+    # Given
+    from src.config import settings
+    from src.schemas.account import AccountIn
+    from src.services.account import AccountService
+
+    mocker.patch.object(settings, "admin_user_ids", [1])
+    await AccountService().create(AccountIn(user_id=2, balance=100))
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    # When
+    response = await client.get("/accounts/2", headers=headers)
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["user_id"] == 2
+
+
+async def test_read_account_cached_success(client: AsyncClient, access_token: str, mocker):
+    # Given
+    from src.cache import account_cache
+    from src.database import database
+
+    headers = {"Authorization": f"Bearer {access_token}"}
+    await client.get("/accounts/1", headers=headers)
+    fetch_all = mocker.spy(database, "fetch_all")
+    hits = account_cache.hits
+
+    # When
+    response = await client.get("/accounts/1", headers=headers)
+    metrics = await client.get("/metrics")
+
+    # Then
+    assert response.json()["balance"] == 100
+    assert fetch_all.call_count == 0
+    assert account_cache.hits == hits + 1
+    assert "# TYPE account_cache_hit_ratio gauge" in metrics.text
+    assert "account_cache_hit_age_seconds_count" in metrics.text
+
+
+async def test_read_account_invalidated_by_transaction_success(client: AsyncClient, access_token: str):
+    # Given
+    headers = {"Authorization": f"Bearer {access_token}"}
+    await client.get("/accounts/1", headers=headers)
+    await client.get("/accounts/", params={"limit": 10}, headers=headers)
+
+    # When
+    await client.post("/transactions/", json={"account_id": 1, "type": "deposit", "amount": 50}, headers=headers)
+    await client.post(
+        "/transactions/batch", json=[{"account_id": 1, "type": "withdrawal", "amount": 20}], headers=headers
+    )
+    account = await client.get("/accounts/1", headers=headers)
+    listing = await client.get("/accounts/", params={"limit": 10}, headers=headers)
+
+    # Then
+    assert account.json()["balance"] == 130
+    assert [item["balance"] for item in listing.json()] == [130]
+
+
+async def test_read_account_racing_write_not_cached_success(client: AsyncClient, access_token: str, mocker):
+    # Given
+    from src.database import database
+    from src.models.account import accounts
+    from src.services.account import AccountService
+
+    headers = {"Authorization": f"Bearer {access_token}"}
+    fetch_all = database.fetch_all
+    writes = []
+
+    async def fetch_all_then_write(query, values=None):
+        rows = await fetch_all(query, values)
+        if not writes:
+            # A write commits and invalidates the account between this read and its caching.
+            writes.append(await database.execute(accounts.update().where(accounts.c.id == 1).values(balance=70)))
+            await AccountService().invalidate(1)
+        return rows
+
+    mocker.patch.object(database, "fetch_all", fetch_all_then_write)
+
+    # When
+    racing = await client.get("/accounts/1", headers=headers)
+    account = await client.get("/accounts/1", headers=headers)
+
+    # Then
+    assert racing.json()["balance"] == 100
+    assert account.json()["balance"] == 70
+
+
+async def test_read_accounts_after_create_success(client: AsyncClient, access_token: str):
+    # Given
+    headers = {"Authorization": f"Bearer {access_token}"}
+    await client.get("/accounts/", params={"limit": 10}, headers=headers)
+
+    # When
+    await client.post("/accounts/", json={"user_id": 1, "balance": 10}, headers=headers)
+    response = await client.get("/accounts/", params={"limit": 10}, headers=headers)
+
+    # Then
+    assert [item["id"] for item in response.json()] == [1, 2]
+
+
+async def test_read_accounts_only_own_success(client: AsyncClient, access_token: str):
+    # Given
+    headers = {"Authorization": f"Bearer {access_token}"}
+    for user_id in (2, 1, 2, 1):
+        await client.post("/accounts/", json={"user_id": user_id, "balance": 10}, headers=headers)
+    pages = []
+    params = {"limit": 2}
+
+    # When
+    while True:
+        response = await client.get("/accounts/", params=params, headers=headers)
+        pages.append([(item["id"], item["user_id"]) for item in response.json()])
+        if "X-Next-Cursor" not in response.headers:
+            break
+        params = {"limit": 2, "cursor": response.headers["X-Next-Cursor"]}
+
+    # Then
+    assert pages == [[(1, 1), (3, 1)], [(5, 1)]]
+
+
+async def test_read_accounts_invalid_cursor_fail(client: AsyncClient, access_token: str):
+    # Given
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    # When
+    response = await client.get("/accounts/", params={"limit": 10, "cursor": "not-a-cursor"}, headers=headers)
+
+    # Then
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_read_accounts_skip_fail(client: AsyncClient, access_token: str):
+    # Given
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    # When
+    response = await client.get("/accounts/", params={"limit": 10, "skip": 10}, headers=headers)
+
+    # Then
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert response.json()["detail"] == "'skip' is no longer supported, use 'cursor'."
+
+
+async def test_read_accounts_fast_serialization_success(client: AsyncClient, access_token: str, mocker):
+    # Given
+    from src.config import settings
+
+    params = {"limit": 10}
+    headers = {"Authorization": f"Bearer {access_token}"}
+    expected = await client.get("/accounts/", params=params, headers=headers)
+    schema = (await client.get("/openapi.json")).json()
+    mocker.patch.object(settings, "fast_serialization_enabled", True)
+
+    # When
+    response = await client.get("/accounts/", params=params, headers=headers)
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == expected.json()
+    assert (await client.get("/openapi.json")).json() == schema
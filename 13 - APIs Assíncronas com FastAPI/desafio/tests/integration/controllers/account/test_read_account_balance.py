@@ -0,0 +1,186 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest_asyncio
+from fastapi import status
+from httpx import AsyncClient
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def populate_transactions(db, mocker):
+    from src.config import settings
+    from src.database import database
+    from src.schemas.account import AccountIn
+    from src.schemas.transaction import TransactionIn
+    from src.services.account import AccountService
+    from src.services.transaction import TransactionService
+
+    mocker.patch.object(settings, "balance_checkpoint_interval", 2)
+
+    await AccountService().create(AccountIn(user_id=1, balance=100))
+    service = TransactionService()
+    for amount in range(1, 6):
+        await service.create(TransactionIn(account_id=1, type="deposit", amount=amount))
+
+    # Spread the ledger one day apart, so transaction N lands N days after the account was opened.
+    await database.execute(
+        "UPDATE transactions SET timestamp = datetime(timestamp, '+' || id || ' days') WHERE account_id = 1"
+    )
+    await database.execute(
+        "UPDATE balance_checkpoints SET timestamp = "
+        "(SELECT timestamp FROM transactions WHERE transactions.id = balance_checkpoints.transaction_id) "
+        "WHERE transaction_id > 0"
+    )
+
+
+async def opened_at():
+    from src.services.account import AccountService
+
+    accounts = await AccountService().read_all(limit=1)
+    return accounts[0].created_at.replace(tzinfo=timezone.utc)
+
+
+async def test_read_account_balance_success(client: AsyncClient, access_token: str):
+    # Given
+    from src.database import database
+
+    headers = {"Authorization": f"Bearer {access_token}"}
+    opened = await opened_at()
+    expected = {-1: 0, 0: 100, 1: 101, 2: 103, 3: 106, 4: 110, 5: 115, 30: 115}
+
+    # When
+    balances = {}
+    for days in expected:
+        params = {"at": (opened + timedelta(days=days, hours=1)).isoformat()}
+        response = await client.get("/accounts/1/balance", params=params, headers=headers)
+        balances[days] = response.json()["balance"]
+
+    # Then
+    checkpoints = await database.fetch_all("SELECT transaction_id FROM balance_checkpoints ORDER BY id")
+
+    assert balances == expected
+    assert [checkpoint.transaction_id for checkpoint in checkpoints] == [0, 2, 4]
+
+
+async def test_read_account_balance_interleaved_writes_success(db, mocker):
+    # Given
+    from sqlalchemy.dialects import postgresql
+
+    from src.database import database
+    from src.models.balance_checkpoint import balance_checkpoints
+    from src.models.transaction import transactions
+    from src.schemas.account import AccountIn
+    from src.schemas.transaction import TransactionIn
+    from src.services.account import AccountService
+    from src.services.transaction import TransactionService
+
+    account = await AccountService().create(AccountIn(user_id=1, balance=100))
+    service = TransactionService()
+    begun, release = asyncio.Event(), asyncio.Event()
+    lock_accounts = service._TransactionService__lock_accounts
+
+    async def lock_accounts_later(account_ids):
+        begun.set()
+        await release.wait()
+        return await lock_accounts(account_ids)
+
+    mocker.patch.object(service, "_TransactionService__lock_accounts", lock_accounts_later)
+
+    # When
+    # The batch begins its DB transaction first, but only takes the account lock after the other writes
+    # committed and checkpointed the balance at 130.
+    batch = asyncio.create_task(service.create_many([TransactionIn(account_id=account.id, type="deposit", amount=5)]))
+    await begun.wait()
+    await TransactionService().create(TransactionIn(account_id=account.id, type="deposit", amount=10))
+    await TransactionService().create(TransactionIn(account_id=account.id, type="deposit", amount=20))
+    # SQLite stamps whole seconds; let the batch row land after the checkpoint's second.
+    await asyncio.sleep(1)
+    release.set()
+    await batch
+
+    # Then
+    checkpoint = await database.fetch_one(
+        balance_checkpoints.select()
+        .where(balance_checkpoints.c.account_id == account.id)
+        .order_by(balance_checkpoints.c.id.desc())
+        .limit(1)
+    )
+    insert = transactions.insert().values(account_id=account.id, type="deposit", amount=5)
+
+    assert checkpoint.balance == 130
+    assert await service.read_balance(account.id, checkpoint.timestamp) == 130
+    assert await service.read_balance(account.id, datetime.now(timezone.utc) + timedelta(hours=1)) == 135
+    # PostgreSQL's now() is the transaction start, which would stamp the batch row before the checkpoint.
+    assert "clock_timestamp()" in str(insert.compile(dialect=postgresql.dialect()))
+
+
+async def test_read_account_statement_success(client: AsyncClient, access_token: str):
+    # Given
+    headers = {"Authorization": f"Bearer {access_token}"}
+    opened = await opened_at()
+    params = {
+        "from": (opened + timedelta(days=2, hours=1)).isoformat(),
+        "to": (opened + timedelta(days=4, hours=1)).isoformat(),
+    }
+
+    # When
+    response = await client.get("/accounts/1/statement", params=params, headers=headers)
+
+    # Then
+    content = response.json()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert content["opening_balance"] == 103
+    assert content["closing_balance"] == 110
+
+
+async def test_read_account_statement_archived_success(client: AsyncClient, access_token: str):
+    # Given
+    from src.database import database
+    from src.services.transaction_archive import TransactionArchiveService
+
+    headers = {"Authorization": f"Bearer {access_token}"}
+    opened = await opened_at()
+    archived = await TransactionArchiveService().archive(before=opened + timedelta(days=3, hours=1), batch_size=2)
+    params = {
+        "from": (opened + timedelta(days=2, hours=1)).isoformat(),
+        "to": (opened + timedelta(days=4, hours=1)).isoformat(),
+    }
+
+    # When
+    response = await client.get("/accounts/1/statement", params=params, headers=headers)
+
+    # Then
+    content = response.json()
+    hot = await database.fetch_all("SELECT id FROM transactions ORDER BY id")
+    cold = await database.fetch_all("SELECT id FROM transactions_archive ORDER BY id")
+
+    assert archived == 3
+    assert [row.id for row in hot] == [4, 5]
+    assert [row.id for row in cold] == [1, 2, 3]
+    assert response.status_code == status.HTTP_200_OK
+    assert content["opening_balance"] == 103
+    assert content["closing_balance"] == 110
+
+
+async def test_read_account_statement_invalid_period_fail(client: AsyncClient, access_token: str):
+    # Given
+    headers = {"Authorization": f"Bearer {access_token}"}
+    params = {"from": "2024-01-02T00:00:00Z", "to": "2024-01-01T00:00:00Z"}
+
+    # When
+    response = await client.get("/accounts/1/statement", params=params, headers=headers)
+
+    # Then
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_read_account_balance_not_found_fail(client: AsyncClient, access_token: str):
+    # Given
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    # When
+    response = await client.get("/accounts/2/balance", params={"at": "2024-01-01T00:00:00Z"}, headers=headers)
+
+    # Then
+    assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,128 @@
+import pytest_asyncio
+from fastapi import status
+from httpx import AsyncClient
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def populate_transactions(db):
+    from src.schemas.account import AccountIn
+    from src.schemas.transaction import TransactionIn
+    from src.services.account import AccountService
+    from src.services.transaction import TransactionService
+
+    await AccountService().create(AccountIn(user_id=1, balance=100))
+    await AccountService().create(AccountIn(user_id=2, balance=100))
+    service = TransactionService()
+    await service.create(TransactionIn(account_id=1, type="deposit", amount=50))
+    await service.create(TransactionIn(account_id=1, type="withdrawal", amount=30))
+    await service.create_many(
+        [
+            TransactionIn(account_id=1, type="deposit", amount=10.5),
+            TransactionIn(account_id=1, type="withdrawal", amount=200),
+            TransactionIn(account_id=1, type="withdrawal", amount=5),
+        ]
+    )
+
+
+async def test_read_account_summary_success(client: AsyncClient, access_token: str):
+    # Given
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    # When
+    response = await client.get("/accounts/1/summary", headers=headers)
+
+    # Then
+    content = response.json()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert content["deposit_total"] == 60.5
+    assert content["withdrawal_total"] == 35
+    assert content["deposit_count"] == 2
+    assert content["withdrawal_count"] == 2
+    assert content["last_activity_at"] is not None
+
+
+async def test_read_account_summary_account_not_found_fail(client: AsyncClient, access_token: str):
+    # Given
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    # When
+    response = await client.get("/accounts/3/summary", headers=headers)
+
+    # Then
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+async def test_read_account_summaries_success(client: AsyncClient, access_token: str, mocker):
+    # Given
+    from src.config import settings
+
+    mocker.patch.object(settings, "admin_user_ids", [1])
+    headers = {"Authorization": f"Bearer {access_token}"}
+    params = {"ids": [2, 1, 3]}
+
+    # When
+    response = await client.get("/accounts/summaries", params=params, headers=headers)
+
+    # Then
+    content = response.json()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [summary["account_id"] for summary in content] == [1, 2]
+    assert content[1] == {
+        "account_id": 2,
+        "deposit_total": 0,
+        "withdrawal_total": 0,
+        "deposit_count": 0,
+        "withdrawal_count": 0,
+        "last_activity_at": None,
+    }
+
+
+async def test_read_account_summaries_not_owner_success(client: AsyncClient, access_token: str):
+    # Given
+    headers = {"Authorization": f"Bearer {access_token}"}
+    params = {"ids": [2, 1, 3]}
+
+    # When
+    response = await client.get("/accounts/summaries", params=params, headers=headers)
+
+    # Then
+    content = response.json()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [summary["account_id"] for summary in content] == [1]
+
+
+async def test_read_account_summaries_too_many_ids_fail(client: AsyncClient, access_token: str):
+    # Given
+    headers = {"Authorization": f"Bearer {access_token}"}
+    params = {"ids": list(range(1, 1002))}
+
+    # When
+    response = await client.get("/accounts/summaries", params=params, headers=headers)
+
+    # Then
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_rebuild_account_stats_success(client: AsyncClient, access_token: str, mocker):
+    # Given
+    from src.config import settings
+    from src.database import database
+    from src.models.account_stats import account_stats
+    from src.services.account_stats import AccountStatsService
+
+    mocker.patch.object(settings, "admin_user_ids", [1])
+    headers = {"Authorization": f"Bearer {access_token}"}
+    expected = (await client.get("/accounts/summaries", params={"ids": [1, 2]}, headers=headers)).json()
+    await database.execute(account_stats.update().values(deposit_total=0, deposit_count=0))
+
+    # When
+    rebuilt = await AccountStatsService().rebuild(batch_size=1)
+
+    # Then
+    response = await client.get("/accounts/summaries", params={"ids": [1, 2]}, headers=headers)
+
+    assert rebuilt == 2
+    assert response.json() == expected
@@ -0,0 +1,192 @@
+import asyncio
+
+import pytest_asyncio
+from fastapi import status
+from httpx import AsyncClient
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def populate_transactions(db):
+    from src.schemas.account import AccountIn
+    from src.schemas.transaction import TransactionIn
+    from src.services.account import AccountService
+    from src.services.transaction import TransactionService
+
+    await AccountService().create(AccountIn(user_id=1, balance=100))
+    service = TransactionService()
+    for amount in range(1, 6):
+        await service.create(TransactionIn(account_id=1, type="deposit", amount=amount))
+
+
+async def test_read_account_transactions_success(client: AsyncClient, access_token: str):
+    # Given
+    params = {"limit": 10}
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    # When
+    response = await client.get("/accounts/1/transactions", params=params, headers=headers)
+
+    # Then
+    content = response.json()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [transaction["amount"] for transaction in content] == [1, 2, 3, 4, 5]
+    assert "X-Next-Cursor" not in response.headers
+
+
+async def test_read_account_transactions_cursor_success(client: AsyncClient, access_token: str):
+    # Given
+    headers = {"Authorization": f"Bearer {access_token}"}
+    pages = []
+    params = {"limit": 2}
+
+    # When
+    while True:
+        response = await client.get("/accounts/1/transactions", params=params, headers=headers)
+        pages.append([transaction["amount"] for transaction in response.json()])
+        if "X-Next-Cursor" not in response.headers:
+            break
+        params = {"limit": 2, "cursor": response.headers["X-Next-Cursor"]}
+
+    # Then
+    assert pages == [[1, 2], [3, 4], [5]]
+
+
+async def test_read_account_transactions_invalid_cursor_fail(client: AsyncClient, access_token: str):
+    # Given
+    params = {"limit": 2, "cursor": "not-a-cursor"}
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    # When
+    response = await client.get("/accounts/1/transactions", params=params, headers=headers)
+
+    # Then
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_read_account_transactions_not_authenticated_fail(client: AsyncClient):
+    # When
+    response = await client.get("/accounts/1/transactions", params={"limit": 2}, headers={})
+
+    # Then
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+async def test_read_account_transactions_fast_serialization_success(client: AsyncClient, access_token: str, mocker):
+    # Given
+    from src.config import settings
+
+    params = {"limit": 3}
+    headers = {"Authorization": f"Bearer {access_token}"}
+    expected = await client.get("/accounts/1/transactions", params=params, headers=headers)
+    mocker.patch.object(settings, "fast_serialization_enabled", True)
+
+    # When
+    response = await client.get("/accounts/1/transactions", params=params, headers=headers)
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["Content-Type"] == "application/json"
+    assert response.headers["X-Next-Cursor"] == expected.headers["X-Next-Cursor"]
+    assert response.json() == expected.json()
+
+
+async def test_read_account_transactions_time_range_success(client: AsyncClient, access_token: str):
+    # Given
+    from datetime import datetime, timezone
+
+    from src.database import database
+    from src.models.transaction import transactions
+
+    for id in range(1, 6):
+        command = (
+            transactions.update()
+            .where(transactions.c.id == id)
+            .values(timestamp=datetime(2024, id, 15, tzinfo=timezone.utc))
+        )
+        await database.execute(command)
+
+    params = {"limit": 10, "from": "2024-02-01T00:00:00-03:00", "to": "2024-04-15T00:00:00Z"}
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    # When
+    response = await client.get("/accounts/1/transactions", params=params, headers=headers)
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    assert [transaction["amount"] for transaction in response.json()] == [2, 3, 4]
+
+
+async def test_read_account_transactions_compiled_once_success(client: AsyncClient, access_token: str, mocker):
+    # Given
+    from src.services.transaction import transactions_page
+
+    transactions_page.clear()
+    build = mocker.spy(transactions_page, "build")
+    headers = {"Authorization": f"Bearer {access_token}"}
+    pages = []
+    params = {"limit": 2}
+
+    # When
+    while True:
+        response = await client.get("/accounts/1/transactions", params=params, headers=headers)
+        pages.append([transaction["amount"] for transaction in response.json()])
+        if "X-Next-Cursor" not in response.headers:
+            break
+        params = {"limit": 2, "cursor": response.headers["X-Next-Cursor"]}
+
+    # Then
+    assert pages == [[1, 2], [3, 4], [5]]
+    # One compilation for the first page and one for the keyset pages that follow it.
+    assert build.call_count == 2
+
+
+async def test_read_account_transactions_coalesced_success(client: AsyncClient, access_token: str, mocker):
+    # Given
+    from src.config import settings
+    from src.database import database
+
+    mocker.patch.object(settings, "read_coalescing_enabled", True)
+    params = {"limit": 20}
+    headers = {"Authorization": f"Bearer {access_token}"}
+    # The access check then finds the account in the cache.
+    await client.get("/accounts/1", headers=headers)
+    fetch_all = mocker.spy(database, "fetch_all")
+
+    # When
+    responses = await asyncio.gather(
+        *[client.get("/accounts/1/transactions", params=params, headers=headers) for _ in range(10)]
+    )
+    other = await client.get("/accounts/1/transactions", params={"limit": 2}, headers=headers)
+
+    # Then
+    assert {response.status_code for response in responses} == {status.HTTP_200_OK}
+    assert all(response.json() == responses[0].json() for response in responses)
+    assert len(responses[0].json()) == 5
+    assert len(other.json()) == 2
+    assert fetch_all.call_count == 2
+
+
+async def test_read_account_transactions_coalesced_ttl_success(client: AsyncClient, access_token: str, mocker):
+    # Given
+    from src.coalescing import coalescer
+    from src.config import settings
+    from src.database import database
+
+    mocker.patch.object(settings, "read_coalescing_enabled", True)
+    mocker.patch.object(coalescer, "ttl", 60)
+    params = {"limit": 20}
+    headers = {"Authorization": f"Bearer {access_token}"}
+    await client.get("/accounts/1/transactions", params=params, headers=headers)
+    fetch_all = mocker.spy(database, "fetch_all")
+    cached = coalescer.calls["cached"]
+
+    # When
+    response = await client.get("/accounts/1/transactions", params=params, headers=headers)
+    metrics = await client.get("/metrics")
+
+    # Then
+    assert len(response.json()) == 5
+    assert fetch_all.call_count == 0
+    assert coalescer.calls["cached"] == cached + 1
+    assert f'read_coalescing_calls_total{{outcome="cached"}} {cached + 1}' in metrics.text
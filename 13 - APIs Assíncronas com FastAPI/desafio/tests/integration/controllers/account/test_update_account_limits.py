@@ -0,0 +1,99 @@
+import pytest_asyncio
+from fastapi import status
+from httpx import AsyncClient
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def populate_accounts(db):
+    from src.schemas.account import AccountIn
+    from src.services.account import AccountService
+
+    service = AccountService()
+    await service.create(AccountIn(user_id=1, balance=100, daily_withdrawal_count_limit=3))
+    await service.create(AccountIn(user_id=2, balance=100, daily_withdrawal_count_limit=3))
+
+
+async def test_update_account_limits_success(client: AsyncClient, access_token: str):
+    # Given
+    headers = {"Authorization": f"Bearer {access_token}"}
+    data = {"daily_withdrawal_amount_limit": 50}
+
+    # When
+    response = await client.patch("/accounts/1/limits", json=data, headers=headers)
+
+    # Then
+    content = response.json()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert content["daily_withdrawal_amount_limit"] == 50
+    assert content["daily_withdrawal_count_limit"] == 3
+
+
+async def test_update_account_limits_clear_success(client: AsyncClient, access_token: str):
+    # Given
+    headers = {"Authorization": f"Bearer {access_token}"}
+    data = {"daily_withdrawal_count_limit": None}
+
+    # When
+    response = await client.patch("/accounts/1/limits", json=data, headers=headers)
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["daily_withdrawal_count_limit"] is None
+
+
+async def test_update_account_limits_empty_body_success(client: AsyncClient, access_token: str):
+    # Given
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    # When
+    response = await client.patch("/accounts/1/limits", json={}, headers=headers)
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["daily_withdrawal_count_limit"] == 3
+
+
+async def test_update_account_limits_not_owner_fail(client: AsyncClient, access_token: str):
+    # Given
+    from src.services.account import AccountService
+
+    headers = {"Authorization": f"Bearer {access_token}"}
+    data = {"daily_withdrawal_count_limit": 100}
+
+    # When
+    response = await client.patch("/accounts/2/limits", json=data, headers=headers)
+
+    # Then
+    account = await AccountService().read(2)
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+    assert response.json()["detail"] == "Access denied"
+    assert account.daily_withdrawal_count_limit == 3
+
+
+async def test_update_account_limits_admin_success(client: AsyncClient, access_token: str, mocker):
+    # Given
+    from src.config import settings
+
+    mocker.patch.object(settings, "admin_user_ids", [1])
+    headers = {"Authorization": f"Bearer {access_token}"}
+    data = {"daily_withdrawal_count_limit": 100}
+
+    # When
+    response = await client.patch("/accounts/2/limits", json=data, headers=headers)
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["daily_withdrawal_count_limit"] == 100
+
+
+async def test_update_account_limits_not_found_fail(client: AsyncClient, access_token: str):
+    # Given
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    # When
+    response = await client.patch("/accounts/3/limits", json={}, headers=headers)
+
+    # Then
+    assert response.status_code == status.HTTP_404_NOT_FOUND
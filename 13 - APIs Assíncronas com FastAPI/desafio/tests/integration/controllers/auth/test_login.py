@@ -0,0 +1,34 @@
+from fastapi import status
+from httpx import AsyncClient
+
+
+async def test_login_success(client: AsyncClient):
+    # Given
+    data = {"user_id": 1}
+
+    # When
+    response = await client.post("/auth/login", json=data)
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["access_token"] is not None
+
+
+async def test_authenticated_requests_reuse_verified_token(client: AsyncClient, access_token: str):
+    # Given
+    from src.security import token_cache
+
+    headers = {"Authorization": f"Bearer {access_token}"}
+    hits, misses = token_cache.hits, token_cache.misses
+
+    # When
+    for _ in range(3):
+        response = await client.get("/accounts/", params={"limit": 1}, headers=headers)
+
+    # Then
+    metrics = (await client.get("/metrics")).text
+
+    assert response.status_code == status.HTTP_200_OK
+    assert token_cache.misses == misses + 1
+    assert token_cache.hits == hits + 2
+    assert f"jwt_cache_hits_total {token_cache.hits}" in metrics
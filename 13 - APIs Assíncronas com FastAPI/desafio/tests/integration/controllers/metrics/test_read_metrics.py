@@ -0,0 +1,83 @@
+from fastapi import status
+from httpx import AsyncClient
+
+
+async def test_read_metrics_success(client: AsyncClient):
+    # When
+    response = await client.get("/metrics")
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["Content-Type"].startswith("text/plain")
+    assert "# TYPE transaction_write_queue_waiting gauge" in response.text
+    assert 'transaction_write_queue_pending{shard="0"} 0' in response.text
+
+
+async def test_read_metrics_per_route_success(client: AsyncClient, access_token: str):
+    # Given
+    from src.instrumentation import request_duration, request_queries
+    from src.schemas.account import AccountIn
+    from src.services.account import AccountService
+
+    for _ in range(2):
+        await AccountService().create(AccountIn(user_id=1, balance=100))
+    headers = {"Authorization": f"Bearer {access_token}"}
+    route = "/accounts/{id}/transactions"
+    requests = request_duration.count(method="GET", route=route, status=200)
+    queries = request_queries.sum(route=route)
+
+    # When
+    await client.get("/accounts/1/transactions", params={"limit": 10}, headers=headers)
+    await client.get("/accounts/2/transactions", params={"limit": 10}, headers=headers)
+    await client.get("/unknown", headers=headers)
+    response = await client.get("/metrics")
+
+    # Then
+    assert request_duration.count(method="GET", route=route, status=200) == requests + 2
+    # Each request reads the account for the access check, then its page.
+    assert request_queries.sum(route=route) == queries + 4
+    assert f'http_request_duration_seconds_count{{method="GET",route="{route}",status="200"}}' in response.text
+    assert 'http_request_duration_seconds_count{method="GET",route="unmatched",status="404"}' in response.text
+    assert 'http_requests_in_flight{method="GET"} 1' in response.text
+
+
+async def test_read_metrics_pool_success(client: AsyncClient, access_token: str):
+    # Given
+    from src.config import settings
+    from src.database import engine
+    from src.instrumentation import pool_acquire_duration
+
+    headers = {"Authorization": f"Bearer {access_token}"}
+    acquires = pool_acquire_duration.count()
+
+    # When
+    await client.get("/accounts/", params={"limit": 10}, headers=headers)
+    response = await client.get("/metrics")
+
+    # Then
+    assert pool_acquire_duration.count() > acquires
+    assert "db_pool_acquire_seconds_count" in response.text
+    assert 'db_pool_connections{state="waiting"} 0' in response.text
+    assert engine.pool.size() == settings.db_pool_min_size
+
+
+async def test_pool_acquire_timeout_fail(client: AsyncClient, access_token: str, mocker):
+    # Given
+    import asyncio
+
+    from src.database import database
+
+    async def acquire():
+        await asyncio.sleep(1)
+
+    pool = database._backend._pool
+    mocker.patch.object(pool, "acquire_timeout", 0.01)
+    mocker.patch.object(pool.wrapped, "acquire", acquire)
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    # When
+    response = await client.get("/accounts/1", headers=headers)
+
+    # Then
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.headers["Retry-After"] == "1"
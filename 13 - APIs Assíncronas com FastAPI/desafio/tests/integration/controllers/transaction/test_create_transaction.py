@@ -0,0 +1,314 @@
+import asyncio
+
+import pytest_asyncio
+from fastapi import status
+from httpx import AsyncClient
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def populate_accounts(db):
+    from src.schemas.account import AccountIn
+    from src.services.account import AccountService
+
+    service = AccountService()
+    await service.create(AccountIn(user_id=1, balance=100))
+
+
+async def test_create_deposit_success(client: AsyncClient, access_token: str):
+    # Given
+    headers = {"Authorization": f"Bearer {access_token}"}
+    data = {"account_id": 1, "type": "deposit", "amount": 50}
+
+    # When
+    response = await client.post("/transactions/", json=data, headers=headers)
+
+    # Then
+    content = response.json()
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert content["id"] is not None
+    assert content["type"] == "deposit"
+    assert content["amount"] == 50
+
+
+async def test_create_withdrawal_success(client: AsyncClient, access_token: str):
+    # Given
+    from src.services.account import AccountService
+
+    headers = {"Authorization": f"Bearer {access_token}"}
+    data = {"account_id": 1, "type": "withdrawal", "amount": 100}
+
+    # When
+    response = await client.post("/transactions/", json=data, headers=headers)
+
+    # Then
+    accounts = await AccountService().read_all(limit=1)
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.json()["type"] == "withdrawal"
+    assert float(accounts[0].balance) == 0
+
+
+async def test_create_withdrawal_lack_of_balance_fail(client: AsyncClient, access_token: str):
+    # Given
+    headers = {"Authorization": f"Bearer {access_token}"}
+    data = {"account_id": 1, "type": "withdrawal", "amount": 100.01}
+
+    # When
+    response = await client.post("/transactions/", json=data, headers=headers)
+
+    # Then
+    assert response.status_code == status.HTTP_409_CONFLICT
+    assert response.json()["detail"] == "Operation not carried out due to lack of balance"
+
+
+async def test_create_concurrent_withdrawals_never_overdraw(client: AsyncClient, access_token: str):
+    # Given
+    from src.services.account import AccountService
+
+    headers = {"Authorization": f"Bearer {access_token}"}
+    data = {"account_id": 1, "type": "withdrawal", "amount": 30}
+
+    # When
+    responses = await asyncio.gather(*[client.post("/transactions/", json=data, headers=headers) for _ in range(5)])
+
+    # Then
+    accounts = await AccountService().read_all(limit=1)
+    codes = sorted(response.status_code for response in responses)
+
+    assert codes == [status.HTTP_201_CREATED] * 3 + [status.HTTP_409_CONFLICT] * 2
+    assert float(accounts[0].balance) == 10
+
+
+async def test_create_withdrawal_daily_count_limit_fail(client: AsyncClient, access_token: str, mocker):
+    # Given
+    from src.config import settings
+
+    mocker.patch.object(settings, "daily_withdrawal_count_limit", 2)
+    headers = {"Authorization": f"Bearer {access_token}"}
+    data = {"account_id": 1, "type": "withdrawal", "amount": 10}
+
+    # When
+    responses = await asyncio.gather(*[client.post("/transactions/", json=data, headers=headers) for _ in range(4)])
+    deposit = await client.post("/transactions/", json={**data, "type": "deposit"}, headers=headers)
+    account = await client.get("/accounts/1", headers=headers)
+
+    # Then
+    rejected = [response for response in responses if response.status_code == status.HTTP_409_CONFLICT]
+
+    assert len(rejected) == 2
+    assert rejected[0].json()["detail"] == "Operation not carried out due to daily withdrawal limit"
+    assert deposit.status_code == status.HTTP_201_CREATED
+    assert account.json()["balance"] == 90
+
+
+async def test_create_withdrawal_account_amount_limit_fail(client: AsyncClient, access_token: str, mocker):
+    # Given
+    from src.config import settings
+
+    mocker.patch.object(settings, "daily_withdrawal_amount_limit", 500)
+    headers = {"Authorization": f"Bearer {access_token}"}
+    limits = await client.patch("/accounts/1/limits", json={"daily_withdrawal_amount_limit": 50}, headers=headers)
+    data = {"account_id": 1, "type": "withdrawal", "amount": 30}
+
+    # When
+    first = await client.post("/transactions/", json=data, headers=headers)
+    second = await client.post("/transactions/", json=data, headers=headers)
+    rest = await client.post("/transactions/", json={**data, "amount": 20}, headers=headers)
+
+    # Then
+    assert limits.json()["daily_withdrawal_amount_limit"] == 50
+    assert first.status_code == status.HTTP_201_CREATED
+    assert second.status_code == status.HTTP_409_CONFLICT
+    assert second.json()["detail"] == "Operation not carried out due to daily withdrawal limit"
+    assert rest.status_code == status.HTTP_201_CREATED
+
+
+async def test_create_withdrawal_daily_limit_resets_next_day(client: AsyncClient, access_token: str, mocker):
+    # Given
+    from datetime import date
+
+    from src.database import database
+    from src.models.account import accounts
+
+    headers = {"Authorization": f"Bearer {access_token}"}
+    await client.patch("/accounts/1/limits", json={"daily_withdrawal_count_limit": 1}, headers=headers)
+    command = accounts.update().values(withdrawal_day=date(2020, 1, 1), withdrawal_day_count=1, withdrawal_day_total=10)
+    await database.execute(command)
+    data = {"account_id": 1, "type": "withdrawal", "amount": 10}
+
+    # When
+    first = await client.post("/transactions/", json=data, headers=headers)
+    second = await client.post("/transactions/", json=data, headers=headers)
+
+    # Then
+    assert first.status_code == status.HTTP_201_CREATED
+    assert second.status_code == status.HTTP_409_CONFLICT
+
+
+async def test_create_transaction_rate_limited_fail(client: AsyncClient, access_token: str, round_trips, mocker):
+    # Given
+    from src.config import settings
+
+    mocker.patch.object(settings, "rate_limit_enabled", True)
+    mocker.patch.object(settings, "rate_limit_routes", {"POST /transactions/": (0.5, 3)})
+    headers = {"Authorization": f"Bearer {access_token}"}
+    data = {"account_id": 1, "type": "deposit", "amount": 1}
+
+    # When
+    responses = [await client.post("/transactions/", json=data, headers=headers) for _ in range(4)]
+    account = await client.get("/accounts/1", headers=headers)
+
+    # Then
+    assert [response.status_code for response in responses] == [201, 201, 201, 429]
+    assert responses[3].headers["Retry-After"] == "2"
+    assert account.status_code == status.HTTP_200_OK
+    assert account.json()["balance"] == 103
+
+
+async def test_create_transaction_rate_limit_invalid_settings_fail():
+    # Given
+    from pydantic import ValidationError
+
+    from src.config import Settings
+
+    invalid = [{"rate_limit_rate": 0}, {"rate_limit_burst": 0}, {"rate_limit_routes": {"POST /transactions/": (0, 3)}}]
+
+    # When
+    errors = []
+    for options in invalid:
+        try:
+            Settings(database_url="sqlite:///tests.db", **options)
+        except ValidationError as error:
+            errors.append(error.errors()[0]["loc"])
+
+    # Then
+    assert errors == [("rate_limit_rate",), ("rate_limit_burst",), ("rate_limit_routes",)]
+
+
+async def test_create_transaction_account_not_found_fail(client: AsyncClient, access_token: str):
+    # Given
+    headers = {"Authorization": f"Bearer {access_token}"}
+    data = {"account_id": 2, "type": "deposit", "amount": 50}
+
+    # When
+    response = await client.post("/transactions/", json=data, headers=headers)
+
+    # Then
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+async def test_create_transaction_not_authenticated_fail(client: AsyncClient):
+    # Given
+    data = {"account_id": 1, "type": "deposit", "amount": 50}
+
+    # When
+    response = await client.post("/transactions/", json=data, headers={})
+
+    # Then
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+async def test_create_transaction_round_trips(client: AsyncClient, access_token: str, round_trips):
+    # Given
+    from src.database import database
+
+    headers = {"Authorization": f"Bearer {access_token}"}
+    data = {"account_id": 1, "type": "withdrawal", "amount": 30}
+
+    # When
+    response = await client.post("/transactions/", json=data, headers=headers)
+
+    # Then
+    assert response.status_code == status.HTTP_201_CREATED
+    # PostgreSQL chains the balance update and the stats into the insert; elsewhere they are three statements.
+    assert round_trips() == (1 if database.url.dialect == "postgresql" else 3)
+
+
+async def test_create_transaction_without_returning_success(client: AsyncClient, access_token: str, mocker):
+    # Given
+    from src.services.account import AccountService
+
+    mocker.patch("src.services.transaction.supports_returning", False)
+    headers = {"Authorization": f"Bearer {access_token}"}
+    data = {"account_id": 1, "type": "withdrawal", "amount": 60}
+
+    # When
+    responses = [await client.post("/transactions/", json=data, headers=headers) for _ in range(2)]
+
+    # Then
+    accounts = await AccountService().read_all(limit=1)
+
+    assert [response.status_code for response in responses] == [status.HTTP_201_CREATED, status.HTTP_409_CONFLICT]
+    assert responses[0].json()["amount"] == 60
+    assert float(accounts[0].balance) == 40
+
+
+async def test_create_sequenced_withdrawals_never_overdraw(client: AsyncClient, access_token: str, mocker):
+    # Given
+    from src.config import settings
+    from src.sequencing import WriteSequencer
+    from src.services.account import AccountService
+
+    mocker.patch.object(settings, "write_sequencing_enabled", True)
+    mocker.patch("src.services.transaction.sequencer", WriteSequencer(shards=4, max_pending=10))
+    headers = {"Authorization": f"Bearer {access_token}"}
+    data = {"account_id": 1, "type": "withdrawal", "amount": 30}
+
+    # When
+    responses = await asyncio.gather(*[client.post("/transactions/", json=data, headers=headers) for _ in range(5)])
+
+    # Then
+    accounts = await AccountService().read_all(limit=1)
+    codes = sorted(response.status_code for response in responses)
+
+    assert codes == [status.HTTP_201_CREATED] * 3 + [status.HTTP_409_CONFLICT] * 2
+    assert float(accounts[0].balance) == 10
+
+
+async def test_create_sequenced_queue_full_fail(client: AsyncClient, access_token: str, mocker):
+    # Given
+    from src.config import settings
+    from src.sequencing import WriteSequencer
+
+    mocker.patch.object(settings, "write_sequencing_enabled", True)
+    mocker.patch("src.services.transaction.sequencer", WriteSequencer(shards=4, max_pending=1))
+    headers = {"Authorization": f"Bearer {access_token}"}
+    data = {"account_id": 1, "type": "deposit", "amount": 1}
+
+    # When
+    responses = await asyncio.gather(*[client.post("/transactions/", json=data, headers=headers) for _ in range(5)])
+
+    # Then
+    rejected = [response for response in responses if response.status_code == status.HTTP_429_TOO_MANY_REQUESTS]
+
+    assert rejected
+    assert rejected[0].headers["Retry-After"] == "1"
+
+
+async def test_create_group_committed_withdrawals_success(client: AsyncClient, access_token: str, mocker):
+    # Given
+    from src.config import settings
+    from src.group_commit import GroupCommitter, flush_size
+    from src.services.account import AccountService
+    from src.services.transaction import TransactionService
+
+    mocker.patch.object(settings, "group_commit_enabled", True)
+    committer = GroupCommitter(handler=TransactionService().create_many, window=0.05, max_items=100)
+    mocker.patch("src.services.transaction.group_committer", committer)
+    flushes = flush_size.count()
+    headers = {"Authorization": f"Bearer {access_token}"}
+    data = [{"account_id": 1, "type": "withdrawal", "amount": 30}] * 5 + [
+        {"account_id": 2, "type": "deposit", "amount": 1}
+    ]
+
+    # When
+    responses = await asyncio.gather(*[client.post("/transactions/", json=item, headers=headers) for item in data])
+
+    # Then
+    accounts = await AccountService().read_all(limit=1)
+    codes = sorted(response.status_code for response in responses)
+
+    assert codes == [status.HTTP_201_CREATED] * 3 + [status.HTTP_404_NOT_FOUND] + [status.HTTP_409_CONFLICT] * 2
+    assert float(accounts[0].balance) == 10
+    assert flush_size.count() == flushes + 1
@@ -0,0 +1,128 @@
+import json
+
+import pytest_asyncio
+from fastapi import status
+from httpx import AsyncClient
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def populate_accounts(db):
+    from src.schemas.account import AccountIn
+    from src.services.account import AccountService
+
+    service = AccountService()
+    await service.create(AccountIn(user_id=1, balance=100))
+    await service.create(AccountIn(user_id=2, balance=10))
+
+
+async def test_create_transactions_batch_success(client: AsyncClient, access_token: str):
+    # Given
+    from src.services.account import AccountService
+
+    headers = {"Authorization": f"Bearer {access_token}"}
+    data = [
+        {"account_id": 1, "type": "withdrawal", "amount": 60},
+        {"account_id": 2, "type": "deposit", "amount": 5},
+        {"account_id": 1, "type": "withdrawal", "amount": 60},
+        {"account_id": 3, "type": "deposit", "amount": 5},
+        {"account_id": 1, "type": "deposit", "amount": -1},
+        {"account_id": 1, "type": "deposit", "amount": 20},
+        {"account_id": 1, "type": "withdrawal", "amount": 60},
+    ]
+
+    # When
+    response = await client.post("/transactions/batch", json=data, headers=headers)
+
+    # Then
+    content = response.json()
+    balances = {account.id: float(account.balance) for account in await AccountService().read_all(limit=10)}
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [item["status_code"] for item in content] == [201, 201, 409, 404, 422, 201, 201]
+    assert [item["index"] for item in content] == list(range(len(data)))
+    assert content[5]["transaction"]["amount"] == 20
+    assert balances == {1: 0, 2: 15}
+
+
+async def test_create_transactions_batch_daily_limit_success(client: AsyncClient, access_token: str):
+    # Given
+    headers = {"Authorization": f"Bearer {access_token}"}
+    await client.patch("/accounts/1/limits", json={"daily_withdrawal_count_limit": 2}, headers=headers)
+    await client.post("/transactions/", json={"account_id": 1, "type": "withdrawal", "amount": 10}, headers=headers)
+    data = [
+        {"account_id": 1, "type": "withdrawal", "amount": 10},
+        {"account_id": 1, "type": "withdrawal", "amount": 10},
+    ]
+
+    # When
+    response = await client.post("/transactions/batch", json=data, headers=headers)
+    single = await client.post("/transactions/", json=data[0], headers=headers)
+
+    # Then
+    content = response.json()
+
+    assert [item["status_code"] for item in content] == [201, 409]
+    assert content[1]["detail"] == "Operation not carried out due to daily withdrawal limit"
+    assert single.status_code == status.HTTP_409_CONFLICT
+
+
+async def test_create_transactions_batch_without_returning_success(client: AsyncClient, access_token: str, mocker):
+    # Given
+    from src.services.account import AccountService
+
+    mocker.patch("src.services.transaction.supports_returning", False)
+    headers = {"Authorization": f"Bearer {access_token}"}
+    data = [
+        {"account_id": 1, "type": "withdrawal", "amount": 60},
+        {"account_id": 2, "type": "deposit", "amount": 5},
+        {"account_id": 1, "type": "deposit", "amount": 20},
+    ]
+
+    # When
+    response = await client.post("/transactions/batch", json=data, headers=headers)
+
+    # Then
+    content = response.json()
+    balances = {account.id: float(account.balance) for account in await AccountService().read_all(limit=10)}
+
+    assert [item["status_code"] for item in content] == [201, 201, 201]
+    assert [item["transaction"]["amount"] for item in content] == [60, 5, 20]
+    assert balances == {1: 60, 2: 15}
+
+
+async def test_create_transactions_batch_ndjson_success(client: AsyncClient, access_token: str):
+    # Given
+    headers = {"Authorization": f"Bearer {access_token}", "Content-Type": "application/x-ndjson"}
+    lines = [
+        json.dumps({"account_id": 1, "type": "deposit", "amount": 1}),
+        "{not json",
+        json.dumps({"account_id": 2, "type": "withdrawal", "amount": 10}),
+    ]
+
+    # When
+    response = await client.post("/transactions/batch", content="\n".join(lines) + "\n", headers=headers)
+
+    # Then
+    content = response.json()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [item["status_code"] for item in content] == [201, 422, 201]
+
+
+async def test_create_transactions_batch_invalid_body_fail(client: AsyncClient, access_token: str):
+    # Given
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    # When
+    response = await client.post("/transactions/batch", json={"account_id": 1}, headers=headers)
+
+    # Then
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_create_transactions_batch_not_authenticated_fail(client: AsyncClient):
+    # When
+    response = await client.post("/transactions/batch", json=[], headers={})
+
+    # Then
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
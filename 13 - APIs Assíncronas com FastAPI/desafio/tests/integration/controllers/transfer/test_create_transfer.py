@@ -0,0 +1,119 @@
+import asyncio
+
+import pytest_asyncio
+from fastapi import status
+from httpx import AsyncClient
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def populate_accounts(db):
+    from src.schemas.account import AccountIn
+    from src.services.account import AccountService
+
+    service = AccountService()
+    await service.create(AccountIn(user_id=1, balance=100))
+    await service.create(AccountIn(user_id=2, balance=50))
+
+
+async def test_create_transfer_success(client: AsyncClient, access_token: str):
+    # Given
+    from src.services.account import AccountService
+
+    headers = {"Authorization": f"Bearer {access_token}"}
+    data = {"from_account_id": 1, "to_account_id": 2, "amount": 30}
+
+    # When
+    response = await client.post("/transfers/", json=data, headers=headers)
+
+    # Then
+    content = response.json()
+    accounts = await AccountService().read_all(limit=2)
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert content["withdrawal"]["account_id"] == 1
+    assert content["withdrawal"]["type"] == "withdrawal"
+    assert content["deposit"]["account_id"] == 2
+    assert content["deposit"]["type"] == "deposit"
+    assert content["deposit"]["amount"] == 30
+    assert [float(account.balance) for account in accounts] == [70, 80]
+
+
+async def test_create_transfer_lack_of_balance_fail(client: AsyncClient, access_token: str):
+    # Given
+    from src.services.account import AccountService
+
+    headers = {"Authorization": f"Bearer {access_token}"}
+    data = {"from_account_id": 2, "to_account_id": 1, "amount": 50.01}
+
+    # When
+    response = await client.post("/transfers/", json=data, headers=headers)
+
+    # Then
+    accounts = await AccountService().read_all(limit=2)
+
+    assert response.status_code == status.HTTP_409_CONFLICT
+    assert response.json()["detail"] == "Operation not carried out due to lack of balance"
+    assert [float(account.balance) for account in accounts] == [100, 50]
+    assert [account.transaction_count for account in accounts] == [0, 0]
+
+
+async def test_create_transfer_account_not_found_fail(client: AsyncClient, access_token: str):
+    # Given
+    from src.services.account import AccountService
+
+    headers = {"Authorization": f"Bearer {access_token}"}
+    data = {"from_account_id": 1, "to_account_id": 3, "amount": 10}
+
+    # When
+    response = await client.post("/transfers/", json=data, headers=headers)
+
+    # Then
+    accounts = await AccountService().read_all(limit=2)
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert [float(account.balance) for account in accounts] == [100, 50]
+
+
+async def test_create_transfer_same_account_fail(client: AsyncClient, access_token: str):
+    # Given
+    headers = {"Authorization": f"Bearer {access_token}"}
+    data = {"from_account_id": 1, "to_account_id": 1, "amount": 10}
+
+    # When
+    response = await client.post("/transfers/", json=data, headers=headers)
+
+    # Then
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_create_concurrent_opposite_transfers_keep_total(client: AsyncClient, access_token: str):
+    # Given
+    from src.services.account import AccountService
+
+    headers = {"Authorization": f"Bearer {access_token}"}
+    forward = {"from_account_id": 1, "to_account_id": 2, "amount": 20}
+    backward = {"from_account_id": 2, "to_account_id": 1, "amount": 15}
+
+    # When
+    responses = await asyncio.gather(
+        *[client.post("/transfers/", json=forward if i % 2 else backward, headers=headers) for i in range(10)]
+    )
+
+    # Then
+    accounts = await AccountService().read_all(limit=2)
+    codes = {response.status_code for response in responses}
+
+    assert codes <= {status.HTTP_201_CREATED, status.HTTP_409_CONFLICT}
+    assert sum(float(account.balance) for account in accounts) == 150
+    assert all(float(account.balance) >= 0 for account in accounts)
+
+
+async def test_create_transfer_not_authenticated_fail(client: AsyncClient):
+    # Given
+    data = {"from_account_id": 1, "to_account_id": 2, "amount": 10}
+
+    # When
+    response = await client.post("/transfers/", json=data)
+
+    # Then
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
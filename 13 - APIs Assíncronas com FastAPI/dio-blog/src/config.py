@@ -1,3 +1,4 @@
+from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -6,6 +7,33 @@ class Settings(BaseSettings):
 
     database_url: str
     environment: str = "production"
+    db_pool_min_size: int = 5
+    db_pool_max_size: int = 20
+    db_pool_acquire_timeout: float = 10.0
+    db_pool_max_lifetime: float = 1800.0
+    # Prepared statements kept per connection; 0 disables them, as transaction-mode PgBouncer requires.
+    db_statement_cache_size: int = 100
+    warmup_enabled: bool = False
+    # Connections opened and used once while warming up; defaults to db_pool_min_size.
+    warmup_pool_size: int | None = None
+    jwt_cache_size: int = 10_000
+    rate_limit_enabled: bool = False
+    # Requests per second each user gets on every route, and how many can come in a burst.
+    rate_limit_rate: float = Field(10.0, gt=0)
+    rate_limit_burst: int = Field(20, ge=1)
+    # (rate, burst) by route, e.g. RATE_LIMIT_ROUTES='{"POST /posts/": [1, 5]}'.
+    rate_limit_routes: dict[str, tuple[float, int]] = {}
+    rate_limit_backend: str = "memory"
+    rate_limit_url: str | None = None
+    rate_limit_size: int = 100_000
+
+    @field_validator("rate_limit_routes")
+    @classmethod
+    def check_rate_limit_routes(cls, routes: dict[str, tuple[float, int]]) -> dict[str, tuple[float, int]]:
+        for route, (rate, burst) in routes.items():
+            if rate <= 0 or burst < 1:
+                raise ValueError(f"{route}: the rate must be greater than 0 and the burst at least 1")
+        return routes
 
 
 settings = Settings()
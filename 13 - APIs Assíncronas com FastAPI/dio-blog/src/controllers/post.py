@@ -1,11 +1,12 @@
 from fastapi import APIRouter, Depends, status
 
+from src.ratelimit import rate_limited
 from src.schemas.post import PostIn, PostUpdateIn
 from src.security import login_required
 from src.services.post import PostService
 from src.views.post import PostOut
 
-router = APIRouter(prefix="/posts", dependencies=[Depends(login_required)])
+router = APIRouter(prefix="/posts", dependencies=[Depends(login_required), Depends(rate_limited)])
 
 service = PostService()
 
@@ -0,0 +1,213 @@
+import asyncio
+import time
+from collections.abc import AsyncGenerator, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+import databases
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.exceptions import PoolTimeoutError
+from src.metrics import Counter, Gauge, Histogram, LabelValues
+
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+request_duration = Histogram(
+    "http_request_duration_seconds", "Time spent serving HTTP requests.", labels=("method", "route", "status")
+)
+requests_in_flight = Gauge("http_requests_in_flight", "HTTP requests currently being served.", labels=("method",))
+request_queries = Histogram(
+    "http_request_db_queries",
+    "Database statements issued per HTTP request.",
+    labels=("route",),
+    buckets=QUERY_COUNT_BUCKETS,
+)
+request_db_duration = Histogram(
+    "http_request_db_seconds", "Time spent waiting on the database per HTTP request.", labels=("route",)
+)
+query_duration = Histogram("db_query_duration_seconds", "Time spent on a single database statement.")
+pool_acquire_duration = Histogram("db_pool_acquire_seconds", "Time spent waiting for a database connection.")
+pool_acquire_timeouts = Counter(
+    "db_pool_acquire_timeouts_total", "Connection requests that gave up after the acquire timeout."
+)
+
+
+class RequestStats:
+    __slots__ = ("queries", "seconds")
+
+    def __init__(self) -> None:
+        self.queries = 0
+        self.seconds = 0.0
+
+
+current_request: ContextVar[RequestStats | None] = ContextVar("current_request", default=None)
+
+
+class ManagedPool:
+    """Wraps the backend's connection pool to time every acquire and bound it by ``acquire_timeout``.
+
+    Connections that were first handed out more than ``max_lifetime`` seconds ago are closed instead
+    of reused, and asyncpg opens a replacement on a later acquire. SQLite opens a connection per
+    acquire, so there the lifetime never comes into play.
+    """
+
+    def __init__(self, wrapped: Any, acquire_timeout: float | None, max_lifetime: float | None) -> None:
+        self.wrapped = wrapped
+        self.acquire_timeout = acquire_timeout
+        self.max_lifetime = max_lifetime
+        self.waiting = 0
+        self._first_used: dict[int, float] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.wrapped, name)
+
+    async def acquire(self) -> Any:
+        self.waiting += 1
+        started = time.perf_counter()
+        try:
+            return await asyncio.wait_for(self.__acquire_fresh(), self.acquire_timeout)
+        except asyncio.TimeoutError:
+            pool_acquire_timeouts.inc()
+            raise PoolTimeoutError from None
+        finally:
+            self.waiting -= 1
+            pool_acquire_duration.observe(time.perf_counter() - started)
+
+    async def release(self, connection: Any) -> Any:
+        return await self.wrapped.release(connection)
+
+    async def __acquire_fresh(self) -> Any:
+        while True:
+            connection = await self.wrapped.acquire()
+            if not self.max_lifetime or not hasattr(connection, "get_server_pid"):
+                return connection
+
+            # The server pid identifies the physical connection behind asyncpg's per-acquire proxy.
+            pid = connection.get_server_pid()
+            first_used = self._first_used.setdefault(pid, time.monotonic())
+            if time.monotonic() - first_used < self.max_lifetime:
+                return connection
+            del self._first_used[pid]
+            connection.terminate()
+            await self.wrapped.release(connection)
+
+
+class InstrumentedDatabase(databases.Database):
+    """A ``databases.Database`` that times every statement and charges it to the current request.
+
+    Connection acquires go through a ``ManagedPool``, so waiting for a connection is measured and
+    bounded as well; the remaining ``options`` go to the backend as usual.
+    """
+
+    def __init__(
+        self, url: str, acquire_timeout: float | None = None, max_lifetime: float | None = None, **options: Any
+    ) -> None:
+        super().__init__(url, **options)
+        self.acquire_timeout = acquire_timeout
+        self.max_lifetime = max_lifetime
+
+    async def connect(self) -> None:
+        await super().connect()
+        if not isinstance(self._backend._pool, ManagedPool):
+            self._backend._pool = ManagedPool(self._backend._pool, self.acquire_timeout, self.max_lifetime)
+
+    async def disconnect(self) -> None:
+        # The backends tear down their own pool object.
+        if isinstance(self._backend._pool, ManagedPool):
+            self._backend._pool = self._backend._pool.wrapped
+        await super().disconnect()
+
+    async def execute(self, query: Any, values: dict | None = None) -> Any:
+        with self.__timed():
+            return await super().execute(query, values)
+
+    async def execute_many(self, query: Any, values: list) -> None:
+        with self.__timed():
+            return await super().execute_many(query, values)
+
+    async def fetch_all(self, query: Any, values: dict | None = None) -> list:
+        with self.__timed():
+            return await super().fetch_all(query, values)
+
+    async def fetch_one(self, query: Any, values: dict | None = None) -> Any:
+        with self.__timed():
+            return await super().fetch_one(query, values)
+
+    async def fetch_val(self, query: Any, values: dict | None = None, column: Any = 0) -> Any:
+        with self.__timed():
+            return await super().fetch_val(query, values, column=column)
+
+    async def iterate(self, query: Any, values: dict | None = None) -> AsyncGenerator[Any, None]:
+        # A cursor counts as one statement, timed until it is exhausted.
+        with self.__timed():
+            async for record in super().iterate(query, values):
+                yield record
+
+    def pool_usage(self) -> dict[LabelValues, float]:
+        pool = getattr(self._backend, "_pool", None)
+        if not isinstance(pool, ManagedPool):
+            return {}
+        usage = {("waiting",): pool.waiting}
+        # Only asyncpg keeps a real pool; the SQLite backend opens a connection per acquire.
+        if hasattr(pool.wrapped, "get_idle_size"):
+            size, idle = pool.get_size(), pool.get_idle_size()
+            usage[("in_use",)], usage[("idle",)] = size - idle, idle
+            usage[("min",)], usage[("max",)] = pool.get_min_size(), pool.get_max_size()
+        return usage
+
+    @contextmanager
+    def __timed(self) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            query_duration.observe(elapsed)
+            stats = current_request.get()
+            if stats is not None:
+                stats.queries += 1
+                stats.seconds += elapsed
+
+
+class MetricsMiddleware:
+    """Records latency, in-flight requests and database usage per route.
+
+    Routes are labelled by their path template, so ``/accounts/1`` and ``/accounts/2`` share a series;
+    requests that match no route are grouped under ``unmatched``.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        stats = RequestStats()
+        token = current_request.set(stats)
+        requests_in_flight.inc(method=method)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            requests_in_flight.dec(method=method)
+            current_request.reset(token)
+
+            # The router stores the matched route in the scope it was given, which is this one.
+            route = scope.get("route")
+            path = route.path if route is not None else "unmatched"
+            request_duration.observe(elapsed, method=method, route=path, status=status_code)
+            request_queries.observe(stats.queries, route=path)
+            request_db_duration.observe(stats.seconds, route=path)
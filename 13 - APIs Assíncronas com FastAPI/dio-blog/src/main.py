@@ -1,18 +1,24 @@
+import time
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
-from src.controllers import auth, post
+from src.controllers import auth, health, metrics, post
 from src.database import database
-from src.exceptions import NotFoundPostError
+from src.exceptions import NotFoundPostError, PoolTimeoutError
+from src.instrumentation import MetricsMiddleware
+from src.warmup import warmup
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    started = time.perf_counter()
     await database.connect()
+    await warmup.run(app, started)
     yield
+    warmup.ready = False
     await database.disconnect()
 
 
@@ -72,9 +78,12 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(MetricsMiddleware)
 
 app.include_router(auth.router, tags=["auth"])
 app.include_router(post.router, tags=["post"])
+app.include_router(metrics.router)
+app.include_router(health.router)
 
 
 @app.exception_handler(NotFoundPostError)
@@ -83,3 +92,12 @@ async def not_found_post_exception_handler(request: Request, exc: NotFoundPostEr
         status_code=exc.status_code,
         content={"detail": exc.message},
     )
+
+
+@app.exception_handler(PoolTimeoutError)
+async def pool_timeout_exception_handler(request: Request, exc: PoolTimeoutError):
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "No database connection available, try again later."},
+        headers={"Retry-After": "1"},
+    )
@@ -1,4 +1,6 @@
+import hashlib
 import time
+from collections import OrderedDict
 from typing import Annotated
 from uuid import uuid4
 
@@ -7,6 +9,9 @@ from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer
 from pydantic import BaseModel
 
+from src.config import settings
+from src.metrics import Counter
+
 SECRET = "my-secret"
 ALGORITHM = "HS256"
 
@@ -40,14 +45,79 @@ def sign_jwt(user_id: int) -> JWTToken:
     return {"access_token": token}
 
 
+class TokenCache:
+    """Bounded LRU of already verified tokens, keyed by the token digest.
+
+    Entries are dropped once their ``exp`` has passed, so a hit is always a token that would still
+    pass verification.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[bytes, JWTToken] = OrderedDict()
+
+    def get(self, token: str) -> JWTToken | None:
+        if not self.maxsize:
+            return None
+
+        key = hashlib.sha256(token.encode()).digest()
+        entry = self._entries.get(key)
+        if entry is None or entry.access_token.exp < time.time():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def set(self, token: str, value: JWTToken) -> None:
+        if not self.maxsize:
+            return
+
+        key = hashlib.sha256(token.encode()).digest()
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+token_cache = TokenCache(maxsize=settings.jwt_cache_size)
+
+Counter(
+    "jwt_cache_hits_total",
+    "Requests authenticated from the verified-token cache.",
+    collect=lambda: {(): token_cache.hits},
+)
+Counter(
+    "jwt_cache_misses_total",
+    "Requests whose token had to be verified.",
+    collect=lambda: {(): token_cache.misses},
+)
+
+
 async def decode_jwt(token: str) -> JWTToken | None:
+    cached = token_cache.get(token)
+    if cached:
+        return cached
+
     try:
         decoded_token = jwt.decode(token, SECRET, audience="curso-fastapi", algorithms=[ALGORITHM])
         _token = JWTToken.model_validate({"access_token": decoded_token})
-        return _token if _token.access_token.exp >= time.time() else None
     except Exception:
         return None
 
+    if _token.access_token.exp < time.time():
+        return None
+    token_cache.set(token, _token)
+    return _token
+
 
 class JWTBearer(HTTPBearer):
     def __init__(self, auto_error: bool = True):
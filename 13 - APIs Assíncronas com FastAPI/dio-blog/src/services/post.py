@@ -1,15 +1,26 @@
+import sqlalchemy as sa
 from databases.interfaces import Record
 
-from src.database import database
+from src.database import database, supports_returning
 from src.exceptions import NotFoundPostError
 from src.models.post import posts
 from src.schemas.post import PostIn, PostUpdateIn
+from src.statements import precompiled
+
+
+@precompiled("posts.page")
+def posts_page() -> sa.Select:
+    return (
+        posts.select()
+        .where(posts.c.published == sa.bindparam("published"))
+        .limit(sa.bindparam("limit"))
+        .offset(sa.bindparam("skip"))
+    )
 
 
 class PostService:
     async def read_all(self, published: bool, limit: int, skip: int = 0) -> list[Record]:
-        query = posts.select().where(posts.c.published == published).limit(limit).offset(skip)
-        return await database.fetch_all(query)
+        return await database.fetch_all(posts_page(published=published, limit=limit, skip=skip))
 
     async def create(self, post: PostIn) -> int:
         command = posts.insert().values(
@@ -24,25 +35,24 @@ class PostService:
         return await self.__get_by_id(id)
 
     async def update(self, id: int, post: PostUpdateIn) -> Record:
-        total = await self.count(id)
-        if not total:
-            raise NotFoundPostError
-
         data = post.model_dump(exclude_unset=True)
+        if not data:
+            return await self.__get_by_id(id)
+
         command = posts.update().where(posts.c.id == id).values(**data)
-        await database.execute(command)
+        if not supports_returning:
+            await database.execute(command)
+            return await self.__get_by_id(id)
 
-        return await self.__get_by_id(id)
+        result = await database.fetch_one(command.returning(posts))
+        if not result:
+            raise NotFoundPostError
+        return result
 
     async def delete(self, id: int) -> None:
         command = posts.delete().where(posts.c.id == id)
         await database.execute(command)
 
-    async def count(self, id: int) -> int:
-        query = "select count(id) as total from posts where id = :id"
-        result = await database.fetch_one(query, {"id": id})
-        return result.total
-
     async def __get_by_id(self, id: int) -> Record:
         query = posts.select().where(posts.c.id == id)
         post = await database.fetch_one(query)
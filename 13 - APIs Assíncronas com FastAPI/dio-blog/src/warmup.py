@@ -0,0 +1,80 @@
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable
+
+import sqlalchemy as sa
+from fastapi import FastAPI
+
+from src.config import settings
+from src.database import database
+from src.metrics import Gauge
+from src.statements import statements
+
+# uvicorn only configures its own loggers; this one prints next to its startup lines.
+logger = logging.getLogger("uvicorn.error")
+
+
+class Warmup:
+    """Readiness of this process, flipped by ``run`` once startup is done.
+
+    With ``settings.warmup_enabled``, ``run`` first pays the costs that would otherwise land on the first
+    requests after a deploy: opening pool connections, compiling the registered statements and building
+    the OpenAPI schema. Pydantic already builds the model validators when the models are defined, so the
+    schema is the part of the models left for the first request.
+    """
+
+    def __init__(self) -> None:
+        self.ready = False
+        self.seconds: float | None = None
+
+    async def run(self, app: FastAPI, started: float) -> None:
+        """Warms the app up if enabled, then marks it ready and logs the seconds since ``started``."""
+        steps = []
+        if settings.warmup_enabled:
+            steps.append(await self.__timed("connections", self.__prefill_pool()))
+            steps.append(await self.__timed("statements", self.__compile_statements()))
+            steps.append(await self.__timed("schemas", self.__build_schema(app)))
+        self.seconds = time.perf_counter() - started
+        self.ready = True
+        logger.info("Ready in %.3fs%s", self.seconds, "".join(f", {step}" for step in steps))
+
+    async def __timed(self, name: str, step: Awaitable[int]) -> str:
+        started = time.perf_counter()
+        count = await step
+        return f"{count} {name} in {time.perf_counter() - started:.3f}s"
+
+    async def __prefill_pool(self) -> int:
+        # Each task holds its connection until all of them got one, so they are distinct connections.
+        size = min(settings.warmup_pool_size or settings.db_pool_min_size, settings.db_pool_max_size)
+        barrier = asyncio.Barrier(size)
+
+        async def use_connection() -> None:
+            try:
+                async with database.connection() as connection:
+                    await connection.fetch_val(sa.text("SELECT 1"))
+                    await barrier.wait()
+            except asyncio.BrokenBarrierError:
+                pass
+            except BaseException:
+                # Releases the others instead of leaving them waiting for this one.
+                await barrier.abort()
+                raise
+
+        await asyncio.gather(*[use_connection() for _ in range(size)])
+        return size
+
+    async def __compile_statements(self) -> int:
+        return sum(statement.warm() for statement in statements.values())
+
+    async def __build_schema(self, app: FastAPI) -> int:
+        return len(app.openapi()["components"]["schemas"])
+
+
+warmup = Warmup()
+
+Gauge(
+    "app_warmup_seconds",
+    "Seconds from the start of the lifespan until the app reported ready.",
+    collect=lambda: {(): warmup.seconds} if warmup.ready else {},
+)
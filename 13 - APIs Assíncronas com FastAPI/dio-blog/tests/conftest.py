@@ -1,5 +1,6 @@
 import asyncio
 
+import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 
@@ -18,8 +19,11 @@ async def db(request):
 
     def teardown():
         async def _teardown():
+            from src.ratelimit import rate_limit_store
+
             await database.disconnect()
             metadata.drop_all(engine)
+            rate_limit_store.clear()
 
         asyncio.run(_teardown())
 
@@ -43,3 +47,15 @@ async def client(db):
 async def access_token(client: AsyncClient):
     response = await client.post("/auth/login", json={"user_id": 1})
     return response.json()["access_token"]
+
+
+@pytest.fixture
+def round_trips(mocker):
+    """Counts the statements sent to the database from the moment the fixture is requested."""
+    from src.database import database
+
+    spies = [
+        mocker.spy(database, name)
+        for name in ("execute", "execute_many", "fetch_all", "fetch_one", "fetch_val", "iterate")
+    ]
+    return lambda: sum(spy.call_count for spy in spies)
@@ -12,3 +12,39 @@ async def test_login_success(client: AsyncClient):
     # Then
     assert response.status_code == status.HTTP_200_OK
     assert response.json()["access_token"] is not None
+
+
+async def test_authenticated_requests_reuse_verified_token(client: AsyncClient, access_token: str):
+    # Given
+    from src.security import token_cache
+
+    headers = {"Authorization": f"Bearer {access_token}"}
+    params = {"published": "on", "limit": 1}
+    hits, misses = token_cache.hits, token_cache.misses
+
+    # When
+    for _ in range(3):
+        response = await client.get("/posts/", params=params, headers=headers)
+
+    # Then
+    metrics = (await client.get("/metrics")).text
+
+    assert response.status_code == status.HTTP_200_OK
+    assert token_cache.misses == misses + 1
+    assert token_cache.hits == hits + 2
+    assert f"jwt_cache_hits_total {token_cache.hits}" in metrics
+    assert f"jwt_cache_misses_total {token_cache.misses}" in metrics
+
+
+async def test_tampered_token_not_served_from_cache(client: AsyncClient, access_token: str):
+    # Given
+    header, payload, signature = access_token.split(".")
+    tampered = f"{header}.{payload}.{signature[:-2]}AA"
+    params = {"published": "on", "limit": 1}
+
+    # When
+    await client.get("/posts/", params=params, headers={"Authorization": f"Bearer {access_token}"})
+    response = await client.get("/posts/", params=params, headers={"Authorization": f"Bearer {tampered}"})
+
+    # Then
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,51 @@
+import logging
+import time
+
+from databases.core import Connection
+from fastapi import status
+from httpx import AsyncClient
+
+
+async def test_read_readiness_warming_up_fail(client: AsyncClient, mocker):
+    # Given
+    from src.warmup import warmup
+
+    mocker.patch.object(warmup, "ready", False)
+
+    # When
+    response = await client.get("/ready")
+
+    # Then
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.headers["Retry-After"] == "1"
+
+
+async def test_read_readiness_after_warmup_success(client: AsyncClient, mocker, caplog):
+    # Given
+    from src.config import settings
+    from src.main import app
+    from src.services.post import posts_page
+    from src.warmup import warmup
+
+    mocker.patch.object(settings, "warmup_enabled", True)
+    mocker.patch.object(warmup, "ready", False)
+    mocker.patch.object(warmup, "seconds", None)
+    mocker.patch.object(app, "openapi_schema", None)
+    posts_page.clear()
+    connections = mocker.spy(Connection, "fetch_val")
+
+    # When
+    with caplog.at_level(logging.INFO, logger="uvicorn.error"):
+        await warmup.run(app, time.perf_counter())
+    response = await client.get("/ready")
+    metrics = await client.get("/metrics")
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["status"] == "ready"
+    assert connections.call_count == settings.db_pool_min_size
+    assert len(posts_page._statements) == 1
+    assert app.openapi_schema is not None
+    assert f"{settings.db_pool_min_size} connections in" in caplog.text
+    assert "Ready in" in caplog.text
+    assert "app_warmup_seconds " in metrics.text
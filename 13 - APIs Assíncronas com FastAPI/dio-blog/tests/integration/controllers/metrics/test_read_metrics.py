@@ -0,0 +1,50 @@
+from fastapi import status
+from httpx import AsyncClient
+
+
+async def test_read_metrics_success(client: AsyncClient):
+    # When
+    response = await client.get("/metrics")
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["Content-Type"].startswith("text/plain")
+    assert "# TYPE http_request_duration_seconds histogram" in response.text
+
+
+async def test_read_metrics_per_route_success(client: AsyncClient, access_token: str):
+    # Given
+    from src.instrumentation import request_duration, request_queries
+
+    headers = {"Authorization": f"Bearer {access_token}"}
+    route = "/posts/{id}"
+    requests = request_duration.count(method="GET", route=route, status=404)
+    queries = request_queries.sum(route=route)
+
+    # When
+    await client.get("/posts/1", headers=headers)
+    await client.get("/posts/2", headers=headers)
+    response = await client.get("/metrics")
+
+    # Then
+    assert request_duration.count(method="GET", route=route, status=404) == requests + 2
+    assert request_queries.sum(route=route) == queries + 2
+    assert f'http_request_db_queries_count{{route="{route}"}}' in response.text
+    assert 'http_requests_in_flight{method="GET"} 1' in response.text
+
+
+async def test_read_metrics_pool_success(client: AsyncClient, access_token: str):
+    # Given
+    from src.instrumentation import pool_acquire_duration
+
+    headers = {"Authorization": f"Bearer {access_token}"}
+    acquires = pool_acquire_duration.count()
+
+    # When
+    await client.get("/posts/1", headers=headers)
+    response = await client.get("/metrics")
+
+    # Then
+    assert pool_acquire_duration.count() > acquires
+    assert "db_pool_acquire_seconds_count" in response.text
+    assert 'db_pool_connections{state="waiting"} 0' in response.text
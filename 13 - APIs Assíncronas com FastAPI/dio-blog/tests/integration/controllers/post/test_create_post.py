@@ -1,5 +1,6 @@
 from fastapi import status
 from httpx import AsyncClient
+from pydantic import ValidationError
 
 
 async def test_create_post_success(client: AsyncClient, access_token: str):
@@ -41,3 +42,60 @@ async def test_create_post_not_authenticated_fail(client: AsyncClient):
 
     # Then
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+async def test_create_post_round_trips(client: AsyncClient, access_token: str, round_trips):
+    # Given
+    headers = {"Authorization": f"Bearer {access_token}"}
+    data = {"title": "post 1", "content": "some content", "published_at": "2024-04-12T04:33:14.403Z", "published": True}
+
+    # When
+    response = await client.post("/posts/", json=data, headers=headers)
+
+    # Then
+    assert response.status_code == status.HTTP_201_CREATED
+    assert round_trips() == 1
+
+
+async def test_create_post_rate_limited_fail(client: AsyncClient, access_token: str, round_trips, mocker):
+    # Given
+    from src.config import settings
+
+    mocker.patch.object(settings, "rate_limit_enabled", True)
+    mocker.patch.object(settings, "rate_limit_routes", {"POST /posts/": (0.1, 2)})
+    headers = {"Authorization": f"Bearer {access_token}"}
+    other = (await client.post("/auth/login", json={"user_id": 2})).json()["access_token"]
+    data = {"title": "post 9", "content": "some content", "published_at": "2024-04-12T04:33:14.403Z", "published": True}
+
+    # When
+    responses = [await client.post("/posts/", json={**data, "title": f"post {n}"}, headers=headers) for n in range(3)]
+    other_response = await client.post("/posts/", json=data, headers={"Authorization": f"Bearer {other}"})
+    read_response = await client.get("/posts/", params={"published": True, "limit": 10}, headers=headers)
+    metrics = await client.get("/metrics")
+
+    # Then
+    assert [response.status_code for response in responses] == [201, 201, 429]
+    assert responses[2].headers["Retry-After"] == "10"
+    # The refused request never reached the database.
+    assert round_trips() == 4
+    assert other_response.status_code == status.HTTP_201_CREATED
+    assert read_response.status_code == status.HTTP_200_OK
+    assert 'rate_limit_rejections_total{method="POST",route="/posts/"} 1' in metrics.text
+
+
+async def test_create_post_rate_limit_invalid_settings_fail():
+    # Given
+    from src.config import Settings
+
+    invalid = [{"rate_limit_rate": 0}, {"rate_limit_burst": 0}, {"rate_limit_routes": {"POST /posts/": (0, 2)}}]
+
+    # When
+    errors = []
+    for options in invalid:
+        try:
+            Settings(database_url="sqlite:///tests.db", **options)
+        except ValidationError as error:
+            errors.append(error.errors()[0]["loc"])
+
+    # Then
+    assert errors == [("rate_limit_rate",), ("rate_limit_burst",), ("rate_limit_routes",)]
@@ -66,3 +66,22 @@ async def test_read_posts_empty_parameters_fail(client: AsyncClient, access_toke
 
     # Then
     assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_read_posts_compiled_once_success(client: AsyncClient, access_token: str, mocker):
+    # Given
+    from src.services.post import posts_page
+
+    posts_page.clear()
+    build = mocker.spy(posts_page, "build")
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    # When
+    responses = [
+        await client.get("/posts/", params={"published": published, "limit": 10}, headers=headers)
+        for published in ("on", "off", "on")
+    ]
+
+    # Then
+    assert [len(response.json()) for response in responses] == [2, 1, 2]
+    assert build.call_count == 1
@@ -52,3 +52,32 @@ async def test_update_post_not_found_fail(client: AsyncClient, access_token: str
 
     # Then
     assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+async def test_update_post_round_trips(client: AsyncClient, access_token: str, round_trips):
+    # Given
+    headers = {"Authorization": f"Bearer {access_token}"}
+    data = {"title": "update title post 1"}
+
+    # When
+    response = await client.patch("/posts/1", json=data, headers=headers)
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    assert round_trips() == 1
+
+
+async def test_update_post_without_returning_success(client: AsyncClient, access_token: str, mocker):
+    # Given
+    mocker.patch("src.services.post.supports_returning", False)
+    headers = {"Authorization": f"Bearer {access_token}"}
+    data = {"title": "update title post 2"}
+
+    # When
+    response = await client.patch("/posts/2", json=data, headers=headers)
+    not_found = await client.patch("/posts/4", json=data, headers=headers)
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["title"] == data["title"]
+    assert not_found.status_code == status.HTTP_404_NOT_FOUND